@@ -16,7 +16,7 @@ import requests
 from byceps.events.base import _BaseEvent
 from byceps.services.webhooks import webhook_service
 from byceps.services.webhooks.models import AnnouncementRequest, OutgoingWebhook
-from byceps.util.jobqueue import enqueue, enqueue_at
+from byceps.util.jobqueue import enqueue_at, enqueue_many
 
 from .connections import get_signals, registry
 
@@ -39,8 +39,11 @@ def _receive_signal(sender, *, event: _BaseEvent | None = None) -> None:
 
     event_name = get_name_for_event(event)
     webhooks = _get_webhooks(event_name)
-    for webhook in webhooks:
-        enqueue(_handle_event, event, webhook)
+    if not webhooks:
+        return None
+
+    # Enqueue jobs for all webhooks in a single round trip.
+    enqueue_many(_handle_event, [(event, webhook) for webhook in webhooks])
 
 
 def get_event_names() -> set[str]:
@@ -56,7 +59,7 @@ def get_name_for_event(event: _BaseEvent) -> str:
 
 
 def _get_webhooks(event_name: str) -> list[OutgoingWebhook]:
-    webhooks = webhook_service.get_enabled_outgoing_webhooks(event_name)
+    webhooks = webhook_service.get_enabled_outgoing_webhooks_cached(event_name)
 
     # Stable order is easier to test.
     webhooks.sort(key=lambda wh: wh.extra_fields.get('channel', ''))
@@ -7,6 +7,7 @@ byceps.application
 """
 
 from collections.abc import Iterator
+from datetime import timedelta
 import os
 from pathlib import Path
 from typing import Any
@@ -100,10 +101,11 @@ def create_cli_app() -> Flask:
     return _create_app(config_overrides=config_overrides)
 
 
-def create_metrics_app(database_uri: str) -> Flask:
+def create_metrics_app(database_uri: str, cache_ttl: timedelta) -> Flask:
     app = Flask(__name__)
 
     app.config['SQLALCHEMY_DATABASE_URI'] = database_uri
+    app.config['METRICS_CACHE_TTL'] = cache_ttl
 
     db.init_app(app)
 
@@ -216,6 +218,7 @@ def _get_config_from_environment() -> Iterator[tuple[str, Any]]:
         'MAIL_SUPPRESS_SEND',
         'MAIL_USE_SSL',
         'MAIL_USERNAME',
+        'METRICS_CACHE_TTL',
         'METRICS_ENABLED',
         'PROPAGATE_EXCEPTIONS',
         'REDIS_URL',
@@ -270,7 +273,10 @@ def _dispatch_apps_by_url_path(
         app.config['METRICS_ENABLED'] and app.byceps_app_mode.is_admin()
     )
     if metrics_enabled:
-        metrics_app = create_metrics_app(app.config['SQLALCHEMY_DATABASE_URI'])
+        metrics_app = create_metrics_app(
+            app.config['SQLALCHEMY_DATABASE_URI'],
+            timedelta(seconds=app.config['METRICS_CACHE_TTL']),
+        )
         mounts['/metrics'] = metrics_app
     app.byceps_feature_states['metrics'] = metrics_enabled
 
@@ -437,6 +437,7 @@ def item_view_version_preview(version_id):
 
     item = dataclasses.replace(
         item,
+        version_id=version.id,
         title=version.title,
         body=version.body,
         body_format=version.body_format,
@@ -6,10 +6,11 @@ byceps.blueprints.admin.newsletter.views
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Iterator
 from dataclasses import dataclass
-from operator import attrgetter
+import json
 
-from flask import abort
+from flask import abort, Response, stream_with_context
 from flask_babel import gettext
 
 from byceps.services.brand import brand_service
@@ -22,13 +23,9 @@ from byceps.services.newsletter.models import List, ListID
 from byceps.services.user import user_stats_service
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.flash import flash_success
+from byceps.util.export import join_in_chunks
 from byceps.util.framework.templating import templated
-from byceps.util.views import (
-    jsonified,
-    permission_required,
-    redirect_to,
-    textified,
-)
+from byceps.util.views import permission_required, redirect_to, textified
 
 
 blueprint = create_blueprint('newsletter_admin', __name__)
@@ -109,18 +106,34 @@ def view_subscriptions(list_id):
 
 @blueprint.get('/lists/<list_id>/subscriptions/export')
 @permission_required('newsletter.export_subscribers')
-@jsonified
 def export_subscribers(list_id):
     """Export the screen names and email addresses of enabled users
     which are currently subscribed to that list as JSON.
+
+    The document is streamed while the subscribers are being fetched.
     """
     list_ = _get_list_or_404(list_id)
 
     subscribers = newsletter_service.get_subscribers(list_.id)
 
-    exports = list(map(assemble_subscriber_export, subscribers))
+    exports = map(assemble_subscriber_export, subscribers)
+
+    data = join_in_chunks(_serialize_subscriber_exports_to_json(exports))
+
+    return Response(stream_with_context(data), mimetype='application/json')
+
 
-    return {'subscribers': exports}
+def _serialize_subscriber_exports_to_json(
+    exports: Iterator[dict[str, str | None]],
+) -> Iterator[str]:
+    yield '{"subscribers": ['
+
+    for index, export in enumerate(exports):
+        if index > 0:
+            yield ', '
+        yield json.dumps(export)
+
+    yield ']}'
 
 
 def assemble_subscriber_export(subscriber):
@@ -140,8 +153,13 @@ def export_subscriber_email_addresses(list_id):
     list_ = _get_list_or_404(list_id)
 
     subscribers = newsletter_service.get_subscribers(list_.id)
-    email_addresses = map(attrgetter('email_address'), subscribers)
-    return '\n'.join(email_addresses)
+    email_addresses = (subscriber.email_address for subscriber in subscribers)
+    return _separate_by_line_breaks(email_addresses)
+
+
+def _separate_by_line_breaks(strings: Iterator[str]) -> Iterator[str]:
+    for index, string in enumerate(strings):
+        yield string if (index == 0) else ('\n' + string)
 
 
 def _get_brand_or_404(brand_id: BrandID) -> Brand:
@@ -7,7 +7,13 @@ byceps.blueprints.admin.shop.order.forms
 """
 
 from flask_babel import lazy_gettext
-from wtforms import BooleanField, RadioField, StringField, TextAreaField
+from wtforms import (
+    BooleanField,
+    FileField,
+    RadioField,
+    StringField,
+    TextAreaField,
+)
 from wtforms.validators import InputRequired, Length
 
 from byceps.services.shop.order import order_service
@@ -52,6 +58,12 @@ class MarkAsPaidForm(LocalizedForm):
         self.payment_method.choices = choices
 
 
+class MarkAsPaidInBulkForm(MarkAsPaidForm):
+    payments_file = FileField(
+        lazy_gettext('Payments (CSV file)'), validators=[InputRequired()]
+    )
+
+
 class OrderNumberSequenceCreateForm(LocalizedForm):
     prefix = StringField(
         lazy_gettext('Static prefix'), validators=[InputRequired()]
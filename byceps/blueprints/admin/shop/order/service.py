@@ -7,21 +7,29 @@ byceps.blueprints.admin.shop.order.service
 """
 
 from collections.abc import Iterable, Iterator
+import csv
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
 from uuid import UUID
 
+from moneyed import Currency, Money
+
 from byceps.services.shop.cancellation_request import (
     cancellation_request_service,
 )
 from byceps.services.shop.order import order_log_service, order_service
+from byceps.services.shop.order.models.bulk_payment import IncomingPayment
 from byceps.services.shop.order.models.log import (
     OrderLogEntry,
     OrderLogEntryData,
 )
+from byceps.services.shop.order.models.number import OrderNumber
 from byceps.services.shop.order.models.order import OrderID
 from byceps.services.ticketing import ticket_category_service
 from byceps.services.user import user_service
 from byceps.services.user.models.user import User
 from byceps.services.user_badge import user_badge_service
+from byceps.util.result import Err, Ok, Result
 
 
 def get_enriched_log_entry_data_for_order(
@@ -230,3 +238,98 @@ def _get_additional_data_for_ticket_revoked(
         data['initiator'] = users_by_id[initiator_id]
 
     return data
+
+
+# -------------------------------------------------------------------- #
+# bulk payments
+
+
+_PAYMENT_DATE_FORMATS = ['%Y-%m-%d', '%d.%m.%Y']
+
+
+def parse_incoming_payments(
+    text: str, currency: Currency
+) -> Result[list[IncomingPayment], str]:
+    """Parse payments from CSV data.
+
+    Each line has to contain an order number, an amount, and a date,
+    separated by comma, semicolon, or tab.
+    """
+    lines = [line for line in text.splitlines() if line.strip()]
+    if not lines:
+        return Err('No payments given.')
+
+    # Prefer separators that cannot be mistaken for a decimal comma.
+    delimiter = next(
+        (char for char in ';\t' if char in lines[0]),
+        ',',
+    )
+
+    payments = []
+
+    rows = csv.reader(text.splitlines(), delimiter=delimiter)
+    for line_number, row in enumerate(rows, start=1):
+        if not any(field.strip() for field in row):
+            continue
+
+        parse_result = _parse_incoming_payment(row, currency)
+        if parse_result.is_err():
+            return Err(f'Line {line_number}: {parse_result.unwrap_err()}')
+
+        payments.append(parse_result.unwrap())
+
+    return Ok(payments)
+
+
+def _parse_incoming_payment(
+    row: list[str], currency: Currency
+) -> Result[IncomingPayment, str]:
+    if len(row) != 3:
+        return Err('Expected order number, amount, and date.')
+
+    order_number_str, amount_str, date_str = (field.strip() for field in row)
+
+    if not order_number_str:
+        return Err('Order number is missing.')
+
+    amount = _parse_amount(amount_str)
+    if amount is None:
+        return Err(f'Invalid amount "{amount_str}".')
+
+    paid_on = _parse_date(date_str)
+    if paid_on is None:
+        return Err(f'Invalid date "{date_str}".')
+
+    return Ok(
+        IncomingPayment(
+            order_number=OrderNumber(order_number_str),
+            amount=Money(amount, currency),
+            paid_on=paid_on,
+        )
+    )
+
+
+def _parse_amount(value: str) -> Decimal | None:
+    if ('.' not in value) and (value.count(',') == 1):
+        # decimal comma
+        value = value.replace(',', '.')
+
+    try:
+        amount = Decimal(value)
+    except InvalidOperation:
+        return None
+
+    if not amount.is_finite():
+        return None
+
+    return amount
+
+
+def _parse_date(value: str) -> date | None:
+    for date_format in _PAYMENT_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            pass
+
+    return None
@@ -9,8 +9,10 @@ byceps.blueprints.admin.shop.order.views
 from flask import abort, g, request, Response
 from flask_babel import gettext
 
+from byceps.database import KeysetCountMode
 from byceps.services.brand import brand_service
 from byceps.services.shop.order import (
+    order_bulk_payment_service,
     order_log_service,
     order_sequence_service,
     order_service,
@@ -21,6 +23,7 @@ from byceps.services.shop.order.errors import (
     OrderAlreadyMarkedAsPaidError,
 )
 from byceps.services.shop.order.export import order_export_service
+from byceps.services.shop.order.models.bulk_payment import BulkPaymentStatus
 from byceps.services.shop.order.models.order import PaymentState
 from byceps.services.shop.shop import shop_service
 from byceps.services.ticketing import ticket_service
@@ -39,6 +42,7 @@ from .forms import (
     AddNoteForm,
     CancelForm,
     MarkAsPaidForm,
+    MarkAsPaidInBulkForm,
     OrderNumberSequenceCreateForm,
 )
 from .models import OrderStateFilter
@@ -47,17 +51,18 @@ from .models import OrderStateFilter
 blueprint = create_blueprint('shop_order_admin', __name__)
 
 
-@blueprint.get('/for_shop/<shop_id>', defaults={'page': 1})
-@blueprint.get('/for_shop/<shop_id>/pages/<int:page>')
+@blueprint.get('/for_shop/<shop_id>')
 @permission_required('shop_order.view')
 @templated
-def index_for_shop(shop_id, page):
+def index_for_shop(shop_id):
     """List orders for that shop."""
     shop = _get_shop_or_404(shop_id)
 
     brand = brand_service.get_brand(shop.brand_id)
 
     per_page = request.args.get('per_page', type=int, default=15)
+    after = request.args.get('after')
+    before = request.args.get('before')
 
     search_term = request.args.get('search_term', default='').strip()
 
@@ -81,12 +86,14 @@ def index_for_shop(shop_id, page):
 
     orders = order_service.get_orders_for_shop_paginated(
         shop.id,
-        page,
         per_page,
+        after=after,
+        before=before,
         search_term=search_term,
         only_payment_state=only_payment_state,
         only_overdue=only_overdue,
         only_processed=only_processed,
+        count_mode=KeysetCountMode.estimate,
     )
 
     return {
@@ -121,6 +128,11 @@ def view(order_id):
 
     tickets = ticket_service.get_tickets_created_by_order(order.order_number)
 
+    fulfillment_state, fulfillment_error = order_service.get_fulfillment_state(
+        order.id
+    )
+    is_fulfillment_retryable = order_service.is_fulfillment_retryable(order.id)
+
     return {
         'shop': shop,
         'brand': brand,
@@ -129,6 +141,9 @@ def view(order_id):
         'PaymentState': PaymentState,
         'tickets': tickets,
         'render_order_payment_method': _find_order_payment_method_label,
+        'fulfillment_state': fulfillment_state,
+        'fulfillment_error': fulfillment_error,
+        'is_fulfillment_retryable': is_fulfillment_retryable,
     }
 
 
@@ -392,6 +407,114 @@ def mark_as_paid(order_id):
     return redirect_to('.view', order_id=paid_order.id)
 
 
+@blueprint.get('/for_shop/<shop_id>/mark_as_paid')
+@permission_required('shop_order.mark_as_paid')
+@templated
+def mark_as_paid_in_bulk_form(shop_id, erroneous_form=None):
+    """Show form to mark orders as paid, based on a list of payments."""
+    shop = _get_shop_or_404(shop_id)
+
+    brand = brand_service.get_brand(shop.brand_id)
+
+    form = erroneous_form if erroneous_form else MarkAsPaidInBulkForm()
+    form.set_payment_method_choices()
+
+    return {
+        'shop': shop,
+        'brand': brand,
+        'form': form,
+    }
+
+
+@blueprint.post('/for_shop/<shop_id>/mark_as_paid')
+@permission_required('shop_order.mark_as_paid')
+@templated
+def mark_as_paid_in_bulk(shop_id):
+    """Set the payment state of the orders to 'paid' for which payments
+    have been received.
+    """
+    shop = _get_shop_or_404(shop_id)
+
+    # Make `InputRequired` work on `FileField`.
+    form_fields = request.form.copy()
+    if request.files:
+        form_fields.update(request.files)
+
+    form = MarkAsPaidInBulkForm(form_fields)
+    form.set_payment_method_choices()
+    if not form.validate():
+        return mark_as_paid_in_bulk_form(shop.id, form)
+
+    payment_method = form.payment_method.data
+    payments_file = request.files.get('payments_file')
+    initiator = g.user
+
+    if not payments_file or not payments_file.filename:
+        abort(400, 'No file to upload has been specified.')
+
+    text = payments_file.read().decode('utf-8-sig', errors='replace')
+    parse_result = service.parse_incoming_payments(text, shop.currency)
+    if parse_result.is_err():
+        flash_error(parse_result.unwrap_err())
+        return mark_as_paid_in_bulk_form(shop.id, form)
+
+    payments = parse_result.unwrap()
+
+    results = order_bulk_payment_service.mark_orders_as_paid(
+        shop.id, payments, payment_method, initiator
+    )
+
+    paid_orders = order_service.get_orders(
+        frozenset(result.order_id for result in results if result.is_paid)
+    )
+    order_email_service.send_email_for_paid_orders_to_orderers(paid_orders)
+
+    for result in results:
+        if result.is_paid:
+            shop_signals.order_paid.send(None, event=result.event)
+
+    flash_success(
+        gettext(
+            '%(paid_count)s of %(total_count)s orders marked as paid.',
+            paid_count=len(paid_orders),
+            total_count=len(results),
+        )
+    )
+
+    return {
+        'shop': shop,
+        'brand': brand_service.get_brand(shop.brand_id),
+        'results': results,
+        'BulkPaymentStatus': BulkPaymentStatus,
+    }
+
+
+# -------------------------------------------------------------------- #
+# fulfillment
+
+
+@blueprint.post('/<uuid:order_id>/fulfillment/retry')
+@permission_required('shop_order.mark_as_paid')
+@respond_no_content
+def retry_fulfillment(order_id):
+    """Retry the failed or interrupted fulfillment of the order."""
+    order = _get_order_or_404(order_id)
+    initiator = g.user
+
+    result = order_service.retry_order_fulfillment(order.id, initiator)
+
+    if result.is_err():
+        flash_error(result.unwrap_err())
+        return
+
+    flash_success(
+        gettext(
+            'Fulfillment of order %(order_number)s has been restarted.',
+            order_number=order.order_number,
+        )
+    )
+
+
 # -------------------------------------------------------------------- #
 # email
 
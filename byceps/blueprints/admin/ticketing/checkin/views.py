@@ -26,7 +26,7 @@ from byceps.services.ticketing import (
 from byceps.services.ticketing.dbmodels.ticket import DbTicket
 from byceps.services.ticketing.models.ticket import TicketID
 from byceps.services.user import user_service
-from byceps.services.user.models.user import User
+from byceps.services.user.models.user import User, UserForAdmin
 from byceps.signals import ticketing as ticketing_signals
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.framework.flash import flash_error, flash_notice, flash_success
@@ -101,30 +101,18 @@ def _search_orders(
     if shop is None:
         return []
 
-    page = 1
-    per_page = limit
-
     orders_pagination = order_service.get_orders_for_shop_paginated(
-        shop.id, page, per_page, search_term=search_term
+        shop.id, limit, search_term=search_term
     )
 
     return orders_pagination.items
 
 
-def _search_users(search_term: str, limit: int) -> list[User]:
-    page = 1
-    per_page = limit
-
-    users_pagination = user_service.get_users_paginated(
-        page, per_page, search_term=search_term
-    )
+def _search_users(search_term: str, limit: int) -> list[UserForAdmin]:
+    users = user_service.search_users(search_term, limit)
 
     # Exclude deleted users.
-    users_pagination.items = [
-        user for user in users_pagination.items if not user.deleted
-    ]
-
-    return users_pagination.items
+    return [user for user in users if not user.deleted]
 
 
 def _get_tickets_for_users(
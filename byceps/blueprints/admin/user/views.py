@@ -11,6 +11,7 @@ from datetime import datetime
 from flask import abort, g, request
 from flask_babel import gettext
 
+from byceps.database import KeysetCountMode
 from byceps.services.authn.password import authn_password_service
 from byceps.services.authn.session import authn_session_service
 from byceps.services.authz import authz_service
@@ -59,23 +60,26 @@ from .forms import (
 blueprint = create_blueprint('user_admin', __name__)
 
 
-@blueprint.get('/', defaults={'page': 1})
-@blueprint.get('/pages/<int:page>')
+@blueprint.get('/')
 @permission_required('user.view')
 @templated
-def index(page):
+def index():
     """List users."""
     per_page = request.args.get('per_page', type=int, default=20)
+    after = request.args.get('after')
+    before = request.args.get('before')
     search_term = request.args.get('search_term', default='').strip()
     only = request.args.get('only')
 
     user_filter = UserFilter.__members__.get(only, UserFilter.none)
 
     users = user_service.get_users_paginated(
-        page,
         per_page,
+        after=after,
+        before=before,
         search_term=search_term,
         user_filter=user_filter,
+        count_mode=KeysetCountMode.estimate,
     )
 
     user_ids = {user.id for user in users.items}
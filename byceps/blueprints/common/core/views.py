@@ -11,6 +11,7 @@ from typing import Any
 
 from flask import current_app, g, render_template
 
+from byceps.services.user.user_avatar_service import get_avatar_srcset
 from byceps.util.authz import (
     has_current_user_any_permission,
     has_current_user_permission,
@@ -22,6 +23,9 @@ from byceps.util.navigation import Navigation
 blueprint = create_blueprint('core_common', __name__)
 
 
+blueprint.add_app_template_global(get_avatar_srcset)
+
+
 @blueprint.app_errorhandler(403)
 def forbidden(error) -> tuple[str, int]:
     return render_template('error/forbidden.html'), 403
@@ -8,7 +8,7 @@ Metrics export for `Prometheus <https://prometheus.io/>`_
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from flask import Response
+from flask import current_app, Response
 
 from byceps.services.metrics import metrics_service
 from byceps.util.framework.blueprint import create_blueprint
@@ -20,7 +20,8 @@ blueprint = create_blueprint('metrics', __name__)
 @blueprint.get('/')
 def metrics():
     """Return metrics."""
-    metrics = metrics_service.collect_metrics()
+    cache_ttl = current_app.config['METRICS_CACHE_TTL']
+    metrics = metrics_service.get_metrics(cache_ttl)
     lines = list(metrics_service.serialize(metrics))
 
     return Response(lines, status=200, mimetype='text/plain; version=0.0.4')
@@ -74,14 +74,22 @@ def add_unseen_postings_flag_to_categories(
     """Add flag to each category stating if it contains postings unseen
     by the user.
     """
+    categories = list(categories)
+
+    if user.authenticated:
+        category_ids_with_unseen_postings = (
+            board_last_view_service.get_categories_with_unseen_postings(
+                categories, user.id
+            )
+        )
+    else:
+        category_ids_with_unseen_postings = set()
+
     categories_with_flag = []
 
     for category in categories:
         contains_unseen_postings = (
-            user.authenticated
-            and board_last_view_service.contains_category_unseen_postings(
-                category, user.id
-            )
+            category.id in category_ids_with_unseen_postings
         )
 
         category_with_flag = (
@@ -110,12 +118,20 @@ def add_topic_unseen_flag(
     db_topics: Iterable[DbTopic], user: CurrentUser
 ) -> None:
     """Add `unseen` flag to topics."""
+    db_topics = list(db_topics)
+
+    if user.authenticated:
+        topic_ids_with_unseen_postings = (
+            board_last_view_service.get_topics_with_unseen_postings(
+                db_topics, user.id
+            )
+        )
+    else:
+        topic_ids_with_unseen_postings = set()
+
     for db_topic in db_topics:
         db_topic.contains_unseen_postings = (
-            user.authenticated
-            and board_last_view_service.contains_topic_unseen_postings(
-                db_topic, user.id
-            )
+            db_topic.id in topic_ids_with_unseen_postings
         )
 
 
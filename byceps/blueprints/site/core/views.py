@@ -40,7 +40,7 @@ def url_for_site_file(filename, **kwargs) -> str | None:
 @blueprint.before_app_request
 def prepare_request_globals() -> None:
     site_id = current_app.config['SITE_ID']
-    site = site_service.get_site(site_id)
+    site = site_service.get_site_cached(site_id)
     g.site = site
     g.site_id = site.id
     sentry_sdk.set_tag('site_id', g.site_id)
@@ -51,7 +51,7 @@ def prepare_request_globals() -> None:
     party = None
     party_id = site.party_id
     if party_id is not None:
-        party = party_service.get_party(party_id)
+        party = party_service.get_party_cached(party_id)
         party_id = party.id
     g.party = party
     g.party_id = party_id
@@ -8,6 +8,9 @@ byceps.blueprints.site.homepage.views
 
 from flask import g
 
+from byceps.blueprints.site.site.response_cache import (
+    cached_for_anonymous_visitors,
+)
 from byceps.services.news import news_item_service
 from byceps.services.news.models import NewsTeaser
 from byceps.util.framework.blueprint import create_blueprint
@@ -18,6 +21,7 @@ blueprint = create_blueprint('homepage', __name__)
 
 
 @blueprint.get('')
+@cached_for_anonymous_visitors
 @templated
 def index():
     """Show homepage."""
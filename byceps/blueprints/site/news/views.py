@@ -9,6 +9,9 @@ byceps.blueprints.site.news.views
 from flask import abort, g
 
 from byceps.blueprints.site.site.navigation import subnavigation_for_view
+from byceps.blueprints.site.site.response_cache import (
+    cached_for_anonymous_visitors,
+)
 from byceps.services.news import news_item_service
 from byceps.services.news.models import NewsChannelID, RenderedNewsItem
 from byceps.services.site import site_service, site_setting_service
@@ -27,6 +30,7 @@ DEFAULT_HEADLINES_PER_PAGE = 25
 
 @blueprint.get('/', defaults={'page': 1})
 @blueprint.get('/pages/<int:page>')
+@cached_for_anonymous_visitors
 @templated
 @subnavigation_for_view('news')
 def index(page):
@@ -8,6 +8,9 @@ byceps.blueprints.site.page.views
 
 from flask import abort, g
 
+from byceps.blueprints.site.site.response_cache import (
+    cached_for_anonymous_visitors,
+)
 from byceps.services.page import page_service
 from byceps.util.framework.blueprint import create_blueprint
 from byceps.util.l10n import get_default_locale, get_locale_str
@@ -21,6 +24,7 @@ blueprint.add_app_template_global(url_for_page)
 
 
 @blueprint.get('/<path:url_path>')
+@cached_for_anonymous_visitors
 def view(url_path):
     """Show the current version of the page that is mounted for the
     current site at the given URL path.
@@ -13,7 +13,10 @@ from moneyed import Currency
 from byceps.blueprints.site.site.navigation import subnavigation_for_view
 from byceps.services.country import country_service
 from byceps.services.shop.article import article_domain_service, article_service
-from byceps.services.shop.article.errors import NoArticlesAvailableError
+from byceps.services.shop.article.errors import (
+    ArticlesSoldOutError,
+    NoArticlesAvailableError,
+)
 from byceps.services.shop.article.models import ArticleCompilation
 from byceps.services.shop.cart.models import Cart
 from byceps.services.shop.order import order_checkout_service, order_service
@@ -55,7 +58,9 @@ def order_form(erroneous_form=None):
         return {'article_compilation': None}
 
     article_compilation_result = (
-        article_service.get_article_compilation_for_orderable_articles(shop.id)
+        article_service.get_article_compilation_for_orderable_articles_cached(
+            shop.id
+        )
     )
 
     match article_compilation_result:
@@ -143,7 +148,7 @@ def order():
 
     placement_result = _place_order(storefront, orderer, cart)
     if placement_result.is_err():
-        flash_error(gettext('Placing the order has failed.'))
+        _flash_order_placement_error(placement_result.unwrap_err())
         return order_form(form)
 
     order = placement_result.unwrap()
@@ -260,7 +265,7 @@ def order_single(article_id):
 
     placement_result = _place_order(storefront, orderer, cart)
     if placement_result.is_err():
-        flash_error(gettext('Placing the order has failed.'))
+        _flash_order_placement_error(placement_result.unwrap_err())
         return order_form(form)
 
     order = placement_result.unwrap()
@@ -299,12 +304,14 @@ def _create_cart_from_article_compilation(
     return cart
 
 
-def _place_order(storefront, orderer, cart) -> Result[Order, None]:
+def _place_order(
+    storefront, orderer, cart
+) -> Result[Order, ArticlesSoldOutError | None]:
     placement_result = order_checkout_service.place_order(
         storefront, orderer, cart
     )
     if placement_result.is_err():
-        return Err(None)
+        return Err(placement_result.unwrap_err())
 
     order, event = placement_result.unwrap()
 
@@ -315,6 +322,18 @@ def _place_order(storefront, orderer, cart) -> Result[Order, None]:
     return Ok(order)
 
 
+def _flash_order_placement_error(error: ArticlesSoldOutError | None) -> None:
+    if isinstance(error, ArticlesSoldOutError):
+        flash_error(
+            gettext(
+                'Some of the selected articles are not available in the '
+                'requested quantity anymore.'
+            )
+        )
+    else:
+        flash_error(gettext('Placing the order has failed.'))
+
+
 def _flash_order_success(order):
     flash_success(
         gettext(
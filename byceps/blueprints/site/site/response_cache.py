@@ -0,0 +1,91 @@
+"""
+byceps.blueprints.site.site.response_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Serve pages to anonymous visitors from a cache, if enabled.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import timedelta
+from functools import wraps
+
+from flask import current_app, g, make_response, request, Response, session
+
+from byceps.services.site import site_response_cache_service
+from byceps.services.site.site_response_cache_service import CachedResponse
+from byceps.util.l10n import get_default_locale, get_locale_str
+
+
+def cached_for_anonymous_visitors(func):
+    """Decorator to serve the view's response to anonymous visitors
+    from the cache, and to cache it if it is not.
+
+    Responses carry an ETag so that browsers can revalidate them
+    cheaply.
+
+    Responses are cached per path. The decorated views must not depend
+    on query arguments. Requests with query arguments are not served
+    from the cache so that arbitrary ones cannot fill it up.
+
+    Has no effect unless `PAGE_CACHE_ENABLED` is configured.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _is_request_cacheable():
+            return func(*args, **kwargs)
+
+        locale = get_locale_str() or get_default_locale()
+        cache_key = site_response_cache_service.get_cache_key(
+            g.site, locale, request.path
+        )
+
+        cached = site_response_cache_service.find_response(cache_key)
+        if cached is None:
+            response = make_response(func(*args, **kwargs))
+
+            if not _is_response_cacheable(response):
+                return response
+
+            ttl = timedelta(seconds=current_app.config['PAGE_CACHE_TTL'])
+            body = response.get_data(as_text=True)
+            cached = site_response_cache_service.store_response(
+                cache_key, body, response.mimetype, ttl
+            )
+
+        return _build_response(cached)
+
+    return wrapper
+
+
+def _is_request_cacheable() -> bool:
+    return (
+        current_app.config['PAGE_CACHE_ENABLED']
+        and request.method in {'GET', 'HEAD'}
+        and not request.args
+        and not g.user.authenticated
+        # Pending flash messages would be rendered into the page.
+        and '_flashes' not in session
+    )
+
+
+def _is_response_cacheable(response: Response) -> bool:
+    return (
+        response.status_code == 200
+        and not response.is_streamed
+        and not session.modified
+    )
+
+
+def _build_response(cached: CachedResponse) -> Response:
+    response = Response(cached.body, mimetype=cached.mimetype)
+
+    response.set_etag(cached.etag)
+    # Make browsers revalidate, as the page looks different after
+    # logging in.
+    response.cache_control.no_cache = True
+    response.vary.update(['Accept-Language', 'Cookie'])
+
+    return response.make_conditional(request)
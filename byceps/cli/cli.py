@@ -11,6 +11,7 @@ Command-line interface
 import click
 from flask.cli import AppGroup
 
+from .commands.aggregate_board import aggregate_board
 from .commands.create_database_tables import create_database_tables
 from .commands.create_demo_data import create_demo_data
 from .commands.create_superuser import create_superuser
@@ -21,6 +22,10 @@ from .commands.import_seats import import_seats
 from .commands.import_users import import_users
 from .commands.initialize_database import initialize_database
 from .commands.shell import shell
+from .commands.show_cache_stats import show_cache_stats
+from .commands.update_newsletter_subscriber_eligibilities import (
+    update_newsletter_subscriber_eligibilities,
+)
 
 
 @click.group(cls=AppGroup)
@@ -29,6 +34,7 @@ def cli():
 
 
 for func in [
+    aggregate_board,
     create_database_tables,
     create_demo_data,
     create_superuser,
@@ -39,5 +45,7 @@ for func in [
     import_users,
     initialize_database,
     shell,
+    show_cache_stats,
+    update_newsletter_subscriber_eligibilities,
 ]:
     cli.add_command(func)
@@ -0,0 +1,29 @@
+"""
+byceps.cli.command.aggregate_board
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Recalculate the topic and posting counters of a board from scratch.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+from flask.cli import with_appcontext
+
+from byceps.services.board import board_aggregation_service, board_service
+from byceps.services.board.models import BoardID
+
+
+@click.command()
+@click.argument('board_id')
+@with_appcontext
+def aggregate_board(board_id) -> None:
+    """Recalculate the topic and posting counters of a board."""
+    board = board_service.find_board(BoardID(board_id))
+    if board is None:
+        raise click.BadParameter(f'Unknown board ID "{board_id}"')
+
+    click.echo(f'Aggregating board "{board.id}" ... ', nl=False)
+    board_aggregation_service.aggregate_board(board.id)
+    click.secho('done.', fg='green')
@@ -0,0 +1,29 @@
+"""
+byceps.cli.command.show_cache_stats
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Show hits and misses of caches, summed up over all processes.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+from flask.cli import with_appcontext
+
+from byceps.util import cache
+
+
+@click.command()
+@click.argument('cache_names', metavar='CACHE_NAME', nargs=-1, required=True)
+@with_appcontext
+def show_cache_stats(cache_names) -> None:
+    """Show hits and misses of caches (e.g. "site", "party")."""
+    for cache_name in cache_names:
+        hits, misses = cache.get_shared_stats(cache_name)
+        lookups = hits + misses
+        hit_ratio = (hits / lookups) if lookups else 0.0
+        click.echo(
+            f'{cache_name}: {hits:d} hits, {misses:d} misses '
+            f'(hit ratio: {hit_ratio:.1%})'
+        )
@@ -0,0 +1,24 @@
+"""
+byceps.cli.command.update_newsletter_subscriber_eligibilities
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Recalculate which newsletter subscriptions count, based on the
+current state of the user accounts.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import click
+from flask.cli import with_appcontext
+
+from byceps.services.newsletter import newsletter_command_service
+
+
+@click.command()
+@with_appcontext
+def update_newsletter_subscriber_eligibilities() -> None:
+    """Recalculate which newsletter subscriptions count."""
+    click.echo('Updating newsletter subscriber eligibilities ... ', nl=False)
+    newsletter_command_service.update_all_subscriber_eligibilities()
+    click.secho('done.', fg='green')
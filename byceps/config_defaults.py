@@ -24,6 +24,11 @@ JOBS_ASYNC = True
 
 # metrics
 METRICS_ENABLED = False
+METRICS_CACHE_TTL = 10  # seconds
+
+# page cache for anonymous visitors (site mode)
+PAGE_CACHE_ENABLED = False
+PAGE_CACHE_TTL = 300  # seconds
 
 # RQ dashboard (for job queue)
 RQ_DASHBOARD_POLL_INTERVAL = 2500
@@ -49,3 +54,4 @@ MAX_CONTENT_LENGTH = 4000000
 
 # shop
 SHOP_ORDER_EXPORT_TIMEZONE = 'Europe/Berlin'
+SHOP_ORDER_NUMBER_BLOCK_SIZE = 1
@@ -8,14 +8,33 @@ Database utilities.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Callable, Iterable
+from __future__ import annotations
+
+import base64
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+import json
 from typing import Any, TypeVar
+from uuid import UUID
 
 from flask_sqlalchemy import SQLAlchemy
 from flask_sqlalchemy.pagination import Pagination
+from sqlalchemy import (
+    DDL,
+    event,
+    func,
+    Index,
+    literal,
+    literal_column,
+    select,
+    tuple_,
+)
 from sqlalchemy.dialects.postgresql import insert, JSONB
-from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.sql import Select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import DeclarativeBase, InstrumentedAttribute
+from sqlalchemy.sql import ColumnElement, Select
 from sqlalchemy.sql.dml import Insert
 from sqlalchemy.sql.schema import Table
 
@@ -54,6 +73,271 @@ def paginate(
     return pagination
 
 
+def stream(stmt: Select, *, batch_size: int = 1000) -> Iterator[Row]:
+    """Yield the rows selected by the statement.
+
+    They are fetched in batches through a server-side cursor instead of
+    all at once, so only one batch is held in memory at a time.
+    """
+    result = db.session.execute(
+        stmt.execution_options(yield_per=batch_size)
+    ).tuples()
+
+    try:
+        yield from result
+    finally:
+        result.close()
+
+
+# -------------------------------------------------------------------- #
+# keyset pagination
+
+
+KeysetCountMode = Enum('KeysetCountMode', ['none', 'exact', 'estimate'])
+
+
+@dataclass(kw_only=True)
+class KeysetPagination:
+    """A page of items selected relative to a cursor (i.e. the key of
+    an item on an adjacent page) instead of an offset.
+    """
+
+    items: list[Any]
+    per_page: int
+    next_cursor: str | None
+    prev_cursor: str | None
+    total: int | None
+    total_is_estimate: bool
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    @property
+    def has_prev(self) -> bool:
+        return self.prev_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+
+def paginate_by_keyset(
+    stmt: Select,
+    key_columns: Sequence[InstrumentedAttribute],
+    per_page: int,
+    *,
+    after: str | None = None,
+    before: str | None = None,
+    count_mode: KeysetCountMode = KeysetCountMode.none,
+    item_mapper: Mapper | None = None,
+) -> KeysetPagination:
+    """Return `per_page` items, ordered by the key columns in descending
+    order, that come after (or, alternatively, before) the item the
+    cursor refers to.
+
+    Unlike with `paginate`, the cost of selecting a page does not grow
+    with its distance to the first page, given an index on the key
+    columns. Those must identify an item uniquely (e.g. creation date
+    plus ID) and be attributes of the selected entity.
+
+    As counting all items is expensive on large tables, the total is
+    only determined if requested, and can be estimated by the query
+    planner instead of counted.
+    """
+    total = _count_for_keyset_pagination(stmt, count_mode)
+
+    key = tuple_(*key_columns)
+    after_values = _decode_cursor(after, len(key_columns)) if after else None
+    before_values = _decode_cursor(before, len(key_columns)) if before else None
+
+    if before_values is not None:
+        # Walk backwards, then restore the regular order.
+        page_stmt = stmt.filter(key > tuple_(*before_values)).order_by(
+            *[column.asc() for column in key_columns]
+        )
+    else:
+        page_stmt = stmt.order_by(*[column.desc() for column in key_columns])
+        if after_values is not None:
+            page_stmt = page_stmt.filter(key < tuple_(*after_values))
+
+    # Select an additional item to learn if there is another page.
+    rows = list(
+        db.session.scalars(page_stmt.limit(per_page + 1)).unique().all()
+    )
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    if before_values is not None:
+        rows.reverse()
+        has_next = True
+        has_prev = has_more
+    else:
+        has_next = has_more
+        has_prev = after_values is not None
+
+    def build_cursor(row) -> str:
+        return _encode_cursor(
+            [getattr(row, column.key) for column in key_columns]
+        )
+
+    next_cursor = build_cursor(rows[-1]) if (has_next and rows) else None
+    prev_cursor = build_cursor(rows[0]) if (has_prev and rows) else None
+
+    items = [item_mapper(row) for row in rows] if item_mapper else rows
+
+    return KeysetPagination(
+        items=items,
+        per_page=per_page,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+        total=total,
+        total_is_estimate=(count_mode == KeysetCountMode.estimate),
+    )
+
+
+def _count_for_keyset_pagination(
+    stmt: Select, count_mode: KeysetCountMode
+) -> int | None:
+    match count_mode:
+        case KeysetCountMode.exact:
+            return db.session.execute(
+                select(func.count()).select_from(stmt.order_by(None).subquery())
+            ).scalar_one()
+        case KeysetCountMode.estimate:
+            return estimate_count(stmt)
+        case _:
+            return None
+
+
+def estimate_count(stmt: Select) -> int:
+    """Return the number of rows the query planner expects the statement
+    to return.
+
+    This avoids scanning all matching rows, but depends on up-to-date
+    table statistics.
+    """
+    rows_stmt = select(literal_column('1')).select_from(
+        stmt.order_by(None).subquery()
+    )
+
+    compiled = rows_stmt.compile(
+        dialect=db.session.get_bind().dialect,
+        compile_kwargs={'render_postcompile': True},
+    )
+
+    plan = (
+        db.session.connection()
+        .exec_driver_sql(f'EXPLAIN (FORMAT JSON) {compiled}', compiled.params)
+        .scalar_one()
+    )
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _encode_cursor(values: Sequence[Any]) -> str:
+    data = json.dumps([_encode_cursor_value(value) for value in values])
+    return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii')
+
+
+def _encode_cursor_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {'datetime': value.isoformat()}
+
+    if isinstance(value, UUID):
+        return {'uuid': str(value)}
+
+    return value
+
+
+def _decode_cursor(cursor: str, value_count: int) -> list[Any] | None:
+    """Return the values the cursor contains, or `None` if it is
+    invalid (including if it does not contain exactly the expected
+    number of values).
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor.encode('ascii'))
+        values = json.loads(data)
+        if not isinstance(values, list) or len(values) != value_count:
+            return None
+        return [_decode_cursor_value(value) for value in values]
+    except (ValueError, TypeError):
+        return None
+
+
+def _decode_cursor_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if 'datetime' in value:
+            return datetime.fromisoformat(value['datetime'])
+
+        if 'uuid' in value:
+            return UUID(value['uuid'])
+
+        raise ValueError('Unknown cursor value type')
+
+    return value
+
+
+# -------------------------------------------------------------------- #
+# trigram search
+
+
+# Trigram indexes require the `pg_trgm` extension, which is included
+# with PostgreSQL (and trusted, so the database owner may enable it).
+event.listen(
+    db.metadata,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm'),
+)
+
+
+def trigram_index(name: str, column_name: str) -> Index:
+    """Return a GIN trigram index on that column.
+
+    Such an index supports substring matches (`LIKE`/`ILIKE` with
+    leading and trailing wildcards) as well as similarity ranking.
+    """
+    return Index(
+        name,
+        column_name,
+        postgresql_using='gin',
+        postgresql_ops={column_name: 'gin_trgm_ops'},
+    )
+
+
+def rank_by_similarity(
+    terms: Sequence[str], *columns: ColumnElement[Any]
+) -> ColumnElement[float]:
+    """Return an expression to rank rows by how well the columns match
+    the search terms.
+
+    Per term, the best match among the columns counts; a column value
+    containing the term scores higher than one merely resembling it.
+    """
+    scores = [
+        func.coalesce(
+            func.greatest(
+                *[func.word_similarity(term, column) for column in columns]
+            ),
+            0,
+        )
+        for term in terms
+    ]
+
+    if not scores:
+        return literal(0)
+
+    rank = scores[0]
+    for score in scores[1:]:
+        rank = rank + score
+
+    return rank
+
+
+# -------------------------------------------------------------------- #
+
+
 def insert_ignore_on_conflict(table: Table, values: dict[str, Any]) -> None:
     """Insert the record identified by the primary key (specified as
     part of the values), or do nothing on conflict.
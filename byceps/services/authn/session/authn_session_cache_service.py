@@ -0,0 +1,142 @@
+"""
+byceps.services.authn.session.authn_session_cache_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Cache the components of the current user (user, session token
+validity, permissions) so that resolving an authenticated user does
+not require any database queries on a warm cache.
+
+Entries are shared between processes via Redis and fronted by a
+process-local LRU cache. They are keyed by user ID, a hash of the
+session token, and two version counters: one per user and a global one.
+Bumping a counter invalidates all entries keyed by its previous value.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+from hashlib import sha256
+from uuid import UUID
+
+from byceps.services.user.models.user import User, UserID
+from byceps.util import cache
+from byceps.util.cache import LocalCache
+
+
+CACHE_TTL = timedelta(minutes=10)
+
+_GLOBAL_VERSION_NAME = 'authn:current-user'
+
+
+@dataclass(frozen=True)
+class CachedCurrentUser:
+    user: User
+    permissions: frozenset[str]
+
+
+_local_cache: LocalCache[str, CachedCurrentUser] = LocalCache(
+    'authn-current-user', maxsize=4096, ttl=CACHE_TTL
+)
+
+
+def get_cache_key(user_id: UserID, auth_token: str) -> str:
+    """Return the key under which the current user components for that
+    user and session token are cached.
+
+    Obtain the key *before* loading the components to cache from the
+    database so that concurrent invalidation is not missed.
+    """
+    global_version, user_version = cache.get_versions(
+        [_GLOBAL_VERSION_NAME, _get_user_version_name(user_id)]
+    )
+
+    token_hash = sha256(auth_token.encode('utf-8')).hexdigest()
+
+    return (
+        f'authn:current-user:{user_id}:{token_hash}'
+        f':{global_version}:{user_version}'
+    )
+
+
+def find_current_user(cache_key: str) -> CachedCurrentUser | None:
+    """Return the cached current user components, if available."""
+    cached = _local_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    data = cache.get_json(cache_key)
+    if data is None:
+        return None
+
+    cached = _deserialize(data)
+    _local_cache.set(cache_key, cached)
+    return cached
+
+
+def store_current_user(
+    cache_key: str, user: User, permissions: frozenset[str]
+) -> None:
+    """Cache the current user components."""
+    cached = CachedCurrentUser(user=user, permissions=permissions)
+
+    cache.set_json(cache_key, _serialize(cached), CACHE_TTL)
+    _local_cache.set(cache_key, cached)
+
+
+def invalidate_user(user_id: UserID) -> None:
+    """Invalidate all cached entries for the user.
+
+    Call this after changing the user's account, session token, or
+    role assignments.
+    """
+    cache.bump_version(_get_user_version_name(user_id))
+
+
+def invalidate_all() -> None:
+    """Invalidate all cached entries for all users.
+
+    Call this after changes that potentially affect many users, e.g.
+    permissions assigned to a role.
+    """
+    cache.bump_version(_GLOBAL_VERSION_NAME)
+
+
+def _get_user_version_name(user_id: UserID) -> str:
+    return f'{_GLOBAL_VERSION_NAME}:{user_id}'
+
+
+def _serialize(cached: CachedCurrentUser) -> dict[str, object]:
+    user = cached.user
+
+    return {
+        'user': {
+            'id': str(user.id),
+            'screen_name': user.screen_name,
+            'initialized': user.initialized,
+            'suspended': user.suspended,
+            'deleted': user.deleted,
+            'locale': user.locale,
+            'avatar_url': user.avatar_url,
+        },
+        'permissions': sorted(cached.permissions),
+    }
+
+
+def _deserialize(data: dict) -> CachedCurrentUser:
+    user_data = data['user']
+
+    user = User(
+        id=UserID(UUID(user_data['id'])),
+        screen_name=user_data['screen_name'],
+        initialized=user_data['initialized'],
+        suspended=user_data['suspended'],
+        deleted=user_data['deleted'],
+        locale=user_data['locale'],
+        avatar_url=user_data['avatar_url'],
+    )
+
+    return CachedCurrentUser(
+        user=user, permissions=frozenset(data['permissions'])
+    )
@@ -17,6 +17,7 @@ from byceps.events.authz import (
     RoleAssignedToUserEvent,
     RoleDeassignedFromUserEvent,
 )
+from byceps.services.authn.session import authn_session_cache_service
 from byceps.services.user import user_log_service, user_service
 from byceps.services.user.models.log import UserLogEntry
 from byceps.services.user.models.user import User, UserID
@@ -50,6 +51,8 @@ def delete_role(role_id: RoleID) -> None:
     db.session.execute(delete(DbRole).where(DbRole.id == role_id))
     db.session.commit()
 
+    authn_session_cache_service.invalidate_all()
+
 
 def find_role(role_id: RoleID) -> Role | None:
     """Return the role with that id, or `None` if not found."""
@@ -94,6 +97,8 @@ def assign_permission_to_role(
     db.session.add(db_role_permission)
     db.session.commit()
 
+    authn_session_cache_service.invalidate_all()
+
 
 def deassign_permission_from_role(
     permission_id: PermissionID, role_id: RoleID
@@ -109,6 +114,8 @@ def deassign_permission_from_role(
     db.session.delete(db_role_permission)
     db.session.commit()
 
+    authn_session_cache_service.invalidate_all()
+
     return Ok(None)
 
 
@@ -126,6 +133,8 @@ def assign_role_to_user(
 
     _persist_role_assignment_to_user(role_id, user, log_entry)
 
+    authn_session_cache_service.invalidate_user(user.id)
+
     return event
 
 
@@ -156,6 +165,8 @@ def deassign_role_from_user(
 
     _persist_role_deassignment_from_user(db_user_role, log_entry)
 
+    authn_session_cache_service.invalidate_user(user.id)
+
     return Ok(event)
 
 
@@ -178,6 +189,7 @@ def deassign_all_roles_from_user(
 
     if commit:
         db.session.commit()
+        authn_session_cache_service.invalidate_user(user.id)
 
 
 def _is_role_assigned_to_user(role_id: RoleID, user_id: UserID) -> bool:
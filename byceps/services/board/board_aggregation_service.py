@@ -2,6 +2,11 @@
 byceps.services.board.board_aggregation_service
 ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
+Maintain the count and latest posting fields of topics and categories.
+
+Commands adjust these fields incrementally, in the same transaction as
+the change itself. Full re-aggregation is only meant to repair them.
+
 :Copyright: 2014-2024 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
@@ -9,7 +14,8 @@ byceps.services.board.board_aggregation_service
 from dataclasses import dataclass
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import or_, select, update
+from sqlalchemy.sql.selectable import ScalarSelect
 
 from byceps.database import db
 from byceps.services.user.models.user import UserID
@@ -17,7 +23,7 @@ from byceps.services.user.models.user import UserID
 from .dbmodels.category import DbBoardCategory
 from .dbmodels.posting import DbPosting
 from .dbmodels.topic import DbTopic
-from .models import BoardCategoryID, TopicID
+from .models import BoardCategoryID, BoardID, TopicID
 
 
 @dataclass(frozen=True)
@@ -26,8 +32,300 @@ class LatestPostingInfo:
     creator_id: UserID
 
 
+# -------------------------------------------------------------------- #
+# incremental updates
+
+
+def add_posting(db_topic: DbTopic, db_posting: DbPosting) -> None:
+    """Count the (created or un-hidden) posting in its topic and, unless
+    the topic is hidden, its category.
+
+    Do not commit.
+    """
+    latest_posting_info = _to_latest_posting_info(db_posting)
+
+    _add_to_topic_posting_count(db_topic.id, 1)
+    _update_topic_latest_posting_if_newer(db_topic.id, latest_posting_info)
+
+    if not db_topic.hidden:
+        _add_to_category_counts(db_topic.category_id, 0, 1)
+        _update_category_latest_posting_if_newer(
+            db_topic.category_id, latest_posting_info
+        )
+
+
+def remove_posting(db_topic: DbTopic, db_posting: DbPosting) -> None:
+    """Stop counting the (hidden) posting in its topic and, unless the
+    topic is hidden, its category.
+
+    The posting's state change has to be flushed to the database before.
+
+    Do not commit.
+    """
+    latest_posting_info = _to_latest_posting_info(db_posting)
+
+    _add_to_topic_posting_count(db_topic.id, -1)
+    if _is_topic_latest_posting(db_topic.id, latest_posting_info):
+        _set_topic_latest_posting(
+            db_topic.id, _get_topic_latest_posting_info(db_topic.id)
+        )
+
+    if not db_topic.hidden:
+        _add_to_category_counts(db_topic.category_id, 0, -1)
+        if _is_category_latest_posting(
+            db_topic.category_id, latest_posting_info
+        ):
+            _set_category_latest_posting(
+                db_topic.category_id,
+                _get_category_latest_posting_info_from_topics(
+                    db_topic.category_id
+                ),
+            )
+
+
+def add_topic(topic_id: TopicID, category_id: BoardCategoryID) -> None:
+    """Count the (created, un-hidden, or moved-in) topic and its
+    postings in the category.
+
+    Do not commit.
+    """
+    topic_posting_count = _get_topic_posting_count_subquery(topic_id)
+    _add_to_category_counts(category_id, 1, topic_posting_count)
+
+    latest_posting_info = _find_topic_latest_posting_info(topic_id)
+    if latest_posting_info is not None:
+        _update_category_latest_posting_if_newer(
+            category_id, latest_posting_info
+        )
+
+
+def remove_topic(topic_id: TopicID, category_id: BoardCategoryID) -> None:
+    """Stop counting the (hidden or moved-out) topic and its postings in
+    the category.
+
+    The topic's state change has to be flushed to the database before.
+
+    Do not commit.
+    """
+    topic_posting_count = _get_topic_posting_count_subquery(topic_id)
+    _add_to_category_counts(category_id, -1, -topic_posting_count)
+
+    latest_posting_info = _find_topic_latest_posting_info(topic_id)
+    if (latest_posting_info is not None) and _is_category_latest_posting(
+        category_id, latest_posting_info
+    ):
+        _set_category_latest_posting(
+            category_id,
+            _get_category_latest_posting_info_from_topics(category_id),
+        )
+
+
+def _to_latest_posting_info(db_posting: DbPosting) -> LatestPostingInfo:
+    return LatestPostingInfo(
+        created_at=db_posting.created_at,
+        creator_id=db_posting.creator_id,
+    )
+
+
+def _get_topic_posting_count_subquery(topic_id: TopicID) -> ScalarSelect[int]:
+    return (
+        select(DbTopic.posting_count)
+        .filter(DbTopic.id == topic_id)
+        .scalar_subquery()
+    )
+
+
+def _add_to_topic_posting_count(topic_id: TopicID, delta: int) -> None:
+    db.session.execute(
+        update(DbTopic)
+        .where(DbTopic.id == topic_id)
+        .values(posting_count=DbTopic.posting_count + delta)
+    )
+
+
+def _update_topic_latest_posting_if_newer(
+    topic_id: TopicID, latest_posting_info: LatestPostingInfo
+) -> None:
+    db.session.execute(
+        update(DbTopic)
+        .where(DbTopic.id == topic_id)
+        .where(
+            or_(
+                DbTopic.last_updated_at == None,  # noqa: E711
+                DbTopic.last_updated_at <= latest_posting_info.created_at,
+            )
+        )
+        .values(
+            last_updated_at=latest_posting_info.created_at,
+            last_updated_by_id=latest_posting_info.creator_id,
+        )
+    )
+
+
+def _set_topic_latest_posting(
+    topic_id: TopicID, latest_posting_info: LatestPostingInfo | None
+) -> None:
+    db.session.execute(
+        update(DbTopic)
+        .where(DbTopic.id == topic_id)
+        .values(
+            last_updated_at=(
+                latest_posting_info.created_at if latest_posting_info else None
+            ),
+            last_updated_by_id=(
+                latest_posting_info.creator_id if latest_posting_info else None
+            ),
+        )
+    )
+
+
+def _is_topic_latest_posting(
+    topic_id: TopicID, latest_posting_info: LatestPostingInfo
+) -> bool:
+    return _find_topic_latest_posting_info(topic_id) == latest_posting_info
+
+
+def _find_topic_latest_posting_info(
+    topic_id: TopicID,
+) -> LatestPostingInfo | None:
+    """Return the topic's latest posting info as currently stored."""
+    row = db.session.execute(
+        select(DbTopic.last_updated_at, DbTopic.last_updated_by_id).filter(
+            DbTopic.id == topic_id
+        )
+    ).one_or_none()
+
+    if (row is None) or (row[0] is None) or (row[1] is None):
+        return None
+
+    return LatestPostingInfo(created_at=row[0], creator_id=row[1])
+
+
+def _add_to_category_counts(
+    category_id: BoardCategoryID,
+    topic_count_delta: int,
+    posting_count_delta: int | ScalarSelect[int],
+) -> None:
+    db.session.execute(
+        update(DbBoardCategory)
+        .where(DbBoardCategory.id == category_id)
+        .values(
+            topic_count=DbBoardCategory.topic_count + topic_count_delta,
+            posting_count=DbBoardCategory.posting_count + posting_count_delta,
+        )
+    )
+
+
+def _update_category_latest_posting_if_newer(
+    category_id: BoardCategoryID, latest_posting_info: LatestPostingInfo
+) -> None:
+    db.session.execute(
+        update(DbBoardCategory)
+        .where(DbBoardCategory.id == category_id)
+        .where(
+            or_(
+                DbBoardCategory.last_posting_updated_at == None,  # noqa: E711
+                DbBoardCategory.last_posting_updated_at
+                <= latest_posting_info.created_at,
+            )
+        )
+        .values(
+            last_posting_updated_at=latest_posting_info.created_at,
+            last_posting_updated_by_id=latest_posting_info.creator_id,
+        )
+    )
+
+
+def _set_category_latest_posting(
+    category_id: BoardCategoryID, latest_posting_info: LatestPostingInfo | None
+) -> None:
+    db.session.execute(
+        update(DbBoardCategory)
+        .where(DbBoardCategory.id == category_id)
+        .values(
+            last_posting_updated_at=(
+                latest_posting_info.created_at if latest_posting_info else None
+            ),
+            last_posting_updated_by_id=(
+                latest_posting_info.creator_id if latest_posting_info else None
+            ),
+        )
+    )
+
+
+def _is_category_latest_posting(
+    category_id: BoardCategoryID, latest_posting_info: LatestPostingInfo
+) -> bool:
+    row = db.session.execute(
+        select(
+            DbBoardCategory.last_posting_updated_at,
+            DbBoardCategory.last_posting_updated_by_id,
+        ).filter(DbBoardCategory.id == category_id)
+    ).one_or_none()
+
+    if row is None:
+        return False
+
+    return (row[0] == latest_posting_info.created_at) and (
+        row[1] == latest_posting_info.creator_id
+    )
+
+
+def _get_category_latest_posting_info_from_topics(
+    category_id: BoardCategoryID,
+) -> LatestPostingInfo | None:
+    """Derive the category's latest posting from its visible topics'
+    latest postings, which avoids scanning the category's postings.
+    """
+    row = db.session.execute(
+        select(DbTopic.last_updated_at, DbTopic.last_updated_by_id)
+        .filter(DbTopic.category_id == category_id)
+        .filter(DbTopic.hidden == False)  # noqa: E712
+        .filter(DbTopic.last_updated_at != None)  # noqa: E711
+        .order_by(DbTopic.last_updated_at.desc())
+        .limit(1)
+    ).one_or_none()
+
+    if row is None:
+        return None
+
+    return LatestPostingInfo(created_at=row[0], creator_id=row[1])
+
+
+# -------------------------------------------------------------------- #
+# full re-aggregation
+
+
+def aggregate_board(board_id: BoardID) -> None:
+    """Recalculate the count and latest fields of all topics and
+    categories of the board from scratch.
+
+    Meant to repair counters, not to be used in regular operation.
+    """
+    db_categories = db.session.scalars(
+        select(DbBoardCategory).filter_by(board_id=board_id)
+    ).all()
+
+    for db_category in db_categories:
+        db_topics = db.session.scalars(
+            select(DbTopic).filter_by(category_id=db_category.id)
+        ).all()
+
+        for db_topic in db_topics:
+            _aggregate_topic(db_topic)
+
+        _aggregate_category(db_category)
+
+    db.session.commit()
+
+
 def aggregate_category(db_category: DbBoardCategory) -> None:
     """Update the category's count and latest fields."""
+    _aggregate_category(db_category)
+    db.session.commit()
+
+
+def _aggregate_category(db_category: DbBoardCategory) -> None:
     topic_count = _get_category_topic_count(db_category.id)
     posting_count = _get_category_posting_count(db_category.id)
     latest_posting_info = _get_category_latest_posting_info(db_category.id)
@@ -41,8 +339,6 @@ def aggregate_category(db_category: DbBoardCategory) -> None:
         latest_posting_info.creator_id if latest_posting_info else None
     )
 
-    db.session.commit()
-
 
 def _get_category_topic_count(category_id: BoardCategoryID) -> int:
     topic_count = db.session.scalar(
@@ -74,6 +370,7 @@ def _get_category_latest_posting_info(
         .filter(DbTopic.category_id == category_id)
         .filter(DbTopic.hidden == False)  # noqa: E712
         .order_by(DbPosting.created_at.desc())
+        .limit(1)
     ).first()
 
     if not db_latest_posting:
@@ -87,6 +384,13 @@ def _get_category_latest_posting_info(
 
 def aggregate_topic(db_topic: DbTopic) -> None:
     """Update the topic's count and latest fields."""
+    _aggregate_topic(db_topic)
+    db.session.commit()
+
+    aggregate_category(db_topic.category)
+
+
+def _aggregate_topic(db_topic: DbTopic) -> None:
     posting_count = _get_topic_posting_count(db_topic.id)
     latest_posting_info = _get_topic_latest_posting_info(db_topic.id)
 
@@ -98,10 +402,6 @@ def aggregate_topic(db_topic: DbTopic) -> None:
         latest_posting_info.creator_id if latest_posting_info else None
     )
 
-    db.session.commit()
-
-    aggregate_category(db_topic.category)
-
 
 def _get_topic_posting_count(topic_id: TopicID) -> int:
     posting_count = db.session.scalar(
@@ -120,6 +420,7 @@ def _get_topic_latest_posting_info(
         .filter_by(topic_id=topic_id)
         .filter_by(hidden=False)
         .order_by(DbPosting.created_at.desc())
+        .limit(1)
     ).first()
 
     if not db_latest_posting:
@@ -0,0 +1,103 @@
+"""
+byceps.services.board.board_last_view_buffer_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Buffer users' views of board topics in Redis so that they can be
+written to the database in batches.
+
+The buffer is a single shared buffer (see `byceps.util.cache`) that
+maps user and topic IDs to the time of the user's latest view of the
+topic.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from byceps.services.user.models.user import UserID
+from byceps.util import cache
+
+from .models import TopicID
+
+
+BUFFER_KEY = 'board-topic-views'
+
+
+@dataclass(frozen=True)
+class BufferedTopicView:
+    user_id: UserID
+    topic_id: TopicID
+    occurred_at: datetime
+
+
+def add_topic_view(
+    user_id: UserID,
+    topic_id: TopicID,
+    occurred_at: datetime,
+    flush_delay: timedelta,
+) -> bool:
+    """Buffer the user's view of the topic.
+
+    Return `True` if a flush has to be scheduled.
+    """
+    return cache.add_to_buffer(
+        BUFFER_KEY,
+        _build_field(user_id, topic_id),
+        occurred_at.isoformat(),
+        flush_delay,
+    )
+
+
+def find_topic_views(
+    user_id: UserID, topic_ids: Iterable[TopicID]
+) -> dict[TopicID, datetime]:
+    """Return the times of the user's buffered views of the topics."""
+    topic_ids = list(topic_ids)
+
+    fields = [_build_field(user_id, topic_id) for topic_id in topic_ids]
+    values = cache.get_buffered_fields(BUFFER_KEY, fields)
+
+    return {
+        topic_id: datetime.fromisoformat(value)
+        for topic_id, value in zip(topic_ids, values, strict=True)
+        if value is not None
+    }
+
+
+def take_topic_views() -> list[BufferedTopicView]:
+    """Remove all views from the buffer and return them."""
+    values_by_field = cache.take_buffer(BUFFER_KEY)
+
+    return [
+        _parse_view(field, value) for field, value in values_by_field.items()
+    ]
+
+
+def restore_topic_views(views: Iterable[BufferedTopicView]) -> None:
+    """Put views back into the buffer, unless newer views of the same
+    topics by the same users have been buffered in the meantime.
+    """
+    values_by_field = {
+        _build_field(view.user_id, view.topic_id): view.occurred_at.isoformat()
+        for view in views
+    }
+
+    cache.restore_to_buffer(BUFFER_KEY, values_by_field)
+
+
+def _build_field(user_id: UserID, topic_id: TopicID) -> str:
+    return f'{user_id}:{topic_id}'
+
+
+def _parse_view(field: str, value: str) -> BufferedTopicView:
+    user_id_str, topic_id_str = field.split(':')
+
+    return BufferedTopicView(
+        user_id=UserID(UUID(user_id_str)),
+        topic_id=TopicID(UUID(topic_id_str)),
+        occurred_at=datetime.fromisoformat(value),
+    )
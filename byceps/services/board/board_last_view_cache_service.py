@@ -0,0 +1,83 @@
+"""
+byceps.services.board.board_last_view_cache_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Cache the times users last viewed board categories and topics.
+
+Per user, one hash for categories and one for topics is stored in
+Redis. They map IDs to the time of the last view, or to an empty string
+if the user has not viewed the category or topic yet.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import Literal, TypeVar
+from uuid import UUID
+
+from byceps.services.user.models.user import UserID
+from byceps.util import cache
+
+
+CACHE_TTL = timedelta(days=1)
+
+
+ID = TypeVar('ID', bound=UUID)
+
+
+Kind = Literal['category', 'topic']
+
+
+_NOT_VIEWED = ''
+
+
+def get_last_views(
+    kind: Kind, user_id: UserID, ids: Iterable[ID]
+) -> tuple[dict[ID, datetime | None], set[ID]]:
+    """Return the cached times the user last viewed the categories or
+    topics (`None` if not viewed yet), and the IDs not cached.
+    """
+    ids = list(ids)
+
+    values = cache.get_hash_fields(
+        _build_cache_key(kind, user_id), [str(id_) for id_ in ids]
+    )
+
+    last_viewed_ats_by_id = {}
+    missing_ids = set()
+
+    for id_, value in zip(ids, values, strict=True):
+        if value is None:
+            missing_ids.add(id_)
+        elif value == _NOT_VIEWED:
+            last_viewed_ats_by_id[id_] = None
+        else:
+            last_viewed_ats_by_id[id_] = datetime.fromisoformat(value)
+
+    return last_viewed_ats_by_id, missing_ids
+
+
+def store_last_views(
+    kind: Kind,
+    user_id: UserID,
+    last_viewed_ats_by_id: dict[ID, datetime | None],
+) -> None:
+    """Cache the times the user last viewed the categories or topics
+    (`None` if not viewed yet).
+    """
+    values = {
+        str(id_): (
+            last_viewed_at.isoformat()
+            if (last_viewed_at is not None)
+            else _NOT_VIEWED
+        )
+        for id_, last_viewed_at in last_viewed_ats_by_id.items()
+    }
+
+    cache.set_hash_fields(_build_cache_key(kind, user_id), values, CACHE_TTL)
+
+
+def _build_cache_key(kind: Kind, user_id: UserID) -> str:
+    return f'board:last-{kind}-views:{user_id}'
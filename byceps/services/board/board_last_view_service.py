@@ -6,20 +6,36 @@ byceps.services.board.board_last_view_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import datetime, timedelta
 
 from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
 
 from byceps.database import db, upsert, upsert_many
 from byceps.services.user.models.user import UserID
-
-from . import board_topic_query_service
+from byceps.util.iterables import chunked
+from byceps.util.jobqueue import enqueue_at
+
+from . import (
+    board_last_view_buffer_service,
+    board_last_view_cache_service,
+    board_topic_query_service,
+)
+from .board_last_view_buffer_service import BufferedTopicView
 from .dbmodels.last_category_view import DbLastCategoryView
 from .dbmodels.last_topic_view import DbLastTopicView
 from .dbmodels.topic import DbTopic
 from .models import BoardCategoryID, BoardCategoryWithLastUpdate, TopicID
 
 
+# Topic views are buffered and written to the database in batches, at
+# most that long after they occurred.
+TOPIC_VIEWS_FLUSH_DELAY = timedelta(seconds=30)
+
+TOPIC_VIEWS_FLUSH_BATCH_SIZE = 1000
+
+
 # -------------------------------------------------------------------- #
 # categories
 
@@ -30,15 +46,74 @@ def contains_category_unseen_postings(
     """Return `True` if the category contains postings created after the
     last time the user viewed it.
     """
-    if category.last_posting_updated_at is None:
-        return False
+    return category.id in get_categories_with_unseen_postings(
+        [category], user_id
+    )
+
+
+def get_categories_with_unseen_postings(
+    categories: Iterable[BoardCategoryWithLastUpdate], user_id: UserID
+) -> set[BoardCategoryID]:
+    """Return the IDs of those categories that contain postings created
+    after the last time the user viewed them.
+    """
+    categories = list(categories)
+
+    last_viewed_ats_by_category_id = get_categories_last_viewed_at(
+        {
+            category.id
+            for category in categories
+            if category.last_posting_updated_at is not None
+        },
+        user_id,
+    )
+
+    return {
+        category.id
+        for category in categories
+        if (category.last_posting_updated_at is not None)
+        and _is_unseen(
+            category.last_posting_updated_at,
+            last_viewed_ats_by_category_id[category.id],
+        )
+    }
+
+
+def get_categories_last_viewed_at(
+    category_ids: set[BoardCategoryID], user_id: UserID
+) -> dict[BoardCategoryID, datetime | None]:
+    """Return the times the categories were last viewed by the user
+    (`None` for those not viewed by the user yet).
+
+    Times not cached are fetched in a single query.
+    """
+    (
+        last_viewed_ats_by_id,
+        missing_ids,
+    ) = board_last_view_cache_service.get_last_views(
+        'category', user_id, category_ids
+    )
 
-    db_last_view = find_last_category_view(user_id, category.id)
+    if missing_ids:
+        rows = db.session.execute(
+            select(
+                DbLastCategoryView.category_id, DbLastCategoryView.occurred_at
+            )
+            .filter(DbLastCategoryView.user_id == user_id)
+            .filter(DbLastCategoryView.category_id.in_(missing_ids))
+        ).all()
+
+        fetched: dict[BoardCategoryID, datetime | None] = dict.fromkeys(
+            missing_ids, None
+        )
+        fetched.update(rows)
 
-    if db_last_view is None:
-        return True
+        board_last_view_cache_service.store_last_views(
+            'category', user_id, fetched
+        )
+        last_viewed_ats_by_id.update(fetched)
 
-    return category.last_posting_updated_at > db_last_view.occurred_at
+    return last_viewed_ats_by_id
 
 
 def find_last_category_view(
@@ -69,6 +144,10 @@ def mark_category_as_just_viewed(
 
     upsert(table, identifier, replacement)
 
+    board_last_view_cache_service.store_last_views(
+        'category', user_id, {category_id: replacement['occurred_at']}
+    )
+
 
 def delete_last_category_views(category_id: BoardCategoryID) -> None:
     """Delete the category's last views."""
@@ -86,8 +165,29 @@ def contains_topic_unseen_postings(db_topic: DbTopic, user_id: UserID) -> bool:
     """Return `True` if the topic contains postings created after the
     last time the user viewed it.
     """
-    last_viewed_at = find_topic_last_viewed_at(db_topic.id, user_id)
-    return last_viewed_at is None or db_topic.last_updated_at > last_viewed_at
+    return db_topic.id in get_topics_with_unseen_postings([db_topic], user_id)
+
+
+def get_topics_with_unseen_postings(
+    db_topics: Iterable[DbTopic], user_id: UserID
+) -> set[TopicID]:
+    """Return the IDs of those topics that contain postings created
+    after the last time the user viewed them.
+    """
+    db_topics = list(db_topics)
+
+    last_viewed_ats_by_topic_id = get_topics_last_viewed_at(
+        {db_topic.id for db_topic in db_topics}, user_id
+    )
+
+    return {
+        db_topic.id
+        for db_topic in db_topics
+        if _is_unseen(
+            db_topic.last_updated_at,
+            last_viewed_ats_by_topic_id[db_topic.id],
+        )
+    }
 
 
 def find_topic_last_viewed_at(
@@ -96,27 +196,73 @@ def find_topic_last_viewed_at(
     """Return the time the topic was last viewed by the user (or
     nothing, if it hasn't been viewed by the user yet).
     """
-    db_last_view = db.session.scalars(
-        select(DbLastTopicView).filter_by(user_id=user_id, topic_id=topic_id)
-    ).first()
+    return get_topics_last_viewed_at({topic_id}, user_id)[topic_id]
+
+
+def get_topics_last_viewed_at(
+    topic_ids: set[TopicID], user_id: UserID
+) -> dict[TopicID, datetime | None]:
+    """Return the times the topics were last viewed by the user (`None`
+    for those not viewed by the user yet).
+
+    Times not cached are fetched in a single query, and merged with
+    views buffered but not yet written to the database.
+    """
+    (
+        last_viewed_ats_by_id,
+        missing_ids,
+    ) = board_last_view_cache_service.get_last_views(
+        'topic', user_id, topic_ids
+    )
+
+    if missing_ids:
+        rows = db.session.execute(
+            select(DbLastTopicView.topic_id, DbLastTopicView.occurred_at)
+            .filter(DbLastTopicView.user_id == user_id)
+            .filter(DbLastTopicView.topic_id.in_(missing_ids))
+        ).all()
+
+        fetched: dict[TopicID, datetime | None] = dict.fromkeys(
+            missing_ids, None
+        )
+        fetched.update(rows)
+
+        buffered = board_last_view_buffer_service.find_topic_views(
+            user_id, missing_ids
+        )
+        for topic_id, buffered_at in buffered.items():
+            stored_at = fetched[topic_id]
+            if (stored_at is None) or (buffered_at > stored_at):
+                fetched[topic_id] = buffered_at
+
+        board_last_view_cache_service.store_last_views(
+            'topic', user_id, fetched
+        )
+        last_viewed_ats_by_id.update(fetched)
 
-    return db_last_view.occurred_at if (db_last_view is not None) else None
+    return last_viewed_ats_by_id
 
 
 def mark_topic_as_just_viewed(topic_id: TopicID, user_id: UserID) -> None:
     """Mark the topic as last viewed by the user (if logged in) at the
     current time.
+
+    The view is buffered, and written to the database later on together
+    with other views.
     """
-    table = DbLastTopicView.__table__
-    identifier = {
-        'user_id': user_id,
-        'topic_id': topic_id,
-    }
-    replacement = {
-        'occurred_at': datetime.utcnow(),
-    }
+    occurred_at = datetime.utcnow()
 
-    upsert(table, identifier, replacement)
+    board_last_view_cache_service.store_last_views(
+        'topic', user_id, {topic_id: occurred_at}
+    )
+
+    flush_to_be_scheduled = board_last_view_buffer_service.add_topic_view(
+        user_id, topic_id, occurred_at, TOPIC_VIEWS_FLUSH_DELAY
+    )
+    if flush_to_be_scheduled:
+        enqueue_at(
+            occurred_at + TOPIC_VIEWS_FLUSH_DELAY, flush_buffered_topic_views
+        )
 
 
 def mark_all_topics_in_category_as_viewed(
@@ -141,8 +287,76 @@ def mark_all_topics_in_category_as_viewed(
 
     upsert_many(table, identifiers, replacement)
 
+    board_last_view_cache_service.store_last_views(
+        'topic', user_id, dict.fromkeys(topic_ids, replacement['occurred_at'])
+    )
+
+
+def flush_buffered_topic_views() -> None:
+    """Write the buffered topic views to the database, in batches.
+
+    Views of topics deleted in the meantime are dropped. Later views
+    already stored in the database are kept.
+    """
+    views = board_last_view_buffer_service.take_topic_views()
+    if not views:
+        return
+
+    try:
+        _upsert_topic_views(views)
+    except Exception:
+        db.session.rollback()
+        board_last_view_buffer_service.restore_topic_views(views)
+        raise
+
+
+def _upsert_topic_views(views: list[BufferedTopicView]) -> None:
+    existing_topic_ids = set(
+        db.session.scalars(
+            select(DbTopic.id).filter(
+                DbTopic.id.in_({view.topic_id for view in views})
+            )
+        ).all()
+    )
+
+    rows = [
+        {
+            'user_id': view.user_id,
+            'topic_id': view.topic_id,
+            'occurred_at': view.occurred_at,
+        }
+        for view in views
+        if view.topic_id in existing_topic_ids
+    ]
+
+    table = DbLastTopicView.__table__
+
+    for batch in chunked(rows, TOPIC_VIEWS_FLUSH_BATCH_SIZE):
+        insert_stmt = insert(table).values(batch)
+        db.session.execute(
+            insert_stmt.on_conflict_do_update(
+                constraint=table.primary_key,
+                set_={
+                    'occurred_at': db.func.greatest(
+                        table.c.occurred_at, insert_stmt.excluded.occurred_at
+                    )
+                },
+            )
+        )
+
+    db.session.commit()
+
 
 def delete_last_topic_views(topic_id: TopicID) -> None:
     """Delete the topic's last views."""
     db.session.execute(delete(DbLastTopicView).filter_by(topic_id=topic_id))
     db.session.commit()
+
+
+# -------------------------------------------------------------------- #
+
+
+def _is_unseen(
+    last_updated_at: datetime, last_viewed_at: datetime | None
+) -> bool:
+    return last_viewed_at is None or last_updated_at > last_viewed_at
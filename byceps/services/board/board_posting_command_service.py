@@ -49,9 +49,11 @@ def create_posting(
 
     db_posting = DbPosting(posting_id, db_topic.id, creator.id, body)
     db.session.add(db_posting)
-    db.session.commit()
+    db.session.flush()
+
+    board_aggregation_service.add_posting(db_topic, db_posting)
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    db.session.commit()
 
     db_category = db_topic.category
     brand = brand_service.get_brand(db_category.board.brand_id)
@@ -111,12 +113,17 @@ def hide_posting(
 
     now = datetime.utcnow()
 
+    was_hidden = db_posting.hidden
+
     db_posting.hidden = True
     db_posting.hidden_at = now
     db_posting.hidden_by_id = moderator.id
-    db.session.commit()
+    db.session.flush()
 
-    board_aggregation_service.aggregate_topic(db_posting.topic)
+    if not was_hidden:
+        board_aggregation_service.remove_posting(db_posting.topic, db_posting)
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_posting.topic.category.board.brand_id)
     posting_creator = _get_user(db_posting.creator_id)
@@ -144,13 +151,18 @@ def unhide_posting(
 
     now = datetime.utcnow()
 
+    was_hidden = db_posting.hidden
+
     # TODO: Store who un-hid the posting.
     db_posting.hidden = False
     db_posting.hidden_at = None
     db_posting.hidden_by_id = None
-    db.session.commit()
+    db.session.flush()
 
-    board_aggregation_service.aggregate_topic(db_posting.topic)
+    if was_hidden:
+        board_aggregation_service.add_posting(db_posting.topic, db_posting)
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_posting.topic.category.board.brand_id)
     posting_creator = _get_user(db_posting.creator_id)
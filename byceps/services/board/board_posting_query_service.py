@@ -14,8 +14,8 @@ from byceps.database import db, paginate, Pagination
 from byceps.services.user import user_service
 from byceps.services.user.dbmodels.user import DbUser
 from byceps.services.user.models.user import UserID
-from byceps.util.iterables import index_of
 
+from .dbmodels.board import DbBoard
 from .dbmodels.category import DbBoardCategory
 from .dbmodels.posting import DbPosting, DbPostingReaction
 from .dbmodels.topic import DbTopic
@@ -35,6 +35,19 @@ def count_postings_for_board(board_id: BoardID) -> int:
     )
 
 
+def count_postings_per_board() -> dict[BoardID, int]:
+    """Return the number of postings for each board."""
+    rows = db.session.execute(
+        select(DbBoard.id, db.func.count(DbPosting.id))
+        .outerjoin(DbBoardCategory, DbBoardCategory.board_id == DbBoard.id)
+        .outerjoin(DbTopic, DbTopic.category_id == DbBoardCategory.id)
+        .outerjoin(DbPosting, DbPosting.topic_id == DbTopic.id)
+        .group_by(DbBoard.id)
+    ).all()
+
+    return dict(rows)
+
+
 def find_db_posting(posting_id: PostingID) -> DbPosting | None:
     """Return the posting with that id, or `None` if not found."""
     return db.session.get(DbPosting, posting_id)
@@ -112,17 +125,22 @@ def calculate_posting_page_number(
     db_posting: DbPosting, include_hidden: bool, postings_per_page: int
 ) -> int:
     """Return the number of the page the posting should appear on."""
-    stmt = select(DbPosting).filter_by(topic_id=db_posting.topic_id)
+    index = _count_postings_before(db_posting, include_hidden)
 
-    if not include_hidden:
-        stmt = stmt.filter_by(hidden=False)
+    return divmod(index, postings_per_page)[0] + 1
 
-    stmt = stmt.order_by(DbPosting.created_at.asc())
 
-    db_topic_postings = db.session.scalars(stmt).all()
+def _count_postings_before(db_posting: DbPosting, include_hidden: bool) -> int:
+    """Return the number of postings in the posting's topic that were
+    created before it, i.e. the posting's index in the topic.
+    """
+    stmt = (
+        select(db.func.count(DbPosting.id))
+        .filter_by(topic_id=db_posting.topic_id)
+        .filter(DbPosting.created_at < db_posting.created_at)
+    )
 
-    index = index_of(db_topic_postings, lambda p: p == db_posting)
-    if index is None:
-        return 1  # Shouldn't happen.
+    if not include_hidden:
+        stmt = stmt.filter_by(hidden=False)
 
-    return divmod(index, postings_per_page)[0] + 1
+    return db.session.scalar(stmt) or 0
@@ -55,9 +55,12 @@ def create_topic(
     db.session.add(db_topic)
     db.session.add(db_posting)
     db.session.add(db_initial_topic_posting_association)
-    db.session.commit()
+    db.session.flush()
+
+    board_aggregation_service.add_topic(db_topic.id, db_topic.category_id)
+    board_aggregation_service.add_posting(db_topic, db_posting)
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    db.session.commit()
 
     db_category = db_topic.category
     brand = brand_service.get_brand(db_category.board.brand_id)
@@ -112,12 +115,19 @@ def hide_topic(topic_id: TopicID, moderator: User) -> BoardTopicHiddenEvent:
 
     now = datetime.utcnow()
 
+    was_hidden = db_topic.hidden
+
     db_topic.hidden = True
     db_topic.hidden_at = now
     db_topic.hidden_by_id = moderator.id
-    db.session.commit()
+    db.session.flush()
+
+    if not was_hidden:
+        board_aggregation_service.remove_topic(
+            db_topic.id, db_topic.category_id
+        )
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    db.session.commit()
 
     brand = brand_service.get_brand(db_topic.category.board.brand_id)
     topic_creator = _get_user(db_topic.creator_id)
@@ -140,13 +150,18 @@ def unhide_topic(topic_id: TopicID, moderator: User) -> BoardTopicUnhiddenEvent:
 
     now = datetime.utcnow()
 
+    was_hidden = db_topic.hidden
+
     # TODO: Store who un-hid the topic.
     db_topic.hidden = False
     db_topic.hidden_at = None
     db_topic.hidden_by_id = None
-    db.session.commit()
+    db.session.flush()
 
-    board_aggregation_service.aggregate_topic(db_topic)
+    if was_hidden:
+        board_aggregation_service.add_topic(db_topic.id, db_topic.category_id)
+
+    db.session.commit()
 
     brand = brand_service.get_brand(db_topic.category.board.brand_id)
     topic_creator = _get_user(db_topic.creator_id)
@@ -281,10 +296,13 @@ def move_topic(
     db_new_category = db.session.get(DbBoardCategory, new_category_id)
 
     db_topic.category = db_new_category
-    db.session.commit()
+    db.session.flush()
+
+    if not db_topic.hidden:
+        board_aggregation_service.remove_topic(db_topic.id, db_old_category.id)
+        board_aggregation_service.add_topic(db_topic.id, db_new_category.id)
 
-    for db_category in db_old_category, db_new_category:
-        board_aggregation_service.aggregate_category(db_category)
+    db.session.commit()
 
     brand = brand_service.get_brand(db_topic.category.board.brand_id)
     topic_creator = _get_user(db_topic.creator_id)
@@ -17,6 +17,7 @@ from byceps.services.user import user_service
 from byceps.services.user.dbmodels.user import DbUser
 from byceps.services.user.models.user import User
 
+from .dbmodels.board import DbBoard
 from .dbmodels.category import DbBoardCategory
 from .dbmodels.posting import DbPosting
 from .dbmodels.topic import DbTopic
@@ -35,6 +36,18 @@ def count_topics_for_board(board_id: BoardID) -> int:
     )
 
 
+def count_topics_per_board() -> dict[BoardID, int]:
+    """Return the number of topics for each board."""
+    rows = db.session.execute(
+        select(DbBoard.id, db.func.count(DbTopic.id))
+        .outerjoin(DbBoardCategory, DbBoardCategory.board_id == DbBoard.id)
+        .outerjoin(DbTopic, DbTopic.category_id == DbBoardCategory.id)
+        .group_by(DbBoard.id)
+    ).all()
+
+    return dict(rows)
+
+
 def find_topic(topic_id: TopicID) -> Topic | None:
     """Return the topic with that id, or `None` if not found."""
     db_topic = find_db_topic(topic_id)
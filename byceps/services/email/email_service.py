@@ -6,28 +6,21 @@ byceps.services.email.email_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from dataclasses import dataclass
+from collections.abc import Sequence
 from email.message import EmailMessage
 from email.utils import parseaddr
-from smtplib import SMTP, SMTP_SSL
 
 from flask import current_app
 
-from byceps.util.jobqueue import enqueue
+from byceps.util.jobqueue import enqueue, enqueue_many
 from byceps.util.result import Err, Ok, Result
 
 from .models import Message, NameAndAddress
+from .smtp import SmtpConfig, SmtpConnectionManager
 
 
-@dataclass(frozen=True)
-class SmtpConfig:
-    host: str
-    port: int
-    starttls: bool
-    use_ssl: bool
-    username: str | None
-    password: str | None
-    suppress_send: bool
+# Reuse the connection for messages sent by the same (worker) process.
+_smtp_connection_manager = SmtpConnectionManager()
 
 
 def parse_address(address_str: str) -> Result[NameAndAddress, str]:
@@ -58,6 +51,22 @@ def enqueue_email(
     enqueue(send_email, sender_str, recipients, subject, body)
 
 
+def enqueue_messages(messages: Sequence[Message]) -> None:
+    """Enqueue e-mails to be sent asynchronously, as a single job that
+    sends all of them over the same connection.
+    """
+    emails = [
+        (
+            message.sender.format(),
+            message.recipients,
+            message.subject,
+            message.body,
+        )
+        for message in messages
+    ]
+    enqueue(send_emails, emails)
+
+
 def send_email(
     sender: str, recipients: list[str], subject: str, body: str
 ) -> None:
@@ -65,6 +74,53 @@ def send_email(
     send(sender, recipients, subject, body)
 
 
+def send_emails(emails: Sequence[tuple[str, list[str], str, str]]) -> None:
+    """Send e-mails, each given as sender, recipients, subject, and body.
+
+    E-mails rejected by the server are logged, but do not fail the job.
+    Otherwise, retrying it would send the other e-mails again.
+
+    E-mails that could not be sent because the server could not be
+    reached are enqueued again, each as a job of its own. Should the
+    server still be unreachable, those jobs fail and can be retried
+    individually.
+    """
+    smtp_config = _load_smtp_config()
+
+    if smtp_config.suppress_send:
+        current_app.logger.debug(
+            'Suppressing sending of %d emails.', len(emails)
+        )
+        return
+
+    emails_and_messages = [(email, _build_message(*email)) for email in emails]
+    messages = [message for _, message in emails_and_messages]
+
+    current_app.logger.debug('Sending %d emails.', len(messages))
+    failures = _smtp_connection_manager.send_messages(smtp_config, messages)
+
+    for message, exc in failures.rejected:
+        current_app.logger.error(
+            'Sending email to %s failed: %s', message['To'], exc
+        )
+
+    if failures.unsent:
+        current_app.logger.warning(
+            'Could not send %d emails, enqueuing them again: %s',
+            len(failures.unsent),
+            failures.connection_error,
+        )
+        unsent_message_ids = {id(message) for message in failures.unsent}
+        enqueue_many(
+            send_email,
+            [
+                tuple(email)
+                for email, message in emails_and_messages
+                if id(message) in unsent_message_ids
+            ],
+        )
+
+
 def send(sender: str, recipients: list[str], subject: str, body: str) -> None:
     """Assemble and send e-mail."""
     smtp_config = _load_smtp_config()
@@ -107,32 +163,10 @@ def _build_message(
 
 def _send_via_smtp(smtp_config: SmtpConfig, message: EmailMessage) -> None:
     """Send email via SMTP."""
-    if smtp_config.use_ssl:
-        _send_via_smtp_with_ssl(smtp_config, message)
-    else:
-        _send_via_smtp_without_ssl(smtp_config, message)
-
-
-def _send_via_smtp_with_ssl(
-    smtp_config: SmtpConfig, message: EmailMessage
-) -> None:
-    """Send email via SMTP with SSL."""
-    with SMTP_SSL(smtp_config.host, smtp_config.port) as smtp:
-        if smtp_config.username and smtp_config.password:
-            smtp.login(smtp_config.username, smtp_config.password)
-
-        smtp.send_message(message)
-
-
-def _send_via_smtp_without_ssl(
-    smtp_config: SmtpConfig, message: EmailMessage
-) -> None:
-    """Send email via SMTP without SSL (but potentially with STARTTLS)."""
-    with SMTP(smtp_config.host, smtp_config.port) as smtp:
-        if smtp_config.starttls:
-            smtp.starttls()
+    failures = _smtp_connection_manager.send_messages(smtp_config, [message])
 
-        if smtp_config.username and smtp_config.password:
-            smtp.login(smtp_config.username, smtp_config.password)
+    if failures.connection_error is not None:
+        raise failures.connection_error
 
-        smtp.send_message(message)
+    for _, exc in failures.rejected:
+        raise exc
@@ -0,0 +1,184 @@
+"""
+byceps.services.email.smtp
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Reuse SMTP connections across messages.
+
+Opening a connection includes a TLS handshake (with SSL or STARTTLS)
+and possibly a login, which easily takes longer than sending a message.
+A connection is thus kept open for the next message (for a limited
+idle time), and reopened if the server has closed it meanwhile.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+from email.message import EmailMessage
+from smtplib import SMTP, SMTP_SSL, SMTPServerDisconnected
+from threading import Lock
+import time
+
+import structlog
+
+
+log = structlog.get_logger()
+
+
+DEFAULT_IDLE_TIMEOUT = timedelta(seconds=30)
+
+
+@dataclass(frozen=True)
+class SmtpConfig:
+    host: str
+    port: int
+    starttls: bool
+    use_ssl: bool
+    username: str | None
+    password: str | None
+    suppress_send: bool
+
+
+@dataclass(frozen=True)
+class SendFailures:
+    # messages rejected by the server, each along with the error
+    rejected: list[tuple[EmailMessage, Exception]]
+    # messages not sent because no connection could be (re)established
+    unsent: list[EmailMessage]
+    connection_error: Exception | None
+
+
+# Errors indicating that the connection is no longer usable, as opposed
+# to the server rejecting a message.
+_CONNECTION_ERRORS = (SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+class SmtpConnectionManager:
+    """Keep a single SMTP connection open for reuse."""
+
+    def __init__(
+        self,
+        *,
+        idle_timeout: timedelta = DEFAULT_IDLE_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._idle_timeout_seconds = idle_timeout.total_seconds()
+        self._clock = clock
+        self._lock = Lock()
+        self._smtp: SMTP | None = None
+        self._config: SmtpConfig | None = None
+        self._last_used_at: float | None = None
+
+    def send_messages(
+        self, config: SmtpConfig, messages: Sequence[EmailMessage]
+    ) -> SendFailures:
+        """Send the messages over the same connection.
+
+        A message being rejected (e.g. because of an invalid recipient
+        address) does not keep the remaining messages from being sent.
+        If the connection is lost and cannot be reestablished, though,
+        the remaining messages are not attempted.
+
+        Return the messages that have not been sent.
+        """
+        rejected: list[tuple[EmailMessage, Exception]] = []
+
+        with self._lock:
+            for index, message in enumerate(messages):
+                try:
+                    self._send_message(config, message)
+                except Exception as exc:
+                    if self._smtp is None:
+                        # No connection, so neither this nor the
+                        # remaining messages can be sent.
+                        return SendFailures(
+                            rejected=rejected,
+                            unsent=list(messages[index:]),
+                            connection_error=exc,
+                        )
+
+                    rejected.append((message, exc))
+
+        return SendFailures(rejected=rejected, unsent=[], connection_error=None)
+
+    def _send_message(self, config: SmtpConfig, message: EmailMessage) -> None:
+        smtp = self._get_connection(config)
+
+        try:
+            smtp.send_message(message)
+        except _CONNECTION_ERRORS:
+            # The server might have closed the idle connection.
+            # Reconnect and try once more.
+            log.info('SMTP connection lost, reconnecting', host=config.host)
+            self._close()
+            smtp = self._get_connection(config)
+            try:
+                smtp.send_message(message)
+            except _CONNECTION_ERRORS:
+                self._close()
+                raise
+
+        self._last_used_at = self._clock()
+
+    def _get_connection(self, config: SmtpConfig) -> SMTP:
+        if (self._smtp is not None) and (
+            (config != self._config) or self._is_idle_for_too_long()
+        ):
+            self._close()
+
+        if self._smtp is None:
+            self._smtp = _connect(config)
+            self._config = config
+            self._last_used_at = self._clock()
+
+        return self._smtp
+
+    def _is_idle_for_too_long(self) -> bool:
+        return (self._last_used_at is not None) and (
+            self._clock() - self._last_used_at >= self._idle_timeout_seconds
+        )
+
+    def close(self) -> None:
+        """Close the connection, if open."""
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        smtp = self._smtp
+        if smtp is None:
+            return
+
+        self._smtp = None
+        self._config = None
+        self._last_used_at = None
+
+        try:
+            smtp.quit()
+        except Exception:
+            # The connection is unusable anyway.
+            smtp.close()
+
+
+def _connect(config: SmtpConfig) -> SMTP:
+    """Open a connection, secure it, and log in, as configured."""
+    smtp: SMTP
+    if config.use_ssl:
+        smtp = SMTP_SSL(config.host, config.port)
+    else:
+        smtp = SMTP(config.host, config.port)
+
+    try:
+        if config.starttls and not config.use_ssl:
+            smtp.starttls()
+
+        if config.username and config.password:
+            smtp.login(config.username, config.password)
+    except Exception:
+        smtp.close()
+        raise
+
+    return smtp
@@ -7,6 +7,7 @@ byceps.services.guest_server.guest_server_export_service
 """
 
 from collections.abc import Iterator
+from itertools import chain
 
 from byceps.services.guest_server.models import Address, Server, Setting
 from byceps.services.user.models.user import User
@@ -24,10 +25,9 @@ def export_addresses_for_netbox(
     # field names as defined by NetBox
     header_row = ('address', 'status', 'dns_name', 'description')
 
-    body_rows = list(_generate_body_rows(servers, setting))
-    body_rows.sort()
+    body_rows = sorted(_generate_body_rows(servers, setting))
 
-    rows = [header_row] + body_rows
+    rows = chain([header_row], body_rows)
 
     return serialize_tuples_to_csv(rows)
 
@@ -6,69 +6,123 @@ byceps.metrics.metrics_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
+from datetime import timedelta
+from functools import partial
+from threading import Lock
+from time import monotonic, perf_counter
 
 from byceps.services.board import (
     board_posting_query_service,
-    board_service,
     board_topic_query_service,
 )
-from byceps.services.brand import brand_service
-from byceps.services.brand.models import BrandID
 from byceps.services.consent import consent_service
 from byceps.services.metrics.models import Label, Metric
 from byceps.services.party import party_service
-from byceps.services.party.models import Party, PartyID
+from byceps.services.party.models import Party
 from byceps.services.seating import seat_service
 from byceps.services.shop.article import article_service as shop_article_service
 from byceps.services.shop.order import order_service
 from byceps.services.shop.shop import shop_service
-from byceps.services.shop.shop.models import Shop, ShopID
+from byceps.services.shop.shop.models import ShopID
 from byceps.services.ticketing import ticket_service
 from byceps.services.user import user_stats_service
 
 
-def serialize(metrics: Iterator[Metric]) -> Iterator[str]:
+def serialize(metrics: Iterable[Metric]) -> Iterator[str]:
     """Serialize metric objects to text lines."""
     for metric in metrics:
         yield metric.serialize() + '\n'
 
 
-def collect_metrics() -> Iterator[Metric]:
-    brand_ids = [brand.id for brand in brand_service.get_all_brands()]
+def get_metrics(cache_ttl: timedelta) -> list[Metric]:
+    """Return the metrics, collected at most once per time-to-live.
+
+    Concurrent calls wait for a collection run already in progress and
+    share its result.
+    """
+    return _result_cache.get(cache_ttl)
 
+
+def collect_metrics() -> Iterator[Metric]:
     active_parties = party_service.get_active_parties()
-    active_party_ids = [p.id for p in active_parties]
 
     active_shops = shop_service.get_active_shops()
     active_shop_ids = {shop.id for shop in active_shops}
 
-    yield from _collect_board_metrics(brand_ids)
-    yield from _collect_consent_metrics()
-    yield from _collect_shop_ordered_article_metrics(active_shop_ids)
-    yield from _collect_shop_order_metrics(active_shops)
-    yield from _collect_seating_metrics(active_party_ids)
-    yield from _collect_ticket_metrics(active_parties)
-    yield from _collect_user_metrics()
+    collectors: list[tuple[str, Callable[[], Iterator[Metric]]]] = [
+        ('board', _collect_board_metrics),
+        ('consent', _collect_consent_metrics),
+        (
+            'shop_ordered_article',
+            partial(_collect_shop_ordered_article_metrics, active_shop_ids),
+        ),
+        ('shop_order', partial(_collect_shop_order_metrics, active_shop_ids)),
+        ('seating', partial(_collect_seating_metrics, active_parties)),
+        ('ticket', partial(_collect_ticket_metrics, active_parties)),
+        ('user', _collect_user_metrics),
+    ]
+
+    durations = []
+    for collector_name, collector in collectors:
+        start = perf_counter()
+        metrics = list(collector())
+        durations.append((collector_name, perf_counter() - start))
+
+        yield from metrics
+
+    for collector_name, duration in durations:
+        yield Metric(
+            'metrics_collector_duration_seconds',
+            round(duration, 6),
+            labels=[Label('collector', collector_name)],
+        )
 
 
-def _collect_board_metrics(brand_ids: list[BrandID]) -> Iterator[Metric]:
-    for brand_id in brand_ids:
-        boards = board_service.get_boards_for_brand(brand_id)
-        board_ids = [board.id for board in boards]
+class _ResultCache:
+    """Keep the result of the latest collection run."""
 
-        for board_id in board_ids:
-            labels = [Label('board', board_id)]
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._collected_at: float | None = None
+        self._metrics: list[Metric] = []
 
-            topic_count = board_topic_query_service.count_topics_for_board(
-                board_id
-            )
-            yield Metric('board_topic_count', topic_count, labels=labels)
+    def get(self, ttl: timedelta) -> list[Metric]:
+        with self._lock:
+            now = monotonic()
 
-            posting_count = (
-                board_posting_query_service.count_postings_for_board(board_id)
-            )
-            yield Metric('board_posting_count', posting_count, labels=labels)
+            if (self._collected_at is None) or (
+                now - self._collected_at >= ttl.total_seconds()
+            ):
+                self._metrics = list(collect_metrics())
+                self._collected_at = monotonic()
+
+            return self._metrics
+
+
+_result_cache = _ResultCache()
+
+
+def _collect_board_metrics() -> Iterator[Metric]:
+    topic_counts_by_board_id = (
+        board_topic_query_service.count_topics_per_board()
+    )
+    for board_id, topic_count in topic_counts_by_board_id.items():
+        yield Metric(
+            'board_topic_count',
+            topic_count,
+            labels=[Label('board', board_id)],
+        )
+
+    posting_counts_by_board_id = (
+        board_posting_query_service.count_postings_per_board()
+    )
+    for board_id, posting_count in posting_counts_by_board_id.items():
+        yield Metric(
+            'board_posting_count',
+            posting_count,
+            labels=[Label('board', board_id)],
+        )
 
 
 def _collect_consent_metrics() -> Iterator[Metric]:
@@ -100,39 +154,43 @@ def _collect_shop_ordered_article_metrics(
         )
 
 
-def _collect_shop_order_metrics(shops: list[Shop]) -> Iterator[Metric]:
+def _collect_shop_order_metrics(shop_ids: set[ShopID]) -> Iterator[Metric]:
     """Provide order counts grouped by payment state for shops."""
-    for shop in shops:
-        order_counts_per_payment_state = (
-            order_service.count_orders_per_payment_state(shop.id)
-        )
+    order_counts_by_shop_id = (
+        order_service.count_orders_per_shop_and_payment_state(shop_ids)
+    )
 
+    for shop_id, order_counts_per_payment_state in sorted(
+        order_counts_by_shop_id.items()
+    ):
         for payment_state, quantity in order_counts_per_payment_state.items():
             yield Metric(
                 'shop_order_quantity',
                 quantity,
                 labels=[
-                    Label('shop', shop.id),
+                    Label('shop', shop_id),
                     Label('payment_state', payment_state.name),
                 ],
             )
 
 
 def _collect_seating_metrics(
-    active_party_ids: list[PartyID],
+    active_parties: list[Party],
 ) -> Iterator[Metric]:
     """Provide seat occupation counts per party and category."""
-    for party_id in active_party_ids:
-        occupied_seat_counts_by_category = (
-            seat_service.count_occupied_seats_by_category(party_id)
-        )
+    party_ids = {party.id for party in active_parties}
+
+    occupied_seat_counts_by_party_id = (
+        seat_service.count_occupied_seats_by_party_and_category(party_ids)
+    )
 
-        for category, count in occupied_seat_counts_by_category:
+    for party in active_parties:
+        for category, count in occupied_seat_counts_by_party_id[party.id]:
             yield Metric(
                 'occupied_seat_count',
                 count,
                 labels=[
-                    Label('party', party_id),
+                    Label('party', party.id),
                     Label('category_title', category.title),
                 ],
             )
@@ -140,29 +198,29 @@ def _collect_seating_metrics(
 
 def _collect_ticket_metrics(active_parties: list[Party]) -> Iterator[Metric]:
     """Provide ticket counts for active parties."""
+    party_ids = {party.id for party in active_parties}
+
+    ticket_counts_by_party_id = ticket_service.count_tickets_for_parties(
+        party_ids
+    )
+
     for party in active_parties:
-        party_id = party.id
-        labels = [Label('party', party_id)]
+        labels = [Label('party', party.id)]
 
         max_ticket_quantity = party.max_ticket_quantity
         if max_ticket_quantity is not None:
             yield Metric('tickets_max', max_ticket_quantity, labels=labels)
 
-        tickets_revoked_count = ticket_service.count_revoked_tickets_for_party(
-            party_id
-        )
+        (
+            tickets_revoked_count,
+            tickets_sold_count,
+            tickets_checked_in_count,
+        ) = ticket_counts_by_party_id[party.id]
+
         yield Metric(
             'tickets_revoked_count', tickets_revoked_count, labels=labels
         )
-
-        tickets_sold_count = ticket_service.count_sold_tickets_for_party(
-            party_id
-        )
         yield Metric('tickets_sold_count', tickets_sold_count, labels=labels)
-
-        tickets_checked_in_count = (
-            ticket_service.count_tickets_checked_in_for_party(party_id)
-        )
         yield Metric(
             'tickets_checked_in_count', tickets_checked_in_count, labels=labels
         )
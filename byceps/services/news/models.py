@@ -84,6 +84,7 @@ class NewsItem:
     slug: str
     published_at: datetime | None
     published: bool
+    version_id: NewsItemVersionID
     title: str
     body: str
     body_format: BodyFormat
@@ -0,0 +1,95 @@
+"""
+byceps.services.news.news_html_cache_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Cache the HTML rendered from news items.
+
+A news item version is immutable once created, so its rendered HTML
+only changes if the item's images change (which is why their data is
+part of the key) or if it is rendered for another locale.
+
+Entries are shared between processes via Redis and fronted by a
+process-local LRU cache.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+from hashlib import sha256
+
+from flask_babel import get_locale
+
+from byceps.util import cache
+from byceps.util.cache import LocalCache
+
+from .models import NewsItem
+
+
+CACHE_TTL = timedelta(days=7)
+
+_LOCAL_CACHE_TTL = timedelta(minutes=30)
+
+
+@dataclass(frozen=True)
+class CachedNewsItemHtml:
+    body_html: str
+    featured_image_html: str | None
+
+
+_local_cache: LocalCache[str, CachedNewsItemHtml] = LocalCache(
+    'news-item-html', maxsize=512, ttl=_LOCAL_CACHE_TTL
+)
+
+
+def get_cache_key(item: NewsItem) -> str:
+    """Return the key under which the HTML rendered from the item's
+    current version, with its current images, in the current locale is
+    cached.
+    """
+    featured_image_id = (
+        item.featured_image.id if item.featured_image is not None else '-'
+    )
+
+    images_hash = sha256(repr(item.images).encode('utf-8')).hexdigest()
+
+    return (
+        f'news:item-html:{item.version_id}:{featured_image_id}'
+        f':{images_hash}:{get_locale()}'
+    )
+
+
+def find_html(cache_key: str) -> CachedNewsItemHtml | None:
+    """Return the cached HTML, if available."""
+    cached = _local_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    data = cache.get_json(cache_key)
+    if data is None:
+        return None
+
+    cached = CachedNewsItemHtml(
+        body_html=data['body_html'],
+        featured_image_html=data['featured_image_html'],
+    )
+    _local_cache.set(cache_key, cached)
+    return cached
+
+
+def store_html(
+    cache_key: str, body_html: str, featured_image_html: str | None
+) -> None:
+    """Cache the HTML."""
+    cached = CachedNewsItemHtml(
+        body_html=body_html, featured_image_html=featured_image_html
+    )
+
+    data = {
+        'body_html': cached.body_html,
+        'featured_image_html': cached.featured_image_html,
+    }
+
+    cache.set_json(cache_key, data, CACHE_TTL)
+    _local_cache.set(cache_key, cached)
@@ -13,6 +13,7 @@ from sqlalchemy import select
 
 from byceps.database import db
 from byceps.services.image import image_service
+from byceps.services.site import site_response_cache_service
 from byceps.services.user.models.user import User
 from byceps.util import upload
 from byceps.util.image.models import Dimensions, ImageType
@@ -76,6 +77,8 @@ def create_image(
     db.session.add(db_image)
     db.session.commit()
 
+    site_response_cache_service.invalidate_news_channel(item.channel.id)
+
     path = (
         current_app.config['PATH_DATA']
         / 'global'
@@ -140,6 +143,10 @@ def update_image(
 
     db.session.commit()
 
+    site_response_cache_service.invalidate_news_channel(
+        db_image.item.channel_id
+    )
+
     return _db_entity_to_image(db_image, db_image.item.channel_id)
 
 
@@ -18,13 +18,18 @@ from byceps.database import db, paginate, Pagination, execute_upsert
 from byceps.events.base import EventUser
 from byceps.events.news import NewsItemPublishedEvent
 from byceps.services.brand.models import BrandID
-from byceps.services.site import site_service
+from byceps.services.site import site_response_cache_service, site_service
 from byceps.services.site.models import SiteID
 from byceps.services.user import user_service
 from byceps.services.user.models.user import User
 from byceps.util.result import Err, Ok, Result
 
-from . import news_channel_service, news_html_service, news_image_service
+from . import (
+    news_channel_service,
+    news_html_cache_service,
+    news_html_service,
+    news_image_service,
+)
 from .dbmodels import (
     DbCurrentNewsItemVersionAssociation,
     DbFeaturedNewsImage,
@@ -112,7 +117,15 @@ def update_item(
 
     db.session.commit()
 
-    return _db_entity_to_item(db_item)
+    site_response_cache_service.invalidate_news_channel(db_item.channel_id)
+
+    item = _db_entity_to_item(db_item)
+
+    # Render the new version right away so that it is cached before the
+    # first page view.
+    render_html(item)
+
+    return item
 
 
 def _create_version(
@@ -136,6 +149,8 @@ def set_featured_image(item_id: NewsItemID, image_id: NewsImageID) -> None:
 
     db.session.commit()
 
+    site_response_cache_service.invalidate_news_channel(db_item.channel_id)
+
 
 def unset_featured_image(item_id: NewsItemID) -> None:
     """Unset a featured image."""
@@ -148,6 +163,8 @@ def unset_featured_image(item_id: NewsItemID) -> None:
     )
     db.session.commit()
 
+    site_response_cache_service.invalidate_news_channel(db_item.channel_id)
+
 
 def publish_item(
     item_id: NewsItemID,
@@ -168,8 +185,14 @@ def publish_item(
     db_item.published_at = publish_at
     db.session.commit()
 
+    site_response_cache_service.invalidate_news_channel(db_item.channel_id)
+
     item = _db_entity_to_item(db_item)
 
+    # Render the item right away so that it is cached before the first
+    # page view.
+    render_html(item)
+
     if item.channel.announcement_site_id is not None:
         site = site_service.get_site(SiteID(item.channel.announcement_site_id))
         external_url = f'https://{site.server_name}/news/{item.slug}'
@@ -203,11 +226,18 @@ def unpublish_item(
     db_item.published_at = None
     db.session.commit()
 
+    site_response_cache_service.invalidate_news_channel(db_item.channel_id)
+
     return Ok(None)
 
 
 def delete_item(item_id: NewsItemID) -> None:
     """Delete a news item and its versions."""
+    db_item = _get_db_item(item_id)
+
+    # Keep value for use after item is deleted.
+    channel_id = db_item.channel_id
+
     db.session.execute(
         delete(DbCurrentNewsItemVersionAssociation).where(
             DbCurrentNewsItemVersionAssociation.item_id == item_id
@@ -219,6 +249,8 @@ def delete_item(item_id: NewsItemID) -> None:
     db.session.execute(delete(DbNewsItem).where(DbNewsItem.id == item_id))
     db.session.commit()
 
+    site_response_cache_service.invalidate_news_channel(channel_id)
+
 
 def find_item(item_id: NewsItemID) -> NewsItem | None:
     """Return the item with that id, or `None` if not found."""
@@ -569,6 +601,7 @@ def _db_entity_to_item(db_item: DbNewsItem) -> NewsItem:
         slug=db_item.slug,
         published_at=db_item.published_at,
         published=db_item.published_at is not None,
+        version_id=db_item.current_version.id,
         title=db_item.current_version.title,
         body=db_item.current_version.body,
         body_format=db_item.current_version.body_format,
@@ -578,12 +611,36 @@ def _db_entity_to_item(db_item: DbNewsItem) -> NewsItem:
 
 
 def render_html(item: NewsItem) -> RenderedNewsItem:
-    """Render item's raw body and featured image to HTML."""
-    featured_image_html = (
-        _render_featured_image_html(item.id, item.featured_image)
-        if item.featured_image
-        else None
-    )
+    """Render item's raw body and featured image to HTML.
+
+    Use the cached HTML, if available. Cache successfully rendered HTML.
+    """
+    cache_key = news_html_cache_service.get_cache_key(item)
+
+    cached = news_html_cache_service.find_html(cache_key)
+    featured_image_html: Result[str, str] | None
+    body_html: Result[str, str]
+    if cached is not None:
+        featured_image_html = (
+            Ok(cached.featured_image_html)
+            if cached.featured_image_html is not None
+            else None
+        )
+        body_html = Ok(cached.body_html)
+    else:
+        featured_image_html = (
+            _render_featured_image_html(item.id, item.featured_image)
+            if item.featured_image
+            else None
+        )
+        body_html = _render_body_html(item)
+
+        if body_html.is_ok():
+            news_html_cache_service.store_html(
+                cache_key,
+                body_html.unwrap(),
+                featured_image_html.unwrap() if featured_image_html else None,
+            )
 
     return RenderedNewsItem(
         channel=item.channel,
@@ -593,7 +650,7 @@ def render_html(item: NewsItem) -> RenderedNewsItem:
         title=item.title,
         featured_image=item.featured_image,
         featured_image_html=featured_image_html,
-        body_html=_render_body_html(item),
+        body_html=body_html,
     )
 
 
@@ -44,6 +44,13 @@ class DbSubscription(db.Model):
     """A user's subscription to a list."""
 
     __tablename__ = 'newsletter_subscriptions'
+    __table_args__ = (
+        db.Index(
+            'ix_newsletter_subscriptions_list_id_user_eligible',
+            'list_id',
+            postgresql_where=db.text('user_eligible'),
+        ),
+    )
 
     user_id: Mapped[UserID] = mapped_column(
         db.Uuid, db.ForeignKey('users.id'), primary_key=True
@@ -51,6 +58,12 @@ class DbSubscription(db.Model):
     list_id: Mapped[ListID] = mapped_column(
         db.UnicodeText, db.ForeignKey('newsletter_lists.id'), primary_key=True
     )
+    # Whether the user account currently qualifies to receive
+    # newsletters. Kept up to date on changes to the account so that
+    # subscribers can be selected without checking their accounts.
+    user_eligible: Mapped[bool] = mapped_column(
+        default=False, server_default=db.false()
+    )
 
 
 class DbSubscriptionUpdate(db.Model):
@@ -8,7 +8,7 @@ byceps.services.newsletter.newsletter_command_service
 
 from datetime import datetime
 
-from sqlalchemy import delete
+from sqlalchemy import delete, update
 from sqlalchemy.dialects.postgresql import insert
 
 from byceps.database import db
@@ -16,7 +16,7 @@ from byceps.events.newsletter import (
     SubscribedToNewsletterEvent,
     UnsubscribedFromNewsletterEvent,
 )
-from byceps.services.user.models.user import User
+from byceps.services.user.models.user import User, UserID
 from byceps.util.result import Err, Ok, Result
 
 from . import newsletter_domain_service, newsletter_service
@@ -64,6 +64,9 @@ def subscribe(
             {
                 'user_id': str(user.id),
                 'list_id': str(list_.id),
+                'user_eligible': (
+                    newsletter_service.build_user_eligibility_subquery(user.id)
+                ),
             }
         )
         .on_conflict_do_nothing(constraint=table.primary_key)
@@ -101,6 +104,38 @@ def unsubscribe(
     return Ok((subscription_update, event))
 
 
+def update_subscriber_eligibility(user_id: UserID) -> None:
+    """Update whether the user's subscriptions count, based on the
+    current state of the user account.
+
+    Call this after changes to the account that affect whether it
+    qualifies to receive newsletters. Does not commit.
+    """
+    db.session.execute(
+        update(DbSubscription)
+        .filter(DbSubscription.user_id == user_id)
+        .values(
+            user_eligible=newsletter_service.build_user_eligibility_subquery(
+                user_id
+            )
+        )
+    )
+
+
+def update_all_subscriber_eligibilities() -> None:
+    """Update whether subscriptions count, based on the current state
+    of the user accounts, for all subscriptions.
+    """
+    db.session.execute(
+        update(DbSubscription).values(
+            user_eligible=newsletter_service.build_user_eligibility_subquery(
+                DbSubscription.user_id
+            )
+        )
+    )
+    db.session.commit()
+
+
 def _update_subscription_state(
     subscription_update: SubscriptionUpdate,
 ) -> Result[None, UnknownListIdError]:
@@ -9,8 +9,10 @@ byceps.services.newsletter.newsletter_service
 from collections.abc import Iterator, Sequence
 
 from sqlalchemy import select
+from sqlalchemy.sql import ColumnElement
+from sqlalchemy.sql.selectable import ScalarSelect
 
-from byceps.database import db
+from byceps.database import db, stream
 from byceps.services.user.dbmodels.user import DbUser
 from byceps.services.user.models.user import UserID
 from byceps.util.result import Err, Ok, Result
@@ -52,20 +54,17 @@ def count_subscribers(list_id: ListID) -> int:
     return (
         db.session.scalar(
             select(db.func.count())
-            .select_from(DbUser)
-            .join(DbSubscription)
+            .select_from(DbSubscription)
             .filter(DbSubscription.list_id == list_id)
-            .filter(DbUser.email_address.is_not(None))
-            .filter(DbUser.initialized == True)  # noqa: E712
-            .filter(DbUser.email_address_verified == True)  # noqa: E712
-            .filter(DbUser.suspended == False)  # noqa: E712
-            .filter(DbUser.deleted == False)  # noqa: E712
+            .filter(DbSubscription.user_eligible == True)  # noqa: E712
         )
         or 0
     )
 
 
-def get_subscribers(list_id: ListID) -> Iterator[Subscriber]:
+def get_subscribers(
+    list_id: ListID, *, batch_size: int = 1000
+) -> Iterator[Subscriber]:
     """Yield screen name and email address of the users that are
     currently subscribed to the list.
 
@@ -74,28 +73,48 @@ def get_subscribers(list_id: ListID) -> Iterator[Subscriber]:
     - have no or an unverified email address,
     - are suspended, or
     - have been deleted.
+
+    Subscribers are fetched in batches of the given size.
     """
-    rows = db.session.execute(
+    rows = stream(
         select(
             DbUser.screen_name,
             DbUser.email_address,
         )
         .join(DbSubscription)
         .filter(DbSubscription.list_id == list_id)
-        .filter(DbUser.email_address.is_not(None))
-        .filter(DbUser.initialized == True)  # noqa: E712
-        .filter(DbUser.email_address_verified == True)  # noqa: E712
-        .filter(DbUser.suspended == False)  # noqa: E712
-        .filter(DbUser.deleted == False)  # noqa: E712
-    ).all()
+        .filter(DbSubscription.user_eligible == True),  # noqa: E712
+        batch_size=batch_size,
+    )
 
-    for row in rows:
+    for screen_name, email_address in rows:
         yield Subscriber(
-            screen_name=row.screen_name,
-            email_address=row.email_address,
+            screen_name=screen_name,
+            email_address=email_address,
         )
 
 
+def build_user_eligibility_subquery(
+    user_id: UserID | ColumnElement[UserID],
+) -> ScalarSelect[bool]:
+    """Return a subquery that tells if the user account currently
+    qualifies to receive newsletters.
+    """
+    return (
+        select(
+            db.and_(
+                DbUser.email_address.is_not(None),
+                DbUser.initialized == True,  # noqa: E712
+                DbUser.email_address_verified == True,  # noqa: E712
+                DbUser.suspended == False,  # noqa: E712
+                DbUser.deleted == False,  # noqa: E712
+            )
+        )
+        .filter(DbUser.id == user_id)
+        .scalar_subquery()
+    )
+
+
 def get_subscription_updates_for_user(
     user_id: UserID,
 ) -> Sequence[DbSubscriptionUpdate]:
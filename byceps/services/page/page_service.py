@@ -18,7 +18,7 @@ from byceps.events.page import (
     PageDeletedEvent,
     PageUpdatedEvent,
 )
-from byceps.services.site import site_service
+from byceps.services.site import site_response_cache_service, site_service
 from byceps.services.site.models import Site, SiteID
 from byceps.services.site_navigation.models import NavMenuID
 from byceps.services.user import user_service
@@ -94,6 +94,8 @@ def create_page(
 
     db.session.commit()
 
+    site_response_cache_service.invalidate_site(site.id)
+
     event = PageCreatedEvent(
         occurred_at=db_version.created_at,
         initiator=EventUser.from_user(creator),
@@ -129,6 +131,8 @@ def update_page(
 
     db.session.commit()
 
+    site_response_cache_service.invalidate_site(db_page.site_id)
+
     site = site_service.get_site(db_page.site_id)
 
     event = PageUpdatedEvent(
@@ -180,6 +184,8 @@ def delete_page(
         db.session.rollback()
         return False, None
 
+    site_response_cache_service.invalidate_site(site.id)
+
     event = PageDeletedEvent(
         occurred_at=datetime.utcnow(),
         initiator=EventUser.from_user(initiator) if initiator else None,
@@ -199,6 +205,8 @@ def set_nav_menu_id(page_id: PageID, nav_menu_id: NavMenuID | None) -> None:
     db_page.nav_menu_id = nav_menu_id
     db.session.commit()
 
+    site_response_cache_service.invalidate_site(db_page.site_id)
+
 
 def find_page(page_id: PageID) -> Page | None:
     """Return the page, or `None` if not found."""
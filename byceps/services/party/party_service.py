@@ -17,6 +17,7 @@ from byceps.services.brand import brand_service
 from byceps.services.brand.dbmodels import DbBrand
 from byceps.services.brand.models import BrandID
 from byceps.services.party.models import PartyID
+from byceps.util.cache import VersionedLocalCache
 
 from .dbmodels import DbParty, DbPartySetting
 from .models import Party, PartyWithBrand
@@ -26,6 +27,12 @@ class UnknownPartyIdError(Exception):
     pass
 
 
+# Parties rarely change, but are looked up on every site request.
+_party_cache: VersionedLocalCache[PartyID, Party] = VersionedLocalCache(
+    'party', 'party', ttl=timedelta(minutes=5)
+)
+
+
 def create_party(
     party_id: PartyID,
     brand_id: BrandID,
@@ -83,6 +90,8 @@ def update_party(
 
     db.session.commit()
 
+    _party_cache.invalidate()
+
     return _db_entity_to_party(db_party)
 
 
@@ -94,6 +103,8 @@ def delete_party(party_id: PartyID) -> None:
     db.session.execute(delete(DbParty).where(DbParty.id == party_id))
     db.session.commit()
 
+    _party_cache.invalidate()
+
 
 def count_parties() -> int:
     """Return the number of parties (of all brands)."""
@@ -130,6 +141,14 @@ def get_party(party_id: PartyID) -> Party:
     return party
 
 
+def get_party_cached(party_id: PartyID) -> Party:
+    """Return the party with that id.
+
+    Prefer the process-local cache over the database.
+    """
+    return _party_cache.get_or_set(party_id, lambda: get_party(party_id))
+
+
 def get_all_parties() -> list[Party]:
     """Return all parties."""
     db_parties = db.session.scalars(select(DbParty)).all()
@@ -76,10 +76,19 @@ def delete_seat(seat_id: SeatID) -> None:
     db.session.commit()
 
 
-def count_occupied_seats_by_category(
-    party_id: PartyID,
-) -> list[tuple[TicketCategory, int]]:
-    """Count occupied seats for the party, grouped by ticket category."""
+def count_occupied_seats_by_party_and_category(
+    party_ids: set[PartyID],
+) -> dict[PartyID, list[tuple[TicketCategory, int]]]:
+    """Count occupied seats for the parties, grouped by party and ticket
+    category.
+    """
+    counts_by_party_id: dict[PartyID, list[tuple[TicketCategory, int]]] = {
+        party_id: [] for party_id in party_ids
+    }
+
+    if not party_ids:
+        return counts_by_party_id
+
     subquery = (
         select(DbSeat.id, DbSeat.category_id)
         .join(DbTicket)
@@ -95,18 +104,18 @@ def count_occupied_seats_by_category(
             db.func.count(subquery.c.id),
         )
         .outerjoin(subquery, DbTicketCategory.id == subquery.c.category_id)
-        .filter(DbTicketCategory.party_id == party_id)
+        .filter(DbTicketCategory.party_id.in_(party_ids))
         .group_by(DbTicketCategory.id)
-        .order_by(DbTicketCategory.id)
+        .order_by(DbTicketCategory.party_id, DbTicketCategory.id)
     ).all()
 
-    return [
-        (
-            TicketCategory(id=category_id, party_id=party_id, title=title),
-            occupied_seat_count,
+    for category_id, party_id, title, occupied_seat_count in rows:
+        category = TicketCategory(
+            id=category_id, party_id=party_id, title=title
         )
-        for category_id, party_id, title, occupied_seat_count in rows
-    ]
+        counts_by_party_id[party_id].append((category, occupied_seat_count))
+
+    return counts_by_party_id
 
 
 def count_occupied_seats_for_party(party_id: PartyID) -> int:
@@ -7,24 +7,26 @@ byceps.services.shop.article.article_service
 """
 
 from collections import defaultdict
-from datetime import datetime
+from collections.abc import Mapping
+from datetime import datetime, timedelta
 from decimal import Decimal
 
 from moneyed import Money
-from sqlalchemy import delete, select, update
-from sqlalchemy.sql import Select
+from sqlalchemy import column, delete, Integer, select, update, Uuid, values
+from sqlalchemy.sql import Select, Values
 
-from byceps.database import db, paginate, Pagination
+from byceps.database import db, paginate, Pagination, rank_by_similarity
 from byceps.services.shop.order.dbmodels.line_item import DbLineItem
 from byceps.services.shop.order.dbmodels.order import DbOrder
 from byceps.services.shop.order.models.order import PaymentState
 from byceps.services.shop.shop.models import ShopID
 from byceps.services.ticketing.models.ticket import TicketCategoryID
+from byceps.util.cache import VersionedLocalCache
 from byceps.util.result import Err, Ok, Result
 
 from .dbmodels.article import DbArticle
 from .dbmodels.attached_article import DbAttachedArticle
-from .errors import NoArticlesAvailableError
+from .errors import ArticlesSoldOutError, NoArticlesAvailableError
 from .models import (
     Article,
     ArticleAttachment,
@@ -42,6 +44,18 @@ class UnknownArticleIdError(ValueError):
     pass
 
 
+# The compilation of orderable articles is requested on every view of
+# the order form. Keep it only briefly as it contains the articles'
+# available quantities (which are checked again when placing an order).
+_orderable_articles_compilation_cache: VersionedLocalCache[
+    ShopID, Result[ArticleCompilation, NoArticlesAvailableError]
+] = VersionedLocalCache(
+    'shop-orderable-articles-compilation',
+    'shop-articles',
+    ttl=timedelta(seconds=10),
+)
+
+
 def create_article(
     shop_id: ShopID,
     item_number: ArticleNumber,
@@ -80,6 +94,8 @@ def create_article(
     db.session.add(db_article)
     db.session.commit()
 
+    _orderable_articles_compilation_cache.invalidate()
+
     return _db_entity_to_article(db_article)
 
 
@@ -191,6 +207,8 @@ def update_article(
 
     db.session.commit()
 
+    _orderable_articles_compilation_cache.invalidate()
+
     return _db_entity_to_article(db_article)
 
 
@@ -207,6 +225,8 @@ def attach_article(
     db.session.add(db_attached_article)
     db.session.commit()
 
+    _orderable_articles_compilation_cache.invalidate()
+
 
 def unattach_article(attached_article_id: AttachedArticleID) -> None:
     """Unattach an article from another."""
@@ -215,33 +235,88 @@ def unattach_article(attached_article_id: AttachedArticleID) -> None:
     )
     db.session.commit()
 
+    _orderable_articles_compilation_cache.invalidate()
 
-def increase_quantity(
-    article_id: ArticleID, quantity_to_increase_by: int, *, commit: bool = True
-) -> None:
-    """Increase article quantity by the given value."""
-    db.session.execute(
+
+def reserve_quantities(
+    quantities_by_article_id: Mapping[ArticleID, int],
+) -> Result[None, ArticlesSoldOutError]:
+    """Reduce the quantities of the articles by the given amounts, but
+    only if enough of each article is available.
+
+    All articles are updated with a single statement. If any of them is
+    sold out, the amounts reserved for the others are not reverted;
+    roll back the current transaction in that case.
+
+    Does not commit.
+    """
+    quantities_by_article_id = {
+        article_id: quantity
+        for article_id, quantity in quantities_by_article_id.items()
+        if quantity > 0
+    }
+    if not quantities_by_article_id:
+        return Ok(None)
+
+    requested = _build_article_quantities_values(quantities_by_article_id)
+
+    # Lock the rows in a consistent order to avoid deadlocks between
+    # concurrent reservations of overlapping sets of articles.
+    rows_to_lock = (
+        select(DbArticle.id)
+        .filter(DbArticle.id.in_(quantities_by_article_id.keys()))
+        .order_by(DbArticle.id)
+        .with_for_update()
+    )
+
+    reserved_article_ids = db.session.scalars(
         update(DbArticle)
-        .where(DbArticle.id == article_id)
-        .values(quantity=DbArticle.quantity + quantity_to_increase_by)
+        .filter(DbArticle.id.in_(rows_to_lock))
+        .filter(DbArticle.id == requested.c.article_id)
+        .filter(DbArticle.quantity >= requested.c.quantity)
+        .values(quantity=DbArticle.quantity - requested.c.quantity)
+        .returning(DbArticle.id)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    sold_out_article_ids = frozenset(
+        quantities_by_article_id.keys() - set(reserved_article_ids)
     )
+    if sold_out_article_ids:
+        return Err(ArticlesSoldOutError(sold_out_article_ids))
 
-    if commit:
-        db.session.commit()
+    return Ok(None)
 
 
-def decrease_quantity(
-    article_id: ArticleID, quantity_to_decrease_by: int, *, commit: bool = True
+def release_quantities(
+    quantities_by_article_id: Mapping[ArticleID, int],
 ) -> None:
-    """Decrease article quantity by the given value."""
+    """Increase the quantities of the articles by the given amounts,
+    with a single statement.
+
+    Does not commit.
+    """
+    if not quantities_by_article_id:
+        return
+
+    released = _build_article_quantities_values(quantities_by_article_id)
+
     db.session.execute(
         update(DbArticle)
-        .where(DbArticle.id == article_id)
-        .values(quantity=DbArticle.quantity - quantity_to_decrease_by)
+        .filter(DbArticle.id == released.c.article_id)
+        .values(quantity=DbArticle.quantity + released.c.quantity)
+        .execution_options(synchronize_session=False)
     )
 
-    if commit:
-        db.session.commit()
+
+def _build_article_quantities_values(
+    quantities_by_article_id: Mapping[ArticleID, int],
+) -> Values:
+    return values(
+        column('article_id', Uuid),
+        column('quantity', Integer),
+        name='article_quantities',
+    ).data(list(quantities_by_article_id.items()))
 
 
 def delete_article(article_id: ArticleID) -> None:
@@ -249,6 +324,8 @@ def delete_article(article_id: ArticleID) -> None:
     db.session.execute(delete(DbArticle).filter_by(id=article_id))
     db.session.commit()
 
+    _orderable_articles_compilation_cache.invalidate()
+
 
 def find_article(article_id: ArticleID) -> Article | None:
     """Return the article with that ID, or `None` if not found."""
@@ -383,22 +460,26 @@ def get_articles_for_shop_paginated(
 ) -> Pagination:
     """Return all articles for that shop, paginated.
 
-    Ordered by article number, reversed.
+    Ordered by article number, reversed. If a search term is given,
+    best matches come first.
     """
-    stmt = (
-        select(DbArticle)
-        .filter_by(shop_id=shop_id)
-        .order_by(DbArticle.item_number.desc())
-    )
+    stmt = select(DbArticle).filter_by(shop_id=shop_id)
 
     if search_term:
         stmt = _filter_by_search_term(stmt, search_term)
 
+        rank = rank_by_similarity(
+            search_term.split(), DbArticle.item_number, DbArticle.description
+        )
+        stmt = stmt.order_by(rank.desc())
+
+    stmt = stmt.order_by(DbArticle.item_number.desc())
+
     return paginate(stmt, page, per_page)
 
 
 def _filter_by_search_term(stmt: Select, search_term: str) -> Select:
-    terms = search_term.split(' ')
+    terms = search_term.split()
     clauses = map(_generate_search_clauses_for_term, terms)
 
     return stmt.filter(db.and_(*clauses))
@@ -413,6 +494,22 @@ def _generate_search_clauses_for_term(search_term: str) -> Select:
     )
 
 
+def get_article_compilation_for_orderable_articles_cached(
+    shop_id: ShopID,
+) -> Result[ArticleCompilation, NoArticlesAvailableError]:
+    """Return a compilation of the articles which can be ordered from
+    that shop, less the ones that are only orderable in a dedicated
+    order.
+
+    Prefer the process-local cache over the database. The articles'
+    quantities can thus be slightly outdated.
+    """
+    return _orderable_articles_compilation_cache.get_or_set(
+        shop_id,
+        lambda: get_article_compilation_for_orderable_articles(shop_id),
+    )
+
+
 def get_article_compilation_for_orderable_articles(
     shop_id: ShopID,
 ) -> Result[ArticleCompilation, NoArticlesAvailableError]:
@@ -424,6 +521,11 @@ def get_article_compilation_for_orderable_articles(
 
     db_orderable_articles = db.session.scalars(
         select(DbArticle)
+        .options(
+            db.selectinload(DbArticle.attached_articles).joinedload(
+                DbAttachedArticle.article
+            )
+        )
         .filter_by(shop_id=shop_id)
         .filter_by(not_directly_orderable=False)
         .filter_by(separate_order_required=False)
@@ -19,7 +19,7 @@ if TYPE_CHECKING:
 else:
     from sqlalchemy.ext.hybrid import hybrid_property
 
-from byceps.database import db
+from byceps.database import db, trigram_index
 from byceps.services.shop.article.models import (
     ArticleID,
     ArticleNumber,
@@ -38,6 +38,8 @@ class DbArticle(db.Model):
     __table_args__ = (
         db.UniqueConstraint('shop_id', 'description'),
         db.CheckConstraint('available_from < available_until'),
+        trigram_index('ix_shop_articles_item_number_trgm', 'item_number'),
+        trigram_index('ix_shop_articles_description_trgm', 'description'),
     )
 
     id: Mapped[ArticleID] = mapped_column(
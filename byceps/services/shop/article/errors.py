@@ -6,6 +6,15 @@ byceps.services.shop.article.errors
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from dataclasses import dataclass
+
+from .models import ArticleID
+
+
+@dataclass(frozen=True)
+class ArticlesSoldOutError:
+    article_ids: frozenset[ArticleID]
+
 
 class NoArticlesAvailableError:
     pass
@@ -6,7 +6,9 @@ byceps.services.shop.order.actions.award_badge
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from byceps.services.shop.order import order_log_service
+from typing import Any
+
+from byceps.services.shop.order import order_log_service, order_service
 from byceps.services.shop.order.models.action import ActionParameters
 from byceps.services.shop.order.models.order import LineItem, Order, OrderID
 from byceps.services.user.models.user import User
@@ -27,6 +29,7 @@ def award_badge(
     badge = user_badge_service.get_badge(parameters['badge_id'])
     awardee = order.placed_by
 
+    awardings = []
     for _ in range(line_item.quantity):
         awarding, _ = user_badge_awarding_service.award_badge_to_user(
             badge, awardee
@@ -34,6 +37,17 @@ def award_badge(
 
         _create_order_log_entry(order.id, awarding)
 
+        awardings.append(awarding)
+
+    # Mark the line item as processed so that the badge is not awarded
+    # again should the order's fulfillment be retried.
+    data: dict[str, Any] = {
+        'badge_awarding_ids': list(
+            sorted(str(awarding.id) for awarding in awardings)
+        )
+    }
+    order_service.update_line_item_processing_result(line_item.id, data)
+
 
 def _create_order_log_entry(order_id: OrderID, awarding: BadgeAwarding) -> None:
     event_type = 'badge-awarded'
@@ -19,9 +19,13 @@ if TYPE_CHECKING:
 else:
     from sqlalchemy.ext.hybrid import hybrid_property
 
-from byceps.database import db
+from byceps.database import db, trigram_index
 from byceps.services.shop.order.models.number import OrderNumber
-from byceps.services.shop.order.models.order import OrderID, PaymentState
+from byceps.services.shop.order.models.order import (
+    OrderFulfillmentState,
+    OrderID,
+    PaymentState,
+)
 from byceps.services.shop.shop.models import ShopID
 from byceps.services.shop.storefront.models import StorefrontID
 from byceps.services.user.dbmodels.user import DbUser
@@ -33,6 +37,15 @@ class DbOrder(db.Model):
     """An order for articles, placed by a user."""
 
     __tablename__ = 'shop_orders'
+    __table_args__ = (
+        db.Index(
+            'ix_shop_orders_shop_id_created_at_id',
+            'shop_id',
+            'created_at',
+            'id',
+        ),
+        trigram_index('ix_shop_orders_order_number_trgm', 'order_number'),
+    )
 
     id: Mapped[OrderID] = mapped_column(db.Uuid, primary_key=True)
     created_at: Mapped[datetime]
@@ -79,6 +92,11 @@ class DbOrder(db.Model):
     cancellation_reason: Mapped[str | None] = mapped_column(db.UnicodeText)
     processing_required: Mapped[bool]
     processed_at: Mapped[datetime | None]
+    _fulfillment_state: Mapped[str | None] = mapped_column(
+        'fulfillment_state', db.UnicodeText, index=True
+    )
+    fulfillment_state_updated_at: Mapped[datetime | None]
+    fulfillment_error: Mapped[str | None] = mapped_column(db.UnicodeText)
 
     def __init__(
         self,
@@ -136,6 +154,17 @@ class DbOrder(db.Model):
     def payment_state(self, state: PaymentState) -> None:
         self._payment_state = state.name
 
+    @hybrid_property
+    def fulfillment_state(self) -> OrderFulfillmentState | None:
+        if self._fulfillment_state is None:
+            return None
+
+        return OrderFulfillmentState[self._fulfillment_state]
+
+    @fulfillment_state.setter
+    def fulfillment_state(self, state: OrderFulfillmentState | None) -> None:
+        self._fulfillment_state = state.name if (state is not None) else None
+
     def __repr__(self) -> str:
         return (
             ReprBuilder(self)
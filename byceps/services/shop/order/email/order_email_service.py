@@ -8,7 +8,7 @@ Notification e-mails about shop orders
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from functools import partial
 
@@ -102,6 +102,32 @@ def send_email_for_paid_order_to_orderer(order: Order) -> None:
     _send_email(message_result.unwrap())
 
 
+def send_email_for_paid_orders_to_orderers(orders: Sequence[Order]) -> None:
+    """Send an e-mail for each of the paid orders to its orderer, all
+    in a single job.
+    """
+    messages = []
+
+    for order in orders:
+        data = _get_order_email_data(order)
+        language_code = get_user_locale(data.orderer)
+
+        message_result = assemble_email_for_paid_order_to_orderer(
+            data, language_code
+        )
+        if message_result.is_err():
+            log.error(
+                'Assembling email for paid order to orderer failed',
+                error=message_result.unwrap_err(),
+            )
+            continue
+
+        messages.append(message_result.unwrap())
+
+    if messages:
+        email_service.enqueue_messages(messages)
+
+
 def assemble_email_for_incoming_order_to_orderer(
     data: OrderEmailData,
     language_code: str,
@@ -0,0 +1,52 @@
+"""
+byceps.services.shop.order.models.bulk_payment
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from enum import Enum
+
+from moneyed import Money
+
+from byceps.events.shop import ShopOrderPaidEvent
+
+from .number import OrderNumber
+from .order import OrderID
+
+
+@dataclass(frozen=True)
+class IncomingPayment:
+    """A payment for an order, e.g. a transfer from a bank statement."""
+
+    order_number: OrderNumber
+    amount: Money
+    paid_on: date
+
+
+BulkPaymentStatus = Enum(
+    'BulkPaymentStatus',
+    [
+        'paid',
+        'unknown_order',
+        'duplicate',
+        'amount_mismatch',
+        'already_paid',
+        'canceled',
+    ],
+)
+
+
+@dataclass(frozen=True)
+class BulkPaymentResult:
+    payment: IncomingPayment
+    status: BulkPaymentStatus
+    order_id: OrderID | None
+    event: ShopOrderPaidEvent | None
+
+    @property
+    def is_paid(self) -> bool:
+        return self.status == BulkPaymentStatus.paid
@@ -41,6 +41,17 @@ LineItemProcessingState = Enum(
 )
 
 
+OrderFulfillmentState = Enum(
+    'OrderFulfillmentState',
+    [
+        'pending',
+        'in_progress',
+        'succeeded',
+        'failed',
+    ],
+)
+
+
 OrderID = NewType('OrderID', UUID)
 
 
@@ -0,0 +1,251 @@
+"""
+byceps.services.shop.order.order_bulk_payment_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Mark many orders as paid at once, e.g. to reconcile a bank statement.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import update
+import structlog
+
+from byceps.database import db
+from byceps.services.shop.shop.models import ShopID
+from byceps.services.user.models.user import User
+from byceps.util.iterables import chunked, partition
+from byceps.util.jobqueue import enqueue_many
+
+from . import order_domain_service, order_log_service, order_service
+from .dbmodels.order import DbOrder
+from .dbmodels.payment import DbPayment
+from .models.bulk_payment import (
+    BulkPaymentResult,
+    BulkPaymentStatus,
+    IncomingPayment,
+)
+from .models.number import OrderNumber
+from .models.order import Order, OrderFulfillmentState, OrderID, PaymentState
+
+
+log = structlog.get_logger()
+
+
+DEFAULT_BATCH_SIZE = 100
+
+
+def mark_orders_as_paid(
+    shop_id: ShopID,
+    payments: Sequence[IncomingPayment],
+    payment_method: str,
+    initiator: User,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[BulkPaymentResult]:
+    """Mark the orders as paid for which payments of their exact total
+    amount have been received.
+
+    Orders are looked up all at once and updated in batches, one
+    transaction per batch. Orders of other shops are reported as
+    unknown.
+
+    Return a result for each payment, in the given order.
+    """
+    order_numbers = {payment.order_number for payment in payments}
+    orders_by_number = {
+        order.order_number: order
+        for order in order_service.get_orders_for_shop_and_order_numbers(
+            shop_id, order_numbers
+        )
+    }
+
+    results: list[BulkPaymentResult | None] = [None] * len(payments)
+    payable: list[tuple[int, IncomingPayment, Order]] = []
+    seen_order_numbers: set[OrderNumber] = set()
+
+    for index, payment in enumerate(payments):
+        order = orders_by_number.get(payment.order_number)
+
+        status = _check_payment(payment, order, seen_order_numbers)
+        seen_order_numbers.add(payment.order_number)
+
+        if status is None:
+            payable.append((index, payment, order))
+        else:
+            order_id = order.id if order is not None else None
+            results[index] = BulkPaymentResult(payment, status, order_id, None)
+
+    for batch in chunked(payable, batch_size):
+        for index, result in _apply_payments(batch, payment_method, initiator):
+            results[index] = result
+
+    return [result for result in results if result is not None]
+
+
+def _check_payment(
+    payment: IncomingPayment,
+    order: Order | None,
+    seen_order_numbers: set[OrderNumber],
+) -> BulkPaymentStatus | None:
+    """Return the reason why the payment cannot be applied, if any."""
+    if order is None:
+        return BulkPaymentStatus.unknown_order
+
+    if payment.order_number in seen_order_numbers:
+        return BulkPaymentStatus.duplicate
+
+    if order.is_canceled:
+        return BulkPaymentStatus.canceled
+
+    if order.is_paid:
+        return BulkPaymentStatus.already_paid
+
+    if payment.amount != order.total_amount:
+        return BulkPaymentStatus.amount_mismatch
+
+    return None
+
+
+def _apply_payments(
+    batch: list[tuple[int, IncomingPayment, Order]],
+    payment_method: str,
+    initiator: User,
+) -> list[tuple[int, BulkPaymentResult]]:
+    """Mark the orders of the batch as paid in a single transaction."""
+    results = []
+
+    occurred_at = datetime.utcnow()
+
+    # Only update orders that are still open, in case one has been
+    # paid or canceled since it was looked up.
+    order_ids = [order.id for _, _, order in batch]
+    updated_order_ids = _update_payment_states(
+        order_ids, payment_method, occurred_at, initiator
+    )
+
+    paid, not_paid = partition(
+        batch, lambda item: item[2].id in updated_order_ids
+    )
+
+    paid_order_ids = []
+    for index, payment, order in paid:
+        additional_payment_data = {'paid_on': payment.paid_on.isoformat()}
+
+        _add_payment_and_log_entries(
+            order,
+            occurred_at,
+            payment_method,
+            additional_payment_data,
+            initiator,
+        )
+
+        # The order has been checked to be open, so this succeeds.
+        event, log_entry = order_domain_service.mark_order_as_paid(
+            order,
+            order.placed_by,
+            occurred_at,
+            payment_method,
+            additional_payment_data,
+            initiator,
+        ).unwrap()
+
+        db.session.add(order_log_service.to_db_entry(log_entry))
+
+        paid_order_ids.append(order.id)
+
+        results.append(
+            (
+                index,
+                BulkPaymentResult(
+                    payment, BulkPaymentStatus.paid, order.id, event
+                ),
+            )
+        )
+
+    db.session.commit()
+
+    if paid_order_ids:
+        # Create tickets etc. asynchronously.
+        enqueue_many(
+            order_service.fulfill_order,
+            [(order_id, initiator.id) for order_id in paid_order_ids],
+        )
+
+    log.info(
+        'Orders paid in bulk',
+        paid_count=len(paid_order_ids),
+        not_paid_count=len(not_paid),
+    )
+
+    # Most likely paid concurrently (or, less likely, canceled).
+    for index, payment, order in not_paid:
+        results.append(
+            (
+                index,
+                BulkPaymentResult(
+                    payment, BulkPaymentStatus.already_paid, order.id, None
+                ),
+            )
+        )
+
+    return results
+
+
+def _update_payment_states(
+    order_ids: list[OrderID],
+    payment_method: str,
+    occurred_at: datetime,
+    initiator: User,
+) -> set[OrderID]:
+    """Set the open ones of the orders to paid, and return their IDs."""
+    updated_order_ids = db.session.scalars(
+        update(DbOrder)
+        .filter(DbOrder.id.in_(order_ids))
+        .filter(DbOrder._payment_state == PaymentState.open.name)
+        .values(
+            payment_method=payment_method,
+            _payment_state=PaymentState.paid.name,
+            payment_state_updated_at=occurred_at,
+            payment_state_updated_by_id=initiator.id,
+            _fulfillment_state=OrderFulfillmentState.pending.name,
+            fulfillment_state_updated_at=occurred_at,
+            fulfillment_error=None,
+        )
+        .returning(DbOrder.id)
+        .execution_options(synchronize_session=False)
+    ).all()
+
+    return set(updated_order_ids)
+
+
+def _add_payment_and_log_entries(
+    order: Order,
+    occurred_at: datetime,
+    payment_method: str,
+    additional_payment_data: dict[str, str],
+    initiator: User,
+) -> None:
+    payment, log_entry = order_domain_service.create_payment(
+        order,
+        occurred_at,
+        payment_method,
+        order.total_amount,
+        initiator,
+        additional_payment_data,
+    )
+
+    db_payment = DbPayment(
+        payment.id,
+        payment.order_id,
+        payment.created_at,
+        payment.method,
+        payment.amount,
+        payment.additional_data,
+    )
+    db.session.add(db_payment)
+
+    db.session.add(order_log_service.to_db_entry(log_entry))
@@ -6,6 +6,7 @@ byceps.services.shop.order.order_checkout_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections import Counter
 from collections.abc import Iterator
 from datetime import datetime
 
@@ -17,6 +18,7 @@ from byceps.database import db
 from byceps.events.base import EventUser
 from byceps.events.shop import ShopOrderPlacedEvent
 from byceps.services.shop.article import article_service
+from byceps.services.shop.article.errors import ArticlesSoldOutError
 from byceps.services.shop.cart.models import Cart, CartItem
 from byceps.services.shop.order.models.order import LineItemID, OrderID
 from byceps.services.shop.shop import shop_service
@@ -49,7 +51,7 @@ def place_order(
     cart: Cart,
     *,
     created_at: datetime | None = None,
-) -> Result[tuple[Order, ShopOrderPlacedEvent], None]:
+) -> Result[tuple[Order, ShopOrderPlacedEvent], ArticlesSoldOutError | None]:
     """Place an order for one or more articles."""
     shop = shop_service.get_shop(storefront.shop_id)
 
@@ -73,6 +75,15 @@ def place_order(
         created_at, shop.id, storefront.id, orderer, shop.currency, cart
     )
 
+    reservation_result = _reserve_article_stock(incoming_order)
+    if reservation_result.is_err():
+        db.session.rollback()
+        log.info(
+            'Order placement failed, articles sold out',
+            order_number=order_number,
+        )
+        return Err(reservation_result.unwrap_err())
+
     db_order = _build_db_order(incoming_order, order_number)
 
     db_line_items = list(
@@ -82,8 +93,6 @@ def place_order(
     db.session.add(db_order)
     db.session.add_all(db_line_items)
 
-    _reduce_article_stock(incoming_order)
-
     try:
         db.session.commit()
     except IntegrityError as e:
@@ -209,9 +218,14 @@ def _build_db_line_items(
         )
 
 
-def _reduce_article_stock(incoming_order: IncomingOrder) -> None:
-    """Reduce article stock according to what is in the cart."""
+def _reserve_article_stock(
+    incoming_order: IncomingOrder,
+) -> Result[None, ArticlesSoldOutError]:
+    """Reduce article stock according to what is in the cart, but only
+    if all articles are available in the requested quantities.
+    """
+    quantities_by_article_id: Counter = Counter()
     for line_item in incoming_order.line_items:
-        article_service.decrease_quantity(
-            line_item.article_id, line_item.quantity, commit=False
-        )
+        quantities_by_article_id[line_item.article_id] += line_item.quantity
+
+    return article_service.reserve_quantities(quantities_by_article_id)
@@ -6,7 +6,11 @@ byceps.services.shop.order.order_sequence_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from sqlalchemy import delete, select
+from dataclasses import dataclass
+from threading import Lock
+
+from flask import current_app
+from sqlalchemy import delete, select, update
 from sqlalchemy.exc import IntegrityError
 
 from byceps.database import db
@@ -75,26 +79,100 @@ def get_order_number_sequences_for_shop(
 
 
 def generate_order_number(
-    sequence_id: OrderNumberSequenceID,
+    sequence_id: OrderNumberSequenceID, *, block_size: int | None = None
 ) -> Result[OrderNumber, str]:
     """Generate and reserve an unused, unique order number from this
     sequence.
+
+    With a block size greater than one, a block of that many numbers is
+    reserved at once and numbers are then handed out from it without
+    touching the database until the block is exhausted. This avoids
+    that concurrent checkouts serialize on the sequence's row lock, at
+    the cost of numbers no longer being assigned in chronological order
+    across processes and of gaps when a process stops with numbers left
+    in its block.
+
+    If no block size is given, it is taken from the application's
+    configuration (`SHOP_ORDER_NUMBER_BLOCK_SIZE`).
     """
-    db_sequence = db.session.execute(
-        select(DbOrderNumberSequence)
+    if block_size is None:
+        block_size = current_app.config.get('SHOP_ORDER_NUMBER_BLOCK_SIZE', 1)
+
+    if block_size <= 1:
+        reservation_result = _reserve_values(sequence_id, 1)
+        if reservation_result.is_err():
+            return Err(reservation_result.unwrap_err())
+
+        prefix, value = reservation_result.unwrap()
+        return Ok(_build_order_number(prefix, value))
+
+    with _reserved_blocks_lock:
+        block = _reserved_blocks.get(sequence_id)
+
+        if (block is None) or block.is_exhausted():
+            reservation_result = _reserve_values(sequence_id, block_size)
+            if reservation_result.is_err():
+                return Err(reservation_result.unwrap_err())
+
+            prefix, last_value = reservation_result.unwrap()
+            block = _ReservedBlock(
+                prefix=prefix,
+                next_value=last_value - block_size + 1,
+                last_value=last_value,
+            )
+            _reserved_blocks[sequence_id] = block
+
+        value = block.take_value()
+
+    return Ok(_build_order_number(block.prefix, value))
+
+
+@dataclass
+class _ReservedBlock:
+    """A block of sequence values reserved by this process."""
+
+    prefix: str
+    next_value: int
+    last_value: int
+
+    def is_exhausted(self) -> bool:
+        return self.next_value > self.last_value
+
+    def take_value(self) -> int:
+        value = self.next_value
+        self.next_value += 1
+        return value
+
+
+_reserved_blocks: dict[OrderNumberSequenceID, _ReservedBlock] = {}
+_reserved_blocks_lock = Lock()
+
+
+def _reserve_values(
+    sequence_id: OrderNumberSequenceID, count: int
+) -> Result[tuple[str, int], str]:
+    """Advance the sequence by that many values in a single statement.
+
+    Return the sequence's prefix and the last reserved value.
+    """
+    row = db.session.execute(
+        update(DbOrderNumberSequence)
         .filter_by(id=sequence_id)
-        .with_for_update()
-    ).scalar_one_or_none()
+        .values(value=DbOrderNumberSequence.value + count)
+        .returning(DbOrderNumberSequence.prefix, DbOrderNumberSequence.value)
+    ).one_or_none()
+    db.session.commit()
 
-    if db_sequence is None:
+    if row is None:
         return Err(f'No order number sequence found for ID "{sequence_id}".')
 
-    db_sequence.value = DbOrderNumberSequence.value + 1
-    db.session.commit()
+    prefix, last_value = row
+
+    return Ok((prefix, last_value))
 
-    order_number = OrderNumber(f'{db_sequence.prefix}{db_sequence.value:05d}')
 
-    return Ok(order_number)
+def _build_order_number(prefix: str, value: int) -> OrderNumber:
+    return OrderNumber(f'{prefix}{value:05d}')
 
 
 def _db_entity_to_order_number_sequence(
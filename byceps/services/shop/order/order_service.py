@@ -6,18 +6,24 @@ byceps.services.shop.order.order_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections import Counter
 from collections.abc import Sequence
 import dataclasses
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any
 from uuid import UUID
 
 from flask_babel import lazy_gettext
 from moneyed import Currency, Money
-from sqlalchemy import delete, select
+from sqlalchemy import delete, select, update
 import structlog
 
-from byceps.database import db, paginate, Pagination
+from byceps.database import (
+    db,
+    KeysetCountMode,
+    KeysetPagination,
+    paginate_by_keyset,
+)
 from byceps.events.shop import ShopOrderCanceledEvent, ShopOrderPaidEvent
 from byceps.services.shop.article import article_service
 from byceps.services.shop.article.models import ArticleType
@@ -27,6 +33,7 @@ from byceps.services.shop.storefront.models import StorefrontID
 from byceps.services.ticketing.models.ticket import TicketCategoryID
 from byceps.services.user import user_service
 from byceps.services.user.models.user import User, UserID
+from byceps.util.jobqueue import enqueue
 from byceps.util.result import Err, Ok, Result
 
 from . import (
@@ -58,6 +65,7 @@ from .models.order import (
     LineItemID,
     LineItemProcessingState,
     Order,
+    OrderFulfillmentState,
     OrderID,
     OrderState,
     PaymentState,
@@ -132,7 +140,9 @@ def cancel_order(
     Reserved quantities of articles from that order are made available
     again.
     """
-    db_order = _get_order_entity(order_id)
+    # Lock the order so that its fulfillment cannot proceed to another
+    # line item meanwhile.
+    db_order = _get_order_entity_for_update(order_id)
 
     if _is_canceled(db_order):
         return Err(OrderAlreadyCanceledError())
@@ -163,20 +173,36 @@ def cancel_order(
     _update_payment_state(db_order, payment_state_to, occurred_at, initiator)
     db_order.cancellation_reason = reason
 
+    # A fulfillment job that is currently running revokes what it has
+    # created as soon as it notices the cancelation. Otherwise, prevent
+    # pending or failed fulfillment from (re)starting.
+    is_revocation_left_to_fulfillment = (
+        db_order.fulfillment_state == OrderFulfillmentState.in_progress
+    )
+    if db_order.fulfillment_state in {
+        OrderFulfillmentState.pending,
+        OrderFulfillmentState.failed,
+    }:
+        _update_fulfillment_state(db_order, None, occurred_at)
+
     db_log_entry = order_log_service.to_db_entry(log_entry)
     db.session.add(db_log_entry)
 
     # Make the reserved quantity of articles available again.
+    quantities_by_article_id: Counter = Counter()
     for db_line_item in db_order.line_items:
-        article_service.increase_quantity(
-            db_line_item.article.id, db_line_item.quantity, commit=False
-        )
+        article_id = db_line_item.article_id
+        quantities_by_article_id[article_id] += db_line_item.quantity
+    article_service.release_quantities(quantities_by_article_id)
 
     db.session.commit()
 
     canceled_order = _order_to_transfer_object(db_order, orderer_user)
 
-    if payment_state_to == PaymentState.canceled_after_paid:
+    if (
+        payment_state_to == PaymentState.canceled_after_paid
+        and not is_revocation_left_to_fulfillment
+    ):
         _execute_article_revocation_actions(canceled_order, initiator)
 
     log.info('Order canceled', shop_order_canceled_event=event)
@@ -223,6 +249,9 @@ def mark_order_as_paid(
 
     db_order.payment_method = payment_method
     _update_payment_state(db_order, PaymentState.paid, occurred_at, initiator)
+    _update_fulfillment_state(
+        db_order, OrderFulfillmentState.pending, occurred_at
+    )
 
     db_log_entry = order_log_service.to_db_entry(log_entry)
     db.session.add(db_log_entry)
@@ -231,7 +260,8 @@ def mark_order_as_paid(
 
     paid_order = _order_to_transfer_object(db_order, orderer_user)
 
-    _execute_article_creation_actions(paid_order, initiator)
+    # Create tickets etc. asynchronously.
+    enqueue(fulfill_order, paid_order.id, initiator.id)
 
     log.info('Order paid', shop_order_paid_event=event)
 
@@ -249,43 +279,310 @@ def _update_payment_state(
     db_order.payment_state_updated_by_id = initiator.id
 
 
-def _execute_article_creation_actions(order: Order, initiator: User) -> None:
-    # based on article type
-    for line_item in order.line_items:
-        if line_item.article_type in (
-            ArticleType.ticket,
-            ArticleType.ticket_bundle,
-        ):
-            article = article_service.get_article(line_item.article_id)
+# -------------------------------------------------------------------- #
+# fulfillment
+
+
+# Fulfillment that has been pending or in progress for longer than this
+# is assumed to have been interrupted (e.g. by a worker being stopped).
+FULFILLMENT_STALE_THRESHOLD = timedelta(minutes=15)
+
+
+def fulfill_order(order_id: OrderID, initiator_id: UserID) -> None:
+    """Create the articles (tickets, ticket bundles, etc.) of a paid
+    order.
+
+    Meant to be run as a job. Fulfillment is executed only if it is
+    pending, so executing it multiple times has no further effect.
+
+    Should the order be canceled while its fulfillment is in progress,
+    the articles created up to then are revoked.
+    """
+    if not _transition_fulfillment_state(
+        order_id,
+        {OrderFulfillmentState.pending},
+        OrderFulfillmentState.in_progress,
+    ):
+        log.info('Order fulfillment not pending, skipping', order_id=order_id)
+        return
+
+    initiator = user_service.get_user(initiator_id)
+
+    try:
+        is_paid = _execute_article_creation_actions(order_id, initiator)
+    except Exception as exc:
+        db.session.rollback()
+        _transition_fulfillment_state(
+            order_id,
+            {OrderFulfillmentState.in_progress},
+            OrderFulfillmentState.failed,
+            error=str(exc),
+        )
+        log.error('Order fulfillment failed', order_id=order_id, exc=exc)
+        raise
+
+    if not is_paid:
+        # The order has been canceled meanwhile.
+        _revoke_articles_of_canceled_order(order_id, initiator)
+        return
+
+    # The order is still locked, so it cannot be canceled before its
+    # fulfillment is marked as succeeded.
+    _transition_fulfillment_state(
+        order_id,
+        {OrderFulfillmentState.in_progress},
+        OrderFulfillmentState.succeeded,
+    )
+
+
+def _revoke_articles_of_canceled_order(
+    order_id: OrderID, fulfillment_initiator: User
+) -> None:
+    """Revoke the articles created for an order that has been canceled
+    while its fulfillment was in progress, and end its fulfillment.
+
+    The cancelation has left revocation to the fulfillment.
+    """
+    db_order = _get_order_entity(order_id)
+
+    initiator = (
+        user_service.get_user(db_order.payment_state_updated_by_id)
+        if db_order.payment_state_updated_by_id is not None
+        else fulfillment_initiator
+    )
+
+    if db_order.payment_state == PaymentState.canceled_after_paid:
+        order = get_order(order_id)
+        _execute_article_revocation_actions(order, initiator)
+
+    _transition_fulfillment_state(
+        order_id, {OrderFulfillmentState.in_progress}, None
+    )
+
+    log.info(
+        'Order canceled during fulfillment, articles revoked',
+        order_id=order_id,
+    )
+
+
+def retry_order_fulfillment(
+    order_id: OrderID, initiator: User
+) -> Result[None, str]:
+    """Retry the fulfillment of an order if it has failed or seems to
+    have been interrupted.
+
+    Line items that have already been processed are skipped.
+    """
+    db_order = _get_order_entity(order_id)
+
+    if not _is_fulfillment_retryable(db_order):
+        return Err('Order fulfillment cannot be retried.')
+
+    if not _transition_fulfillment_state(
+        order_id,
+        {db_order.fulfillment_state},
+        OrderFulfillmentState.pending,
+    ):
+        return Err('Order fulfillment state has changed concurrently.')
+
+    enqueue(fulfill_order, order_id, initiator.id)
 
-            ticket_category_id = TicketCategoryID(
-                UUID(str(article.type_params['ticket_category_id']))
+    return Ok(None)
+
+
+def is_fulfillment_retryable(order_id: OrderID) -> bool:
+    """Return `True` if the order's fulfillment can be retried."""
+    db_order = _get_order_entity(order_id)
+
+    return _is_fulfillment_retryable(db_order)
+
+
+def _is_fulfillment_retryable(db_order: DbOrder) -> bool:
+    match db_order.fulfillment_state:
+        case OrderFulfillmentState.failed:
+            return True
+        case OrderFulfillmentState.pending | OrderFulfillmentState.in_progress:
+            updated_at = db_order.fulfillment_state_updated_at
+            return (updated_at is not None) and (
+                updated_at < datetime.utcnow() - FULFILLMENT_STALE_THRESHOLD
             )
+        case _:
+            return False
+
+
+def get_fulfillment_state(
+    order_id: OrderID,
+) -> tuple[OrderFulfillmentState | None, str | None]:
+    """Return the order's fulfillment state and, if fulfillment has
+    failed, the error.
+    """
+    db_order = _get_order_entity(order_id)
+
+    return db_order.fulfillment_state, db_order.fulfillment_error
+
+
+def get_orders_with_unfinished_fulfillment(
+    shop_id: ShopID,
+) -> list[tuple[OrderNumber, OrderFulfillmentState, datetime]]:
+    """Return the numbers, fulfillment states, and last fulfillment state
+    changes of the shop's orders whose fulfillment has not succeeded
+    (yet).
+    """
+    rows = db.session.execute(
+        select(
+            DbOrder.order_number,
+            DbOrder._fulfillment_state,
+            DbOrder.fulfillment_state_updated_at,
+        )
+        .filter(DbOrder.shop_id == shop_id)
+        .filter(
+            DbOrder._fulfillment_state.in_(
+                [
+                    OrderFulfillmentState.pending.name,
+                    OrderFulfillmentState.in_progress.name,
+                    OrderFulfillmentState.failed.name,
+                ]
+            )
+        )
+        .order_by(DbOrder.fulfillment_state_updated_at)
+    ).all()
+
+    return [
+        (order_number, OrderFulfillmentState[state_name], updated_at)
+        for order_number, state_name, updated_at in rows
+    ]
+
+
+def _update_fulfillment_state(
+    db_order: DbOrder,
+    state: OrderFulfillmentState | None,
+    updated_at: datetime,
+) -> None:
+    db_order.fulfillment_state = state
+    db_order.fulfillment_state_updated_at = updated_at
+    db_order.fulfillment_error = None
+
+
+def _transition_fulfillment_state(
+    order_id: OrderID,
+    from_states: set[OrderFulfillmentState | None],
+    to_state: OrderFulfillmentState | None,
+    *,
+    error: str | None = None,
+) -> bool:
+    """Change the fulfillment state only if it currently is one of the
+    given states, atomically.
+
+    Return `True` if the state has been changed.
+    """
+    from_state_names = [state.name for state in from_states if state]
+    if not from_state_names:
+        return False
+
+    result = db.session.execute(
+        update(DbOrder)
+        .filter(DbOrder.id == order_id)
+        .filter(DbOrder._fulfillment_state.in_(from_state_names))
+        .values(
+            _fulfillment_state=to_state.name if to_state else None,
+            fulfillment_state_updated_at=datetime.utcnow(),
+            fulfillment_error=error,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.session.commit()
+
+    return result.rowcount == 1
+
+
+def _execute_article_creation_actions(
+    order_id: OrderID, initiator: User
+) -> bool:
+    """Create the articles of the order's line items.
+
+    Line items that have already been processed, e.g. by an earlier,
+    failed fulfillment attempt, are skipped.
+
+    Before each line item, and once more at the end, the order is locked
+    and checked to still be paid. Return `False` as soon as it is not.
+    Otherwise, return `True`, with the order still locked until the
+    transaction ends.
+    """
+    order = get_order(order_id)
+
+    for line_item in order.line_items:
+        if line_item.processed_at is not None:
+            continue
+
+        if not _lock_order_and_check_paid(order_id):
+            return False
+
+        _execute_line_item_creation_actions(order, line_item, initiator)
+
+    return _lock_order_and_check_paid(order_id)
+
+
+def _lock_order_and_check_paid(order_id: OrderID) -> bool:
+    """Lock the order (until the end of the transaction) and return
+    whether it is (still) paid.
+    """
+    db_order = _get_order_entity_for_update(order_id)
+
+    return _is_paid(db_order)
 
-            if line_item.article_type == ArticleType.ticket:
-                ticket_actions.create_tickets(
-                    order,
-                    line_item,
-                    ticket_category_id,
-                    initiator,
-                )
-            elif line_item.article_type == ArticleType.ticket_bundle:
-                ticket_quantity_per_bundle = int(
-                    article.type_params['ticket_quantity']
-                )
-                ticket_bundle_actions.create_ticket_bundles(
-                    order,
-                    line_item,
-                    ticket_category_id,
-                    ticket_quantity_per_bundle,
-                    initiator,
-                )
+
+def _execute_line_item_creation_actions(
+    order: Order, line_item: LineItem, initiator: User
+) -> None:
+    # based on article type
+    if line_item.article_type in (
+        ArticleType.ticket,
+        ArticleType.ticket_bundle,
+    ):
+        article = article_service.get_article(line_item.article_id)
+
+        ticket_category_id = TicketCategoryID(
+            UUID(str(article.type_params['ticket_category_id']))
+        )
+
+        if line_item.article_type == ArticleType.ticket:
+            ticket_actions.create_tickets(
+                order,
+                line_item,
+                ticket_category_id,
+                initiator,
+            )
+        elif line_item.article_type == ArticleType.ticket_bundle:
+            ticket_quantity_per_bundle = int(
+                article.type_params['ticket_quantity']
+            )
+            ticket_bundle_actions.create_ticket_bundles(
+                order,
+                line_item,
+                ticket_category_id,
+                ticket_quantity_per_bundle,
+                initiator,
+            )
 
     # based on order action registered for article number
-    order_action_service.execute_creation_actions(order, initiator)
+    order_action_service.execute_creation_actions(
+        dataclasses.replace(order, line_items=[line_item]), initiator
+    )
 
 
 def _execute_article_revocation_actions(order: Order, initiator: User) -> None:
+    # Skip line items that have not been processed (yet), e.g. because
+    # fulfillment is still pending or has failed. Nothing has been
+    # created for them.
+    order = dataclasses.replace(
+        order,
+        line_items=[
+            line_item
+            for line_item in order.line_items
+            if line_item.processed_at is not None
+        ],
+    )
+
     # based on article type
     for line_item in order.line_items:
         if line_item.article_type == ArticleType.ticket:
@@ -302,13 +599,21 @@ def _execute_article_revocation_actions(order: Order, initiator: User) -> None:
 def update_line_item_processing_result(
     line_item_id: LineItemID, data: dict[str, Any]
 ) -> None:
-    """Update the line item's processing result data."""
+    """Update the line item's processing result data and mark it as
+    processed.
+
+    The data is merged into existing data (e.g. from another action
+    executed for the same line item).
+    """
     db_line_item = db.session.get(DbLineItem, line_item_id)
 
     if db_line_item is None:
         raise ValueError(f'Unknown line item ID "{line_item_id}"')
 
-    db_line_item.processing_result = data
+    db_line_item.processing_result = {
+        **(db_line_item.processing_result or {}),
+        **data,
+    }
     db_line_item.processed_at = datetime.utcnow()
     db.session.commit()
 
@@ -356,6 +661,32 @@ def count_orders_per_payment_state(shop_id: ShopID) -> dict[PaymentState, int]:
     return counts_by_payment_state
 
 
+def count_orders_per_shop_and_payment_state(
+    shop_ids: set[ShopID],
+) -> dict[ShopID, dict[PaymentState, int]]:
+    """Count orders for the shops, grouped by shop and payment state."""
+    counts_by_shop_id = {
+        shop_id: dict.fromkeys(PaymentState, 0) for shop_id in shop_ids
+    }
+
+    if not shop_ids:
+        return counts_by_shop_id
+
+    rows = db.session.execute(
+        select(
+            DbOrder.shop_id, DbOrder._payment_state, db.func.count(DbOrder.id)
+        )
+        .filter(DbOrder.shop_id.in_(shop_ids))
+        .group_by(DbOrder.shop_id, DbOrder._payment_state)
+    ).all()
+
+    for shop_id, payment_state_str, count in rows:
+        payment_state = PaymentState[payment_state_str]
+        counts_by_shop_id[shop_id][payment_state] = count
+
+    return counts_by_shop_id
+
+
 def _find_order_entity(order_id: OrderID) -> DbOrder | None:
     """Return the order database entity with that id, or `None` if not
     found.
@@ -375,6 +706,21 @@ def _get_order_entity(order_id: OrderID) -> DbOrder:
     return db_order
 
 
+def _get_order_entity_for_update(order_id: OrderID) -> DbOrder:
+    """Return the order database entity with that id, locked (until
+    the end of the transaction) and freshly loaded, or raise an
+    exception.
+    """
+    db_order = db.session.get(
+        DbOrder, order_id, with_for_update=True, populate_existing=True
+    )
+
+    if db_order is None:
+        raise ValueError(f'Unknown order ID "{order_id}"')
+
+    return db_order
+
+
 def find_order(order_id: OrderID) -> Order | None:
     """Return the order with that id, or `None` if not found."""
     db_order = _find_order_entity(order_id)
@@ -499,6 +845,29 @@ def get_orders_for_order_numbers(
     return _db_orders_to_transfer_objects_with_orderer_users(db_orders)
 
 
+def get_orders_for_shop_and_order_numbers(
+    shop_id: ShopID, order_numbers: set[OrderNumber]
+) -> list[Order]:
+    """Return the orders with those order numbers that belong to the
+    shop.
+    """
+    if not order_numbers:
+        return []
+
+    db_orders = (
+        db.session.scalars(
+            select(DbOrder)
+            .options(db.joinedload(DbOrder.line_items))
+            .filter(DbOrder.shop_id == shop_id)
+            .filter(DbOrder.order_number.in_(order_numbers))
+        )
+        .unique()
+        .all()
+    )
+
+    return _db_orders_to_transfer_objects_with_orderer_users(db_orders)
+
+
 def get_order_ids_for_order_numbers(
     order_numbers: set[OrderNumber],
 ) -> dict[OrderNumber, OrderID]:
@@ -554,15 +923,18 @@ def get_orders(order_ids: frozenset[OrderID]) -> list[Order]:
 
 def get_orders_for_shop_paginated(
     shop_id: ShopID,
-    page: int,
     per_page: int,
     *,
+    after: str | None = None,
+    before: str | None = None,
     search_term=None,
     only_payment_state: PaymentState | None = None,
     only_overdue: bool | None = None,
     only_processed: bool | None = None,
-) -> Pagination:
-    """Return all orders for that shop, ordered by creation date.
+    count_mode: KeysetCountMode = KeysetCountMode.none,
+) -> KeysetPagination:
+    """Return orders for that shop, ordered by creation date (newest
+    first), after or before the order the cursor refers to.
 
     If a payment state is specified, only orders in that state are
     returned.
@@ -571,7 +943,6 @@ def get_orders_for_shop_paginated(
         select(DbOrder)
         .options(db.joinedload(DbOrder.line_items))
         .filter_by(shop_id=shop_id)
-        .order_by(DbOrder.created_at.desc())
     )
 
     if search_term:
@@ -601,7 +972,14 @@ def get_orders_for_shop_paginated(
         else:
             stmt = stmt.filter(DbOrder.processed_at.is_(None))
 
-    paginated_orders = paginate(stmt, page, per_page)
+    paginated_orders = paginate_by_keyset(
+        stmt,
+        [DbOrder.created_at, DbOrder.id],
+        per_page,
+        after=after,
+        before=before,
+        count_mode=count_mode,
+    )
 
     paginated_orders.items = _to_admin_order_list_items(paginated_orders.items)
 
@@ -0,0 +1,130 @@
+"""
+byceps.services.site.site_response_cache_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Cache the responses of site pages as served to anonymous visitors.
+
+Entries are stored in Redis and shared between processes.
+
+Each entry depends on a few version counters (i.e. surrogate keys):
+one for the site (pages, navigation, settings), one for all snippets,
+and one per news channel shown on the site. Bumping a counter makes all
+entries depending on it unreachable; they eventually expire.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+from hashlib import sha256
+
+from byceps.services.news.models import NewsChannelID
+from byceps.util import cache
+
+from .models import Site, SiteID
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: str
+    mimetype: str
+    etag: str
+
+
+def get_cache_key(site: Site, locale: str, url_path: str) -> str:
+    """Return the key under which the response for the URL path on the
+    site in the locale is cached.
+
+    The key includes the current versions of the site's surrogate keys.
+    """
+    version_names = _get_version_names(site)
+    versions = cache.get_versions(version_names)
+    versions_str = '.'.join(map(str, versions))
+
+    return f'site-response:{site.id}:{locale}:{versions_str}:{url_path}'
+
+
+def _get_version_names(site: Site) -> list[str]:
+    return [
+        _build_site_version_name(site.id),
+        _build_snippets_version_name(),
+    ] + [
+        _build_news_channel_version_name(channel_id)
+        for channel_id in sorted(site.news_channel_ids)
+    ]
+
+
+def find_response(cache_key: str) -> CachedResponse | None:
+    """Return the cached response, if available."""
+    data = cache.get_json(cache_key)
+    if data is None:
+        return None
+
+    return CachedResponse(
+        body=data['body'],
+        mimetype=data['mimetype'],
+        etag=data['etag'],
+    )
+
+
+def store_response(
+    cache_key: str, body: str, mimetype: str, ttl: timedelta
+) -> CachedResponse:
+    """Cache the response body."""
+    etag = sha256(body.encode('utf-8')).hexdigest()
+
+    cached = CachedResponse(body=body, mimetype=mimetype, etag=etag)
+
+    data = {
+        'body': cached.body,
+        'mimetype': cached.mimetype,
+        'etag': cached.etag,
+    }
+
+    cache.set_json(cache_key, data, ttl)
+
+    return cached
+
+
+# -------------------------------------------------------------------- #
+# invalidation
+
+
+def invalidate_site(site_id: SiteID) -> None:
+    """Invalidate the cached responses of the site.
+
+    Call this after changing the site itself, its settings, or its
+    pages or navigation.
+    """
+    cache.bump_version(_build_site_version_name(site_id))
+
+
+def invalidate_snippets() -> None:
+    """Invalidate the cached responses of all sites.
+
+    Call this after changing a snippet. As templates may render
+    snippets of any scope, their use is not tracked per site.
+    """
+    cache.bump_version(_build_snippets_version_name())
+
+
+def invalidate_news_channel(channel_id: NewsChannelID) -> None:
+    """Invalidate the cached responses of sites that show the news
+    channel.
+
+    Call this after changing a news item (or its images) in the channel.
+    """
+    cache.bump_version(_build_news_channel_version_name(channel_id))
+
+
+def _build_site_version_name(site_id: SiteID) -> str:
+    return f'site-responses:site:{site_id}'
+
+
+def _build_snippets_version_name() -> str:
+    return 'site-responses:snippets'
+
+
+def _build_news_channel_version_name(channel_id: NewsChannelID) -> str:
+    return f'site-responses:news-channel:{channel_id}'
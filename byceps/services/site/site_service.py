@@ -8,6 +8,7 @@ byceps.services.site.site_service
 
 from collections.abc import Callable
 import dataclasses
+from datetime import timedelta
 
 from sqlalchemy import delete, select
 
@@ -19,7 +20,9 @@ from byceps.services.news import news_channel_service
 from byceps.services.news.models import NewsChannelID
 from byceps.services.party.models import PartyID
 from byceps.services.shop.storefront.models import StorefrontID
+from byceps.util.cache import VersionedLocalCache
 
+from . import site_response_cache_service
 from .dbmodels import DbSite, DbSiteSetting
 from .models import Site, SiteID, SiteWithBrand
 
@@ -28,6 +31,12 @@ class UnknownSiteIdError(Exception):
     pass
 
 
+# Sites rarely change, but are looked up on every request.
+_site_cache: VersionedLocalCache[SiteID, Site] = VersionedLocalCache(
+    'site', 'site', ttl=timedelta(minutes=5)
+)
+
+
 def create_site(
     site_id: SiteID,
     title: str,
@@ -98,6 +107,9 @@ def update_site(
 
     db.session.commit()
 
+    _site_cache.invalidate()
+    site_response_cache_service.invalidate_site(site_id)
+
     return _db_entity_to_site(db_site)
 
 
@@ -107,6 +119,8 @@ def delete_site(site_id: SiteID) -> None:
     db.session.execute(delete(DbSite).filter_by(id=site_id))
     db.session.commit()
 
+    _site_cache.invalidate()
+
 
 def _find_db_site(site_id: SiteID) -> DbSite | None:
     return db.session.get(DbSite, site_id)
@@ -137,6 +151,14 @@ def get_site(site_id: SiteID) -> Site:
     return _db_entity_to_site(db_site)
 
 
+def get_site_cached(site_id: SiteID) -> Site:
+    """Return the site with that ID.
+
+    Prefer the process-local cache over the database.
+    """
+    return _site_cache.get_or_set(site_id, lambda: get_site(site_id))
+
+
 def get_all_sites() -> set[Site]:
     """Return all sites."""
     db_sites = db.session.scalars(select(DbSite)).all()
@@ -234,6 +256,9 @@ def add_news_channel(site_id: SiteID, news_channel_id: NewsChannelID) -> None:
     db_site.news_channels.append(news_channel)
     db.session.commit()
 
+    _site_cache.invalidate()
+    site_response_cache_service.invalidate_site(site_id)
+
 
 def remove_news_channel(
     site_id: SiteID, news_channel_id: NewsChannelID
@@ -247,3 +272,6 @@ def remove_news_channel(
 
     db_site.news_channels.remove(news_channel)
     db.session.commit()
+
+    _site_cache.invalidate()
+    site_response_cache_service.invalidate_site(site_id)
@@ -10,6 +10,7 @@ from sqlalchemy import delete, select
 
 from byceps.database import db, upsert
 
+from . import site_response_cache_service
 from .dbmodels import DbSiteSetting
 from .models import SiteID, SiteSetting
 
@@ -21,6 +22,8 @@ def create_setting(site_id: SiteID, name: str, value: str) -> SiteSetting:
     db.session.add(db_setting)
     db.session.commit()
 
+    site_response_cache_service.invalidate_site(site_id)
+
     return _db_entity_to_site_setting(db_setting)
 
 
@@ -41,6 +44,8 @@ def create_or_update_setting(
 
     upsert(table, identifier, replacement)
 
+    site_response_cache_service.invalidate_site(site_id)
+
     return find_setting(site_id, name)
 
 
@@ -56,6 +61,8 @@ def remove_setting(site_id: SiteID, name: str) -> None:
     )
     db.session.commit()
 
+    site_response_cache_service.invalidate_site(site_id)
+
 
 def find_setting(site_id: SiteID, name: str) -> SiteSetting | None:
     """Return the setting for that site and with that name, or `None`
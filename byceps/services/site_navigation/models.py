@@ -64,6 +64,17 @@ class NavMenuAggregate(NavMenu):
     items: list[NavItem]
 
 
+@dataclass(frozen=True)
+class SiteNavIndex:
+    """The visible menus and items of a site, indexed for lookups."""
+
+    site_id: SiteID
+    menu_ids_by_name_and_language_code: dict[tuple[str, str], NavMenuID]
+    items_by_menu_id: dict[NavMenuID, list[NavItem]]
+    submenu_ids_by_language_code_and_page_name: dict[tuple[str, str], NavMenuID]
+    submenu_ids_by_language_code_and_view_name: dict[tuple[str, str], NavMenuID]
+
+
 @dataclass(frozen=True)
 class ViewType:
     name: str
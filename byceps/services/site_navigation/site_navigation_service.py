@@ -7,11 +7,14 @@ byceps.services.site_navigation.site_navigation_service
 """
 
 from collections.abc import Iterable
+from datetime import timedelta
 
 from sqlalchemy import delete, select
 
 from byceps.database import db
+from byceps.services.site import site_response_cache_service
 from byceps.services.site.models import SiteID
+from byceps.util.cache import VersionedLocalCache
 from byceps.util.iterables import find, index_of
 from byceps.util.result import Err, Ok, Result
 
@@ -25,10 +28,17 @@ from .models import (
     NavMenuAggregate,
     NavMenuID,
     NavMenuTree,
+    SiteNavIndex,
     ViewType,
 )
 
 
+# Menus rarely change, but are looked up several times per request.
+_index_cache: VersionedLocalCache[SiteID, SiteNavIndex] = VersionedLocalCache(
+    'site-navigation', 'site-navigation', maxsize=64, ttl=timedelta(minutes=5)
+)
+
+
 def create_menu(
     site_id: SiteID,
     name: str,
@@ -44,6 +54,8 @@ def create_menu(
     db.session.add(db_menu)
     db.session.commit()
 
+    _invalidate_caches(site_id)
+
     return _db_entity_to_menu(db_menu)
 
 
@@ -62,6 +74,8 @@ def update_menu(
 
         db.session.commit()
 
+        _invalidate_caches(db_menu.site_id)
+
         return db_menu
 
     return _get_db_menu(menu_id).map(_update_menu).map(_db_entity_to_menu)
@@ -92,6 +106,8 @@ def create_item(
         db_menu.items.append(db_item)
         db.session.commit()
 
+        _invalidate_caches(db_menu.site_id)
+
         return db_item
 
     return _get_db_menu(menu_id).map(_create_item).map(_db_entity_to_item)
@@ -116,6 +132,8 @@ def update_item(
 
         db.session.commit()
 
+        _invalidate_caches(db_item.menu.site_id)
+
         return db_item
 
     return _get_db_item(item_id).map(_update_item).map(_db_entity_to_item)
@@ -125,12 +143,24 @@ def delete_item(item_id: NavItemID) -> Result[None, str]:
     """Delete a menu item."""
 
     def _delete_item(db_item: DbNavItem) -> None:
+        site_id = db_item.menu.site_id
+
         db.session.execute(delete(DbNavItem).where(DbNavItem.id == db_item.id))
         db.session.commit()
 
+        _invalidate_caches(site_id)
+
     return _get_db_item(item_id).map(_delete_item)
 
 
+def _invalidate_caches(site_id: SiteID) -> None:
+    """Discard the cached navigation indexes (in all processes) and the
+    site's cached pages, which include its menus.
+    """
+    _index_cache.invalidate()
+    site_response_cache_service.invalidate_site(site_id)
+
+
 def find_submenu_id_for_page(
     site_id: SiteID, language_code: str, page_name: str
 ) -> NavMenuID | None:
@@ -139,18 +169,10 @@ def find_submenu_id_for_page(
     If the page is referenced from multiple submenus, the one whose name
     comes first in alphabetical order is chosen.
     """
-    return db.session.scalars(
-        select(DbNavItem.menu_id)
-        .join(DbNavMenu)
-        .filter(DbNavMenu.site_id == site_id)
-        .filter(DbNavMenu.language_code == language_code)
-        .filter(DbNavMenu.hidden == False)  # noqa: E712
-        .filter(DbNavMenu.parent_menu_id.is_not(None))  # submenus only
-        .filter(DbNavItem._target_type == NavItemTargetType.page.name)
-        .filter(DbNavItem.target == page_name)
-        .filter(DbNavItem.hidden == False)  # noqa: E712
-        .order_by(DbNavMenu.name)
-    ).first()
+    index = get_site_nav_index(site_id)
+    return index.submenu_ids_by_language_code_and_page_name.get(
+        (language_code, page_name)
+    )
 
 
 def find_submenu_id_for_view(
@@ -161,18 +183,10 @@ def find_submenu_id_for_view(
     If the view is referenced from multiple submenus, the one whose name
     comes first in alphabetical order is chosen.
     """
-    return db.session.scalars(
-        select(DbNavItem.menu_id)
-        .join(DbNavMenu)
-        .filter(DbNavMenu.site_id == site_id)
-        .filter(DbNavMenu.language_code == language_code)
-        .filter(DbNavMenu.hidden == False)  # noqa: E712
-        .filter(DbNavMenu.parent_menu_id.is_not(None))  # submenus only
-        .filter(DbNavItem._target_type == NavItemTargetType.view.name)
-        .filter(DbNavItem.target == view_name)
-        .filter(DbNavItem.hidden == False)  # noqa: E712
-        .order_by(DbNavMenu.name)
-    ).first()
+    index = get_site_nav_index(site_id)
+    return index.submenu_ids_by_language_code_and_view_name.get(
+        (language_code, view_name)
+    )
 
 
 def find_menu(menu_id: NavMenuID) -> NavMenu | None:
@@ -280,21 +294,14 @@ def _get_db_item(item_id: NavItemID) -> Result[DbNavItem, str]:
     return Ok(db_item)
 
 
-def get_items_for_menu_id(menu_id: NavMenuID) -> list[NavItem]:
+def get_items_for_menu_id(site_id: SiteID, menu_id: NavMenuID) -> list[NavItem]:
     """Return the items of a menu.
 
-    An empty list is returned if the menu does not exist, is hidden, or
-    contains no visible items.
+    An empty list is returned if the menu does not exist (for that
+    site), is hidden, or contains no visible items.
     """
-    db_items = db.session.scalars(
-        select(DbNavItem)
-        .join(DbNavMenu)
-        .filter(DbNavMenu.id == menu_id)
-        .filter(DbNavMenu.hidden == False)  # noqa: E712
-        .filter(DbNavItem.hidden == False)  # noqa: E712
-    )
-
-    return _db_entities_to_items(db_items)
+    index = get_site_nav_index(site_id)
+    return index.items_by_menu_id.get(menu_id, [])
 
 
 def get_items_for_menu(
@@ -305,17 +312,94 @@ def get_items_for_menu(
     An empty list is returned if the menu does not exist, is hidden, or
     contains no visible items.
     """
-    db_items = db.session.scalars(
-        select(DbNavItem)
-        .join(DbNavMenu)
+    index = get_site_nav_index(site_id)
+
+    menu_id = index.menu_ids_by_name_and_language_code.get(
+        (name, language_code)
+    )
+    if menu_id is None:
+        return []
+
+    return index.items_by_menu_id.get(menu_id, [])
+
+
+def get_site_nav_index(site_id: SiteID) -> SiteNavIndex:
+    """Return the index of the site's visible menus and items.
+
+    The index is cached per process, and rebuilt after any menu or item
+    has been changed.
+    """
+    return _index_cache.get_or_set(site_id, lambda: _build_index(site_id))
+
+
+def _build_index(site_id: SiteID) -> SiteNavIndex:
+    """Build the index from the site's visible menus and items,
+    fetched in a single query.
+    """
+    rows = db.session.execute(
+        select(DbNavMenu, DbNavItem)
+        .outerjoin(
+            DbNavItem,
+            db.and_(
+                DbNavItem.menu_id == DbNavMenu.id,
+                DbNavItem.hidden == False,  # noqa: E712
+            ),
+        )
         .filter(DbNavMenu.site_id == site_id)
-        .filter(DbNavMenu.name == name)
-        .filter(DbNavMenu.language_code == language_code)
         .filter(DbNavMenu.hidden == False)  # noqa: E712
-        .filter(DbNavItem.hidden == False)  # noqa: E712
+    ).all()
+
+    menus_by_id: dict[NavMenuID, NavMenu] = {}
+    items: list[NavItem] = []
+    for db_menu, db_item in rows:
+        if db_menu.id not in menus_by_id:
+            menus_by_id[db_menu.id] = _db_entity_to_menu(db_menu)
+
+        if db_item is not None:
+            items.append(_db_entity_to_item(db_item))
+
+    return _index_menus_and_items(site_id, menus_by_id.values(), items)
+
+
+def _index_menus_and_items(
+    site_id: SiteID, menus: Iterable[NavMenu], items: Iterable[NavItem]
+) -> SiteNavIndex:
+    """Index the (visible) menus and items for lookups."""
+    menus_by_id = {menu.id: menu for menu in menus}
+
+    items_by_menu_id: dict[NavMenuID, list[NavItem]] = {
+        menu_id: [] for menu_id in menus_by_id
+    }
+    for item in sorted(items, key=lambda item: item.position):
+        items_by_menu_id[item.menu_id].append(item)
+
+    submenu_ids_by_page_name: dict[tuple[str, str], NavMenuID] = {}
+    submenu_ids_by_view_name: dict[tuple[str, str], NavMenuID] = {}
+    # Of multiple submenus referencing the same target, let the one
+    # whose name comes first win.
+    submenus = sorted(
+        (menu for menu in menus_by_id.values() if menu.parent_menu_id),
+        key=lambda menu: menu.name,
+    )
+    for menu in submenus:
+        for item in items_by_menu_id[menu.id]:
+            key = (menu.language_code, item.target)
+            match item.target_type:
+                case NavItemTargetType.page:
+                    submenu_ids_by_page_name.setdefault(key, menu.id)
+                case NavItemTargetType.view:
+                    submenu_ids_by_view_name.setdefault(key, menu.id)
+
+    return SiteNavIndex(
+        site_id=site_id,
+        menu_ids_by_name_and_language_code={
+            (menu.name, menu.language_code): menu.id
+            for menu in menus_by_id.values()
+        },
+        items_by_menu_id=items_by_menu_id,
+        submenu_ids_by_language_code_and_page_name=submenu_ids_by_page_name,
+        submenu_ids_by_language_code_and_view_name=submenu_ids_by_view_name,
     )
-
-    return _db_entities_to_items(db_items)
 
 
 def move_item_up(item_id: NavItemID) -> Result[NavItem, str]:
@@ -332,6 +416,8 @@ def move_item_up(item_id: NavItemID) -> Result[NavItem, str]:
 
         db.session.commit()
 
+        _invalidate_caches(db_item.menu.site_id)
+
         return Ok(db_item)
 
     return _get_db_item(item_id).and_then(_move_item_up).map(_db_entity_to_item)
@@ -352,6 +438,8 @@ def move_item_down(item_id: NavItemID) -> Result[NavItem, str]:
 
         db.session.commit()
 
+        _invalidate_caches(db_item.menu.site_id)
+
         return Ok(db_item)
 
     return (
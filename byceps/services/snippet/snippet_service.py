@@ -18,6 +18,7 @@ from byceps.events.snippet import (
     SnippetDeletedEvent,
     SnippetUpdatedEvent,
 )
+from byceps.services.site import site_response_cache_service
 from byceps.services.user import user_service
 from byceps.services.user.models.user import User
 from byceps.util.result import Err, Ok, Result
@@ -95,6 +96,8 @@ def create_snippet(
 
     db.session.commit()
 
+    site_response_cache_service.invalidate_snippets()
+
     event = SnippetCreatedEvent(
         occurred_at=version.created_at,
         initiator=EventUser.from_user(creator),
@@ -123,6 +126,8 @@ def update_snippet(
 
     db.session.commit()
 
+    site_response_cache_service.invalidate_snippets()
+
     event = SnippetUpdatedEvent(
         occurred_at=version.created_at,
         initiator=EventUser.from_user(creator),
@@ -175,6 +180,8 @@ def delete_snippet(
         db.session.rollback()
         return False, None
 
+    site_response_cache_service.invalidate_snippets()
+
     event = SnippetDeletedEvent(
         occurred_at=datetime.utcnow(),
         initiator=EventUser.from_user(initiator) if initiator else None,
@@ -21,7 +21,7 @@ from .dbmodels.category import DbTicketCategory
 from .dbmodels.ticket import DbTicket
 from .dbmodels.ticket_bundle import DbTicketBundle
 from .models.ticket import TicketBundleID, TicketCategoryID
-from .ticket_creation_service import build_tickets, TicketCreationFailedError
+from .ticket_creation_service import insert_tickets, TicketCreationFailedError
 from .ticket_revocation_service import build_ticket_revoked_log_entry
 
 
@@ -49,18 +49,15 @@ def create_bundle(
     )
     db.session.add(db_bundle)
 
-    db_tickets = list(
-        build_tickets(
-            party_id,
-            category_id,
-            owner,
-            ticket_quantity,
-            bundle=db_bundle,
-            order_number=order_number,
-            user=user,
-        )
+    insert_tickets(
+        party_id,
+        category_id,
+        owner,
+        ticket_quantity,
+        bundle=db_bundle,
+        order_number=order_number,
+        user=user,
     )
-    db.session.add_all(db_tickets)
 
     db.session.commit()
 
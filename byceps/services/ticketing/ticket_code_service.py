@@ -6,22 +6,37 @@ byceps.services.ticketing.ticket_code_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Iterable
+from dataclasses import dataclass
 from random import sample
 from string import ascii_uppercase, digits
+from threading import Lock
 
+from sqlalchemy import select
+
+from byceps.database import db
+from byceps.services.party.models import PartyID
 from byceps.util.result import Err, Ok, Result
 
+from .dbmodels.ticket import DbTicket
 from .models.ticket import TicketCode
 
 
 def generate_ticket_codes(
     requested_quantity: int,
+    *,
+    excluded_codes: Iterable[TicketCode] = frozenset(),
 ) -> Result[set[TicketCode], str]:
-    """Generate a number of ticket codes."""
+    """Generate a number of ticket codes.
+
+    Generated codes are unique among themselves and not among the
+    excluded codes.
+    """
     codes: set[TicketCode] = set()
+    excluded_codes = set(excluded_codes)
 
     for _ in range(requested_quantity):
-        generation_result = _generate_ticket_code_not_in(codes)
+        generation_result = _generate_ticket_code_not_in(codes | excluded_codes)
 
         if generation_result.is_err():
             return Err(generation_result.unwrap_err())
@@ -37,9 +52,30 @@ def generate_ticket_codes(
             f'does not match requested quantity ({requested_quantity}).'
         )
 
+    _statistics.add(generated=requested_quantity)
+
     return Ok(codes)
 
 
+def find_used_codes(
+    party_id: PartyID, codes: Iterable[TicketCode]
+) -> set[TicketCode]:
+    """Return those of the codes that are already used by tickets for
+    the party.
+    """
+    codes = set(codes)
+    if not codes:
+        return set()
+
+    used_codes = db.session.scalars(
+        select(DbTicket.code)
+        .filter(DbTicket.party_id == party_id)
+        .filter(DbTicket.code.in_(codes))
+    ).all()
+
+    return {TicketCode(code) for code in used_codes}
+
+
 def _generate_ticket_code_not_in(
     codes: set[TicketCode], *, max_attempts: int = 4
 ) -> Result[TicketCode, str]:
@@ -49,6 +85,8 @@ def _generate_ticket_code_not_in(
         if code not in codes:
             return Ok(code)
 
+        _statistics.add(in_memory_collisions=1)
+
     return Err(
         f'Could not generate unique ticket code after {max_attempts} attempts.'
     )
@@ -74,3 +112,59 @@ def is_ticket_code_wellformed(code: str) -> bool:
     return len(code) == _CODE_LENGTH and set(code).issubset(
         _ALLOWED_CODE_SYMBOLS
     )
+
+
+# -------------------------------------------------------------------- #
+# statistics
+
+
+@dataclass(frozen=True)
+class TicketCodeGenerationStatistics:
+    generated: int
+    in_memory_collisions: int
+    collisions_with_existing: int
+    regeneration_rounds: int
+    insert_conflicts: int
+
+
+class _Statistics:
+    """Counters of this process, to assess how often generated codes
+    collide as parties fill up.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._counts = dict.fromkeys(
+            TicketCodeGenerationStatistics.__dataclass_fields__, 0
+        )
+
+    def add(self, **deltas: int) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                self._counts[name] += delta
+
+    def get(self) -> TicketCodeGenerationStatistics:
+        with self._lock:
+            return TicketCodeGenerationStatistics(**self._counts)
+
+
+_statistics = _Statistics()
+
+
+def record_collisions_with_existing(count: int) -> None:
+    """Record that generated codes were already used by tickets and had
+    to be regenerated.
+    """
+    _statistics.add(collisions_with_existing=count, regeneration_rounds=1)
+
+
+def record_insert_conflict() -> None:
+    """Record that inserting tickets failed due to a code that has been
+    used concurrently, requiring to retry the whole batch.
+    """
+    _statistics.add(insert_conflicts=1)
+
+
+def get_generation_statistics() -> TicketCodeGenerationStatistics:
+    """Return the code generation statistics of this process."""
+    return _statistics.get()
@@ -6,9 +6,9 @@ byceps.services.ticketing.ticket_creation_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Iterator
-
+from sqlalchemy import insert
 from sqlalchemy.exc import IntegrityError
+import structlog
 from tenacity import retry, retry_if_exception_type, stop_after_attempt
 
 from byceps.database import db
@@ -19,7 +19,10 @@ from byceps.services.user.models.user import User
 from . import ticket_code_service
 from .dbmodels.ticket import DbTicket
 from .dbmodels.ticket_bundle import DbTicketBundle
-from .models.ticket import TicketCategoryID
+from .models.ticket import TicketCategoryID, TicketCode
+
+
+log = structlog.get_logger()
 
 
 class TicketCreationFailedError(Exception):
@@ -70,29 +73,21 @@ def create_tickets(
     user: User | None = None,
 ) -> list[DbTicket]:
     """Create a number of tickets of the same category for a single owner."""
-    db_tickets = list(
-        build_tickets(
-            party_id,
-            category_id,
-            owner,
-            quantity,
-            order_number=order_number,
-            user=user,
-        )
+    db_tickets = insert_tickets(
+        party_id,
+        category_id,
+        owner,
+        quantity,
+        order_number=order_number,
+        user=user,
     )
 
-    db.session.add_all(db_tickets)
-
-    try:
-        db.session.commit()
-    except IntegrityError as exc:
-        db.session.rollback()
-        raise TicketCreationFailedWithConflictError(exc) from exc
+    db.session.commit()
 
     return db_tickets
 
 
-def build_tickets(
+def insert_tickets(
     party_id: PartyID,
     category_id: TicketCategoryID,
     owner: User,
@@ -101,24 +96,94 @@ def build_tickets(
     bundle: DbTicketBundle | None = None,
     order_number: OrderNumber | None = None,
     user: User | None = None,
-) -> Iterator[DbTicket]:
+) -> list[DbTicket]:
+    """Insert a number of tickets with codes not yet used for the party,
+    using a single multi-row INSERT statement.
+
+    Do not commit the session.
+    """
     if quantity < 1:
         raise ValueError('Ticket quantity must be positive.')
 
-    generation_result = ticket_code_service.generate_ticket_codes(quantity)
+    codes = _generate_codes_unused_for_party(party_id, quantity)
+
+    if bundle is not None:
+        # Obtain the bundle's ID.
+        db.session.flush()
+
+    rows = [
+        {
+            'party_id': party_id,
+            'code': code,
+            'bundle_id': bundle.id if bundle is not None else None,
+            'category_id': category_id,
+            'owned_by_id': owner.id,
+            'order_number': order_number,
+            'used_by_id': user.id if user else None,
+        }
+        for code in codes
+    ]
 
+    try:
+        db_tickets = db.session.scalars(
+            insert(DbTicket).returning(DbTicket), rows
+        ).all()
+    except IntegrityError as exc:
+        # A code has been used concurrently since it has been checked.
+        db.session.rollback()
+        ticket_code_service.record_insert_conflict()
+        raise TicketCreationFailedWithConflictError(exc) from exc
+
+    return list(db_tickets)
+
+
+def _generate_codes_unused_for_party(
+    party_id: PartyID, quantity: int, *, max_rounds: int = 4
+) -> set[TicketCode]:
+    """Generate codes, check them against those already used for the
+    party in a single query, and regenerate only the colliding ones (in
+    up to `max_rounds` rounds).
+    """
+    generation_result = ticket_code_service.generate_ticket_codes(quantity)
     if generation_result.is_err():
         raise TicketCreationFailedError(generation_result.unwrap_err())
 
     codes = generation_result.unwrap()
+    used_codes: set[TicketCode] = set()
+
+    for regeneration_round in range(max_rounds + 1):
+        colliding_codes = ticket_code_service.find_used_codes(party_id, codes)
+        if not colliding_codes:
+            return codes
+
+        log.info(
+            'Generated ticket codes collide with existing ones',
+            party_id=party_id,
+            quantity=quantity,
+            collision_count=len(colliding_codes),
+        )
+
+        if regeneration_round == max_rounds:
+            break
 
-    for code in codes:
-        yield DbTicket(
-            party_id,
-            code,
-            category_id,
-            owner.id,
-            bundle=bundle,
-            order_number=order_number,
-            used_by_id=user.id if user else None,
+        ticket_code_service.record_collisions_with_existing(
+            len(colliding_codes)
         )
+
+        codes -= colliding_codes
+        used_codes |= colliding_codes
+
+        regeneration_result = ticket_code_service.generate_ticket_codes(
+            len(colliding_codes), excluded_codes=codes | used_codes
+        )
+        if regeneration_result.is_err():
+            raise TicketCreationFailedWithConflictError(
+                regeneration_result.unwrap_err()
+            )
+
+        codes |= regeneration_result.unwrap()
+
+    raise TicketCreationFailedWithConflictError(
+        f'Could not generate ticket codes unused for party "{party_id}" '
+        f'after {max_rounds} rounds.'
+    )
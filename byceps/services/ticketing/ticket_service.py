@@ -327,18 +327,6 @@ def get_tickets_with_details_for_party_paginated(
     return paginate(stmt, page, per_page)
 
 
-def count_revoked_tickets_for_party(party_id: PartyID) -> int:
-    """Return the number of revoked tickets for that party."""
-    return (
-        db.session.scalar(
-            select(db.func.count(DbTicket.id))
-            .filter_by(party_id=party_id)
-            .filter_by(revoked=True)
-        )
-        or 0
-    )
-
-
 def count_sold_tickets_for_party(party_id: PartyID) -> int:
     """Return the number of "sold" (i.e. generated and not revoked)
     tickets for that party.
@@ -367,6 +355,40 @@ def count_tickets_checked_in_for_party(party_id: PartyID) -> int:
     )
 
 
+def count_tickets_for_parties(
+    party_ids: set[PartyID],
+) -> dict[PartyID, tuple[int, int, int]]:
+    """Return the numbers of revoked, "sold" (i.e. generated and not
+    revoked), and checked-in tickets for each of the parties.
+    """
+    counts_by_party_id = dict.fromkeys(party_ids, (0, 0, 0))
+
+    if not party_ids:
+        return counts_by_party_id
+
+    ticket_count = db.func.count(DbTicket.id)
+
+    rows = db.session.execute(
+        select(
+            DbTicket.party_id,
+            ticket_count.filter(DbTicket.revoked == True),  # noqa: E712
+            ticket_count.filter(DbTicket.revoked == False),  # noqa: E712
+            ticket_count.filter(DbTicket.user_checked_in == True),  # noqa: E712
+        )
+        .filter(DbTicket.party_id.in_(party_ids))
+        .group_by(DbTicket.party_id)
+    ).all()
+
+    for party_id, revoked_count, sold_count, checked_in_count in rows:
+        counts_by_party_id[party_id] = (
+            revoked_count,
+            sold_count,
+            checked_in_count,
+        )
+
+    return counts_by_party_id
+
+
 def get_ticket_sale_stats(party_id: PartyID) -> TicketSaleStats:
     """Return the number of maximum and sold tickets, respectively."""
     party = party_service.get_party(party_id)
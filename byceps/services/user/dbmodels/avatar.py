@@ -30,6 +30,12 @@ _ABSOLUTE_URL_PATH_PREFIX = '/data/global/users/avatars/'
 
 FALLBACK_AVATAR_URL_PATH = '/static/avatar_fallback.svg'
 
+# Square sizes (edge lengths) of the variants created from an uploaded
+# image, each in the uploaded image's type as well as in WebP format.
+VARIANT_SIZES = frozenset([64, 128, 512])
+
+DEFAULT_VARIANT_SIZE = max(VARIANT_SIZES)
+
 
 class DbUserAvatar(db.Model):
     """An avatar image uploaded by a user."""
@@ -41,9 +47,15 @@ class DbUserAvatar(db.Model):
     )
     created_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
     _image_type: Mapped[str] = mapped_column('image_type', db.UnicodeText)
+    # Avatars uploaded before variants were introduced only exist as
+    # a single file.
+    has_variants: Mapped[bool] = mapped_column(
+        default=False, server_default=db.false()
+    )
 
     def __init__(self, image_type: ImageType) -> None:
         self.image_type = image_type
+        self.has_variants = True
 
     @hybrid_property
     def image_type(self) -> ImageType:
@@ -55,14 +67,28 @@ class DbUserAvatar(db.Model):
 
     @property
     def filename(self) -> Path:
+        if self.has_variants:
+            return self.get_variant_filename(
+                DEFAULT_VARIANT_SIZE, self.image_type
+            )
+
         name_without_suffix = str(self.id)
         suffix = '.' + self.image_type.name
         return Path(name_without_suffix).with_suffix(suffix)
 
+    def get_variant_filename(self, size: int, image_type: ImageType) -> Path:
+        return Path(str(self.id)) / f'{size}.{image_type.name}'
+
+    @property
+    def original_filename(self) -> Path:
+        """Return the filename of the uploaded image, which is only
+        kept until the variants have been created from it.
+        """
+        return Path(str(self.id)) / f'original.{self.image_type.name}'
+
     @property
     def path(self) -> Path:
-        path = current_app.config['PATH_DATA'] / 'global' / 'users' / 'avatars'
-        return path / self.filename
+        return get_avatars_path() / self.filename
 
     @property
     def url(self) -> str:
@@ -77,5 +103,9 @@ class DbUserAvatar(db.Model):
         )
 
 
+def get_avatars_path() -> Path:
+    return current_app.config['PATH_DATA'] / 'global' / 'users' / 'avatars'
+
+
 def get_absolute_url_path(filename: str) -> str:
     return _ABSOLUTE_URL_PATH_PREFIX + str(filename)
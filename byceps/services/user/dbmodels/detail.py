@@ -12,7 +12,7 @@ from typing import Any
 from sqlalchemy.ext.mutable import MutableDict
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from byceps.database import db
+from byceps.database import db, trigram_index
 from byceps.services.user.models.user import UserID
 from byceps.util.instances import ReprBuilder
 
@@ -21,6 +21,10 @@ class DbUserDetail(db.Model):
     """Detailed information about a specific user."""
 
     __tablename__ = 'user_details'
+    __table_args__ = (
+        trigram_index('ix_user_details_first_name_trgm', 'first_name'),
+        trigram_index('ix_user_details_last_name_trgm', 'last_name'),
+    )
 
     user_id: Mapped[UserID] = mapped_column(
         db.Uuid, db.ForeignKey('users.id'), primary_key=True
@@ -10,7 +10,7 @@ from datetime import datetime
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from byceps.database import db
+from byceps.database import db, trigram_index
 from byceps.services.user.models.user import UserAvatarID, UserID
 from byceps.util.instances import ReprBuilder
 
@@ -21,6 +21,11 @@ class DbUser(db.Model):
     """A user."""
 
     __tablename__ = 'users'
+    __table_args__ = (
+        db.Index('ix_users_created_at_id', 'created_at', 'id'),
+        trigram_index('ix_users_screen_name_trgm', 'screen_name'),
+        trigram_index('ix_users_email_address_trgm', 'email_address'),
+    )
 
     id: Mapped[UserID] = mapped_column(db.Uuid, primary_key=True)
     created_at: Mapped[datetime]
@@ -6,24 +6,37 @@ byceps.services.user.user_avatar_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+import re
 from typing import BinaryIO
 
 from sqlalchemy import select
+import structlog
 
 from byceps.database import db
+from byceps.services.authn.session import authn_session_cache_service
 from byceps.services.image import image_service
 from byceps.util import upload
-from byceps.util.image import create_thumbnail
+from byceps.util.image import create_thumbnails
 from byceps.util.image.models import Dimensions, ImageType
+from byceps.util.jobqueue import enqueue
 from byceps.util.result import Err, Ok, Result
 
-from . import user_log_service, user_service
-from .dbmodels.avatar import DbUserAvatar
+from . import user_cache_service, user_log_service, user_service
+from .dbmodels.avatar import (
+    DbUserAvatar,
+    DEFAULT_VARIANT_SIZE,
+    get_absolute_url_path,
+    get_avatars_path,
+    VARIANT_SIZES,
+)
 from .dbmodels.user import DbUser
 from .models.user import User, UserAvatarID, UserID
 
 
-MAXIMUM_DIMENSIONS = Dimensions(512, 512)
+log = structlog.get_logger()
+
+
+MAXIMUM_DIMENSIONS = Dimensions(DEFAULT_VARIANT_SIZE, DEFAULT_VARIANT_SIZE)
 
 
 def update_avatar_image(
@@ -31,11 +44,13 @@ def update_avatar_image(
     stream: BinaryIO,
     allowed_types: set[ImageType],
     initiator: User,
-    *,
-    maximum_dimensions: Dimensions = MAXIMUM_DIMENSIONS,
 ) -> Result[UserAvatarID, str]:
-    """Set a new avatar image for the user."""
-    db_user = user_service.get_db_user(user_id)
+    """Set a new avatar image for the user.
+
+    The uploaded image is only stored here. The variants to show are
+    created from it by a job, which then sets the avatar for the user.
+    """
+    user_service.get_db_user(user_id)  # Ensure the user exists.
 
     image_type_result = image_service.determine_image_type(
         stream, allowed_types
@@ -44,21 +59,70 @@ def update_avatar_image(
         return Err(image_type_result.unwrap_err())
 
     image_type = image_type_result.unwrap()
-    image_dimensions = image_service.determine_dimensions(stream)
-
-    image_too_large = image_dimensions > maximum_dimensions
-    if image_too_large or not image_dimensions.is_square:
-        stream = create_thumbnail(
-            stream, image_type.name, maximum_dimensions, force_square=True
-        )
 
     db_avatar = DbUserAvatar(image_type)
     db.session.add(db_avatar)
     db.session.commit()
 
     # Might raise `FileExistsError`.
-    upload.store(stream, db_avatar.path, create_parent_path_if_nonexistent=True)
+    upload.store(
+        stream,
+        get_avatars_path() / db_avatar.original_filename,
+        create_parent_path_if_nonexistent=True,
+    )
+
+    enqueue(process_avatar_image, db_avatar.id, user_id, initiator.id)
+
+    return Ok(db_avatar.id)
+
+
+def process_avatar_image(
+    avatar_id: UserAvatarID, user_id: UserID, initiator_id: UserID
+) -> None:
+    """Create the variants of the uploaded avatar image, then set the
+    avatar for the user.
+    """
+    db_avatar = get_db_avatar(avatar_id)
+
+    avatars_path = get_avatars_path()
+    original_path = avatars_path / db_avatar.original_filename
+
+    variant_dimensions = [Dimensions(size, size) for size in VARIANT_SIZES]
+    variant_types = {db_avatar.image_type, ImageType.webp}
+
+    variants = create_thumbnails(
+        original_path,
+        [image_type.name for image_type in variant_types],
+        variant_dimensions,
+        force_square=True,
+    )
+    for dimensions, image_type_name, stream in variants:
+        filename = db_avatar.get_variant_filename(
+            dimensions.width, ImageType[image_type_name]
+        )
+        upload.store_atomically(stream, avatars_path / filename)
+
+    db_user = user_service.get_db_user(user_id)
 
+    # Do not replace an avatar uploaded later whose variants happened
+    # to be created first.
+    if (db_user.avatar is not None) and (
+        db_user.avatar.created_at > db_avatar.created_at
+    ):
+        log.info(
+            'Newer avatar already set, not replacing it',
+            user_id=str(user_id),
+            avatar_id=str(avatar_id),
+        )
+    else:
+        _set_avatar(db_user, db_avatar, initiator_id)
+
+    upload.delete(original_path)
+
+
+def _set_avatar(
+    db_user: DbUser, db_avatar: DbUserAvatar, initiator_id: UserID
+) -> None:
     db_user.avatar_id = db_avatar.id
 
     db_log_entry = user_log_service.build_entry(
@@ -67,14 +131,15 @@ def update_avatar_image(
         {
             'avatar_id': str(db_avatar.id),
             'filename': str(db_avatar.filename),
-            'initiator_id': str(initiator.id),
+            'initiator_id': str(initiator_id),
         },
     )
     db.session.add(db_log_entry)
 
     db.session.commit()
 
-    return Ok(db_avatar.id)
+    authn_session_cache_service.invalidate_user(db_user.id)
+    user_cache_service.invalidate_user(db_user.id)
 
 
 def remove_avatar_image(user_id: UserID, initiator: User) -> None:
@@ -104,6 +169,9 @@ def remove_avatar_image(user_id: UserID, initiator: User) -> None:
 
     db.session.commit()
 
+    authn_session_cache_service.invalidate_user(user_id)
+    user_cache_service.invalidate_user(user_id)
+
 
 def get_db_avatar(avatar_id: UserAvatarID) -> DbUserAvatar:
     """Return the avatar with that ID, or raise exception if not found."""
@@ -122,21 +190,9 @@ def get_avatar_urls_for_users(
     user_ids: set[UserID],
 ) -> dict[UserID, str | None]:
     """Return the URLs of those users' current avatars."""
-    if not user_ids:
-        return {}
+    users = user_service.get_users(user_ids, include_avatars=True)
 
-    user_ids_and_db_avatars = db.session.execute(
-        select(
-            DbUser.id,
-            DbUserAvatar,
-        )
-        .join(DbUserAvatar, DbUser.avatar_id == DbUserAvatar.id)
-        .filter(DbUser.id.in_(user_ids))
-    ).all()
-
-    urls_by_user_id = {
-        user_id: db_avatar.url for user_id, db_avatar in user_ids_and_db_avatars
-    }
+    urls_by_user_id = {user.id: user.avatar_url for user in users}
 
     # Include all user IDs in result.
     return {user_id: urls_by_user_id.get(user_id) for user_id in user_ids}
@@ -156,3 +212,27 @@ def get_avatar_url_for_md5_email_address_hash(md5_hash: str) -> str | None:
         return None
 
     return db_avatar.url
+
+
+_VARIANT_URL_PATTERN = re.compile(
+    re.escape(get_absolute_url_path('')) + r'([0-9a-f-]{36})/\d+\.\w+'
+)
+
+
+def get_avatar_srcset(avatar_url: str | None) -> str | None:
+    """Return a `srcset` value listing the WebP variants of the avatar
+    at that URL, or `None` if the avatar has no variants.
+    """
+    if not avatar_url:
+        return None
+
+    match = _VARIANT_URL_PATTERN.fullmatch(avatar_url)
+    if match is None:
+        return None
+
+    avatar_id = match.group(1)
+
+    return ', '.join(
+        get_absolute_url_path(f'{avatar_id}/{size}.webp') + f' {size}w'
+        for size in sorted(VARIANT_SIZES)
+    )
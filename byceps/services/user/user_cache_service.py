@@ -0,0 +1,87 @@
+"""
+byceps.services.user.user_cache_service
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Cache the users (including their avatar URLs) shown in listings, i.e.
+the data needed to display them.
+
+Users are cached for the current request as well as, for a short time,
+process-locally. Changing any user clears the process-local caches of
+all processes.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Callable, Iterable
+from datetime import timedelta
+
+from flask import g, has_request_context
+
+from byceps.util.cache import VersionedLocalCache
+
+from .models.user import User, UserID
+
+
+CACHE_TTL = timedelta(minutes=1)
+
+
+_local_cache: VersionedLocalCache[UserID, User] = VersionedLocalCache(
+    'users-for-display', 'users', maxsize=8192, ttl=CACHE_TTL
+)
+
+
+def get_users(
+    user_ids: set[UserID],
+    load_users: Callable[[set[UserID]], Iterable[User]],
+) -> dict[UserID, User]:
+    """Return the users with those IDs, indexed by ID.
+
+    Only the users not cached are loaded, all at once. Unknown user IDs
+    are omitted (and not cached).
+    """
+    request_cache = _get_request_cache()
+
+    users_by_id = {}
+    missing_user_ids = set()
+
+    for user_id in user_ids:
+        user = request_cache.get(user_id)
+        if user is None:
+            user = _local_cache.get(user_id)
+            if user is not None:
+                request_cache[user_id] = user
+
+        if user is not None:
+            users_by_id[user_id] = user
+        else:
+            missing_user_ids.add(user_id)
+
+    if missing_user_ids:
+        for user in load_users(missing_user_ids):
+            users_by_id[user.id] = user
+            request_cache[user.id] = user
+            _local_cache.set(user.id, user)
+
+    return users_by_id
+
+
+def invalidate_user(user_id: UserID) -> None:
+    """Remove the user from the caches.
+
+    Call this after changing what is cached about the user (screen
+    name, avatar, flags, locale).
+    """
+    _get_request_cache().pop(user_id, None)
+    _local_cache.invalidate()
+
+
+def _get_request_cache() -> dict[UserID, User]:
+    """Return the cache for the current request.
+
+    Outside of requests, return a new (and thus empty) dictionary.
+    """
+    if not has_request_context():
+        return {}
+
+    return g.setdefault('users_for_display', {})
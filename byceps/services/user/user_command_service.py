@@ -20,10 +20,17 @@ from byceps.events.user import (
     UserEmailAddressChangedEvent,
     UserScreenNameChangedEvent,
 )
+from byceps.services.authn.session import authn_session_cache_service
 from byceps.services.authz import authz_service
 from byceps.services.authz.models import RoleID
+from byceps.services.newsletter import newsletter_command_service
 
-from . import user_domain_service, user_log_service, user_service
+from . import (
+    user_cache_service,
+    user_domain_service,
+    user_log_service,
+    user_service,
+)
 from .dbmodels.detail import DbUserDetail
 from .dbmodels.user import DbUser
 from .models.log import UserLogEntry
@@ -49,6 +56,8 @@ def initialize_account(
 
     _persist_account_initialization(user.id, log_entry)
 
+    user_cache_service.invalidate_user(user.id)
+
     if assign_roles:
         _assign_roles(user, initiator=initiator)
 
@@ -60,6 +69,8 @@ def _persist_account_initialization(
 
     db_user.initialized = True
 
+    newsletter_command_service.update_subscriber_eligibility(user_id)
+
     db_log_entry = user_log_service.to_db_entry(log_entry)
     db.session.add(db_log_entry)
 
@@ -92,6 +103,9 @@ def suspend_account(
 
     _persist_account_suspension(event, log_entry)
 
+    authn_session_cache_service.invalidate_user(user.id)
+    user_cache_service.invalidate_user(user.id)
+
     return event
 
 
@@ -102,6 +116,8 @@ def _persist_account_suspension(
 
     db_user.suspended = True
 
+    newsletter_command_service.update_subscriber_eligibility(db_user.id)
+
     db_log_entry = user_log_service.to_db_entry(log_entry)
     db.session.add(db_log_entry)
 
@@ -118,6 +134,8 @@ def unsuspend_account(
 
     _persist_account_unsuspension(event, log_entry)
 
+    user_cache_service.invalidate_user(user.id)
+
     return event
 
 
@@ -128,6 +146,8 @@ def _persist_account_unsuspension(
 
     db_user.suspended = False
 
+    newsletter_command_service.update_subscriber_eligibility(db_user.id)
+
     db_log_entry = user_log_service.to_db_entry(log_entry)
     db.session.add(db_log_entry)
 
@@ -148,6 +168,9 @@ def change_screen_name(
 
     _persist_screen_name_change(event, log_entry)
 
+    authn_session_cache_service.invalidate_user(user.id)
+    user_cache_service.invalidate_user(user.id)
+
     return event
 
 
@@ -201,6 +224,8 @@ def _persist_email_address_change(
     db_user.email_address = new_email_address
     db_user.email_address_verified = verified
 
+    newsletter_command_service.update_subscriber_eligibility(db_user.id)
+
     db_log_entry = user_log_service.to_db_entry(log_entry)
     db.session.add(db_log_entry)
 
@@ -214,6 +239,9 @@ def update_locale(user_id: UserID, locale: Locale | None) -> None:
     db_user.locale = locale.language if (locale is not None) else None
     db.session.commit()
 
+    authn_session_cache_service.invalidate_user(user_id)
+    user_cache_service.invalidate_user(user_id)
+
 
 def update_user_details(
     user_id: UserID,
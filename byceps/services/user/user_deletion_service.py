@@ -13,7 +13,9 @@ from byceps.events.user import UserAccountDeletedEvent
 from byceps.services.authn.password import authn_password_service
 from byceps.services.authn.session import authn_session_service
 from byceps.services.authz import authz_service
+from byceps.services.newsletter import newsletter_command_service
 from byceps.services.user import (
+    user_cache_service,
     user_domain_service,
     user_log_service,
     user_service,
@@ -34,9 +36,11 @@ def delete_account(
 
     _persist_account_deletion(user, initiator, log_entry)
 
+    # Also invalidates cached current user components.
     authn_session_service.delete_session_tokens_for_user(user.id)
     authn_password_service.delete_password_hash(user.id)
     verification_token_service.delete_tokens_for_user(user.id)
+    user_cache_service.invalidate_user(user.id)
 
     return event
 
@@ -50,6 +54,8 @@ def _persist_account_deletion(
 
     _anonymize_account(db_user)
 
+    newsletter_command_service.update_subscriber_eligibility(db_user.id)
+
     db_log_entry = user_log_service.to_db_entry(log_entry)
     db.session.add(db_log_entry)
 
@@ -16,6 +16,7 @@ from byceps.events.user import (
 )
 from byceps.services.email import email_config_service, email_service
 from byceps.services.email.models import NameAndAddress
+from byceps.services.newsletter import newsletter_command_service
 from byceps.services.site import site_service
 from byceps.services.site.models import SiteID
 from byceps.services.user import (
@@ -135,6 +136,8 @@ def _persist_email_address_confirmation(
 
     db_user.email_address_verified = True
 
+    newsletter_command_service.update_subscriber_eligibility(user_id)
+
     db_log_entry = user_log_service.to_db_entry(log_entry)
     db.session.add(db_log_entry)
 
@@ -173,6 +176,8 @@ def _persist_email_address_invalidation(
 
     db_user.email_address_verified = False
 
+    newsletter_command_service.update_subscriber_eligibility(user_id)
+
     db_log_entry = user_log_service.to_db_entry(log_entry)
     db.session.add(db_log_entry)
 
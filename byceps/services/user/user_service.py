@@ -11,9 +11,16 @@ from datetime import datetime, timedelta
 from sqlalchemy import select
 from sqlalchemy.sql import Select
 
-from byceps.database import db, paginate, Pagination
+from byceps.database import (
+    db,
+    KeysetCountMode,
+    KeysetPagination,
+    paginate_by_keyset,
+    rank_by_similarity,
+)
 from byceps.services.user.models.user import UserID
 
+from . import user_cache_service
 from .dbmodels.avatar import DbUserAvatar
 from .dbmodels.detail import DbUserDetail
 from .dbmodels.user import DbUser
@@ -120,10 +127,26 @@ def get_users(
     """Return the users with those IDs.
 
     Their respective avatars' URLs are included, if requested.
+
+    Users with avatars are meant to be displayed, and are cached.
     """
     if not user_ids:
         return set()
 
+    if include_avatars:
+        users_by_id = user_cache_service.get_users(
+            user_ids, _load_users_with_avatars
+        )
+        return set(users_by_id.values())
+
+    return _load_users(user_ids, include_avatars=False)
+
+
+def _load_users_with_avatars(user_ids: set[UserID]) -> set[User]:
+    return _load_users(user_ids, include_avatars=True)
+
+
+def _load_users(user_ids: set[UserID], *, include_avatars: bool) -> set[User]:
     rows = (
         db.session.execute(
             _get_user_stmt(include_avatars).filter(
@@ -490,24 +513,22 @@ def get_users_created_since(
 
 
 def get_users_paginated(
-    page: int,
     per_page: int,
     *,
+    after: str | None = None,
+    before: str | None = None,
     search_term: str | None = None,
     user_filter: UserFilter | None = None,
-) -> Pagination:
-    """Return the users to show on the specified page, optionally
-    filtered by search term or flags.
+    count_mode: KeysetCountMode = KeysetCountMode.none,
+) -> KeysetPagination:
+    """Return the users (newest first) to show after or before the user
+    the cursor refers to, optionally filtered by search term or flags.
     """
-    stmt = (
-        select(DbUser)
-        .options(
-            db.joinedload(DbUser.detail).load_only(
-                DbUserDetail.first_name, DbUserDetail.last_name
-            ),
-            db.joinedload(DbUser.avatar),
-        )
-        .order_by(DbUser.created_at.desc())
+    stmt = select(DbUser).options(
+        db.joinedload(DbUser.detail).load_only(
+            DbUserDetail.first_name, DbUserDetail.last_name
+        ),
+        db.joinedload(DbUser.avatar),
     )
 
     stmt = _filter_users(stmt, user_filter)
@@ -515,8 +536,14 @@ def get_users_paginated(
     if search_term:
         stmt = _filter_by_search_term(stmt, search_term)
 
-    return paginate(
-        stmt, page, per_page, item_mapper=_db_entity_to_user_for_admin
+    return paginate_by_keyset(
+        stmt,
+        [DbUser.created_at, DbUser.id],
+        per_page,
+        after=after,
+        before=before,
+        count_mode=count_mode,
+        item_mapper=_db_entity_to_user_for_admin,
     )
 
 
@@ -544,19 +571,66 @@ def _filter_users(
             return stmt
 
 
+def search_users(search_term: str, limit: int) -> list[UserForAdmin]:
+    """Return the users matching the search term, best matches first."""
+    terms = search_term.split()
+    if not terms:
+        return []
+
+    rank = rank_by_similarity(
+        terms,
+        DbUser.screen_name,
+        DbUser.email_address,
+        DbUserDetail.first_name,
+        DbUserDetail.last_name,
+    )
+
+    stmt = (
+        select(DbUser)
+        .outerjoin(DbUserDetail)
+        .options(
+            db.contains_eager(DbUser.detail),
+            db.joinedload(DbUser.avatar),
+        )
+    )
+
+    stmt = (
+        _filter_by_search_term(stmt, search_term)
+        .order_by(rank.desc(), DbUser.screen_name)
+        .limit(limit)
+    )
+
+    db_users = db.session.scalars(stmt).unique().all()
+
+    return [_db_entity_to_user_for_admin(db_user) for db_user in db_users]
+
+
 def _filter_by_search_term(stmt: Select, search_term: str) -> Select:
-    terms = search_term.split(' ')
+    terms = search_term.split()
     clauses = map(_generate_search_clauses_for_term, terms)
 
-    return stmt.join(DbUserDetail).filter(db.and_(*clauses))
+    return stmt.filter(db.and_(*clauses))
 
 
 def _generate_search_clauses_for_term(search_term: str) -> Select:
     ilike_pattern = f'%{search_term}%'
 
-    return db.or_(
-        DbUser.email_address.ilike(ilike_pattern),
-        DbUser.screen_name.ilike(ilike_pattern),
-        DbUserDetail.first_name.ilike(ilike_pattern),
-        DbUserDetail.last_name.ilike(ilike_pattern),
+    # Match each table on its own (instead of joining them first) so
+    # that the trigram indexes on their columns can be used.
+    return DbUser.id.in_(
+        select(DbUser.id)
+        .filter(
+            db.or_(
+                DbUser.email_address.ilike(ilike_pattern),
+                DbUser.screen_name.ilike(ilike_pattern),
+            )
+        )
+        .union(
+            select(DbUserDetail.user_id).filter(
+                db.or_(
+                    DbUserDetail.first_name.ilike(ilike_pattern),
+                    DbUserDetail.last_name.ilike(ilike_pattern),
+                )
+            )
+        )
     )
@@ -6,17 +6,33 @@ byceps.services.webhooks.webhook_service
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections import defaultdict
+from datetime import timedelta
 from typing import Any
 
 from sqlalchemy import delete, select
 
 from byceps.database import db
+from byceps.util.cache import VersionedLocalCache
 from byceps.util.result import Err, Ok, Result
 
 from .dbmodels import DbOutgoingWebhook
 from .models import EventFilters, OutgoingWebhook, WebhookID
 
 
+RoutingTable = dict[str, list[OutgoingWebhook]]
+
+
+# Webhooks are looked up for every event that is emitted, but rarely
+# change.
+_routing_table_cache: VersionedLocalCache[
+    str, RoutingTable
+] = VersionedLocalCache(
+    'webhook-routing-table', 'webhooks', ttl=timedelta(minutes=5)
+)
+_ROUTING_TABLE_CACHE_KEY = 'enabled'
+
+
 def create_outgoing_webhook(
     event_types: set[str],
     event_filters: EventFilters,
@@ -43,6 +59,8 @@ def create_outgoing_webhook(
     db.session.add(db_webhook)
     db.session.commit()
 
+    _routing_table_cache.invalidate()
+
     return _db_entity_to_outgoing_webhook(db_webhook)
 
 
@@ -73,6 +91,8 @@ def update_outgoing_webhook(
 
     db.session.commit()
 
+    _routing_table_cache.invalidate()
+
     return Ok(_db_entity_to_outgoing_webhook(db_webhook))
 
 
@@ -83,6 +103,8 @@ def delete_outgoing_webhook(webhook_id: WebhookID) -> None:
     )
     db.session.commit()
 
+    _routing_table_cache.invalidate()
+
 
 def find_webhook(webhook_id: WebhookID) -> OutgoingWebhook | None:
     """Return the webhook with that ID, if found."""
@@ -123,6 +145,37 @@ def get_enabled_outgoing_webhooks(event_type: str) -> list[OutgoingWebhook]:
     ]
 
 
+def get_enabled_outgoing_webhooks_cached(
+    event_type: str,
+) -> list[OutgoingWebhook]:
+    """Return the configurations for enabled outgoing webhooks for that
+    event type.
+
+    Prefer the process-local routing table over the database.
+    """
+    routing_table = _routing_table_cache.get_or_set(
+        _ROUTING_TABLE_CACHE_KEY, _build_routing_table
+    )
+
+    return list(routing_table.get(event_type, []))
+
+
+def _build_routing_table() -> RoutingTable:
+    """Index all enabled outgoing webhooks by event type."""
+    db_webhooks = db.session.scalars(
+        select(DbOutgoingWebhook).filter_by(enabled=True)
+    ).all()
+
+    routing_table: RoutingTable = defaultdict(list)
+
+    for db_webhook in db_webhooks:
+        webhook = _db_entity_to_outgoing_webhook(db_webhook)
+        for event_type in webhook.event_types:
+            routing_table[event_type].append(webhook)
+
+    return dict(routing_table)
+
+
 def _db_entity_to_outgoing_webhook(
     db_webhook: DbOutgoingWebhook,
 ) -> OutgoingWebhook:
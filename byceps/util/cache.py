@@ -0,0 +1,465 @@
+"""
+byceps.util.cache
+~~~~~~~~~~~~~~~~~
+
+Process-local caching, with version counters and shared entries kept
+in Redis_ to invalidate (and share) cached data across processes.
+
+.. _Redis: https://redis.io/
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+from datetime import timedelta
+import json
+from threading import Lock
+import time
+from typing import Any, Generic, TypeVar
+
+from flask import current_app
+
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+KEY_PREFIX = 'byceps:cache:'
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    name: str
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class LocalCache(Generic[K, V]):
+    """A process-local, size-limited, least-recently-used cache.
+
+    Entries optionally expire after a time-to-live.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        maxsize: int = 1024,
+        ttl: timedelta | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self._ttl_seconds = ttl.total_seconds() if ttl is not None else None
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float | None, V]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+        _registry[name] = self
+
+    def get(self, key: K) -> V | None:
+        """Return the value cached for the key, or `None` if not cached
+        or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if (expires_at is not None) and (expires_at <= self._clock()):
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Cache the value for the key.
+
+        Evict the least recently used entry if the cache is full.
+        """
+        expires_at = (
+            self._clock() + self._ttl_seconds
+            if (self._ttl_seconds is not None)
+            else None
+        )
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key: K, create_value: Callable[[], V]) -> V:
+        """Return the value cached for the key.
+
+        Create and cache it first if it is not cached yet.
+        """
+        value = self.get(key)
+
+        if value is None:
+            value = create_value()
+            self.set(key, value)
+
+        return value
+
+    def delete(self, key: K) -> None:
+        """Remove the entry for the key, if cached."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> CacheStats:
+        """Return hit/miss counters and the current size."""
+        return CacheStats(
+            name=self.name,
+            hits=self._hits,
+            misses=self._misses,
+            size=len(self._entries),
+            maxsize=self.maxsize,
+        )
+
+
+class VersionedLocalCache(LocalCache[K, V]):
+    """A process-local cache that is cleared as soon as a version
+    counter, shared via Redis, has been bumped by any process.
+
+    To avoid a Redis round trip on every lookup, the counter is checked
+    at most once per `version_check_interval`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        version_key: str,
+        *,
+        maxsize: int = 1024,
+        ttl: timedelta | None = None,
+        version_check_interval: timedelta = timedelta(seconds=1),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(name, maxsize=maxsize, ttl=ttl, clock=clock)
+        self.version_key = version_key
+        self._version_check_interval_seconds = (
+            version_check_interval.total_seconds()
+        )
+        self._version: int | None = None
+        self._version_checked_at: float | None = None
+        self._published_hits = 0
+        self._published_misses = 0
+
+    def get(self, key: K) -> V | None:
+        self._clear_if_outdated()
+        return super().get(key)
+
+    def set(self, key: K, value: V) -> None:
+        self._clear_if_outdated()
+        super().set(key, value)
+
+    def _clear_if_outdated(self) -> None:
+        now = self._clock()
+
+        if (self._version_checked_at is not None) and (
+            now - self._version_checked_at
+            < self._version_check_interval_seconds
+        ):
+            return
+
+        version = self._fetch_version_and_publish_stats()
+        if version != self._version:
+            self.clear()
+            self._version = version
+
+        self._version_checked_at = now
+
+    def _fetch_version_and_publish_stats(self) -> int:
+        """Fetch the current version and, in the same round trip, add
+        the hits and misses since the last check to the counters shared
+        by all processes.
+        """
+        hits = self._hits
+        misses = self._misses
+        hits_delta = hits - self._published_hits
+        misses_delta = misses - self._published_misses
+
+        version = fetch_version_and_add_to_shared_stats(
+            self.version_key, self.name, hits_delta, misses_delta
+        )
+
+        self._published_hits = hits
+        self._published_misses = misses
+
+        return version
+
+    def invalidate(self) -> None:
+        """Clear this cache in all processes."""
+        bump_version(self.version_key)
+        self.clear()
+        self._version_checked_at = None
+
+
+_registry: dict[str, LocalCache] = {}
+
+
+def get_stats() -> list[CacheStats]:
+    """Return statistics for all local caches of this process."""
+    return [cache.get_stats() for cache in _registry.values()]
+
+
+# -------------------------------------------------------------------- #
+# version counters
+
+
+def _build_version_key(name: str) -> str:
+    return f'{KEY_PREFIX}version:{name}'
+
+
+def get_version(name: str) -> int:
+    """Return the current value of the version counter."""
+    return get_versions([name])[0]
+
+
+def get_versions(names: Sequence[str]) -> list[int]:
+    """Return the current values of the version counters, in one round
+    trip.
+    """
+    keys = [_build_version_key(name) for name in names]
+    values = _get_redis_client().mget(keys)
+    return [int(value) if (value is not None) else 0 for value in values]
+
+
+def fetch_version_and_add_to_shared_stats(
+    version_name: str, cache_name: str, hits_delta: int, misses_delta: int
+) -> int:
+    """Return the current value of the version counter.
+
+    Add to the cache's hit and miss counters shared by all processes
+    in the same round trip.
+    """
+    stats_key = _build_stats_key(cache_name)
+
+    pipeline = _get_redis_client().pipeline(transaction=False)
+    pipeline.get(_build_version_key(version_name))
+    if hits_delta:
+        pipeline.hincrby(stats_key, 'hits', hits_delta)
+    if misses_delta:
+        pipeline.hincrby(stats_key, 'misses', misses_delta)
+    value = pipeline.execute()[0]
+
+    return int(value) if (value is not None) else 0
+
+
+def bump_version(name: str) -> None:
+    """Increment the version counter, thus invalidating everything
+    cached under the previous version.
+    """
+    key = _build_version_key(name)
+    _get_redis_client().incr(key)
+
+
+# -------------------------------------------------------------------- #
+# shared statistics
+
+
+def _build_stats_key(cache_name: str) -> str:
+    return f'{KEY_PREFIX}stats:{cache_name}'
+
+
+def get_shared_stats(cache_name: str) -> tuple[int, int]:
+    """Return the hits and misses of the cache, summed up over all
+    processes that published them.
+    """
+    values = _get_redis_client().hmget(
+        _build_stats_key(cache_name), ['hits', 'misses']
+    )
+    hits, misses = (
+        int(value) if (value is not None) else 0 for value in values
+    )
+    return hits, misses
+
+
+# -------------------------------------------------------------------- #
+# shared entries
+
+
+def _build_entry_key(key: str) -> str:
+    return f'{KEY_PREFIX}entry:{key}'
+
+
+def get_json(key: str) -> Any | None:
+    """Return the JSON-decoded value stored in Redis for the key, or
+    `None` if not stored.
+    """
+    data = _get_redis_client().get(_build_entry_key(key))
+
+    if data is None:
+        return None
+
+    return json.loads(data)
+
+
+def set_json(key: str, value: Any, ttl: timedelta) -> None:
+    """Store the value, JSON-encoded, in Redis for the key.
+
+    The entry expires after the time-to-live.
+    """
+    data = json.dumps(value)
+    _get_redis_client().set(_build_entry_key(key), data, ex=ttl)
+
+
+def delete(key: str) -> None:
+    """Remove the entry stored in Redis for the key."""
+    _get_redis_client().delete(_build_entry_key(key))
+
+
+# -------------------------------------------------------------------- #
+# shared hashes
+
+
+def _build_hash_key(key: str) -> str:
+    return f'{KEY_PREFIX}hash:{key}'
+
+
+def get_hash_fields(key: str, fields: Sequence[str]) -> list[str | None]:
+    """Return the values of the fields of the hash stored in Redis for
+    the key, in the order of the fields.
+
+    The value is `None` for each field that is not stored.
+    """
+    if not fields:
+        return []
+
+    values = _get_redis_client().hmget(_build_hash_key(key), fields)
+    return [
+        value.decode('utf-8') if (value is not None) else None
+        for value in values
+    ]
+
+
+def set_hash_fields(key: str, values: dict[str, str], ttl: timedelta) -> None:
+    """Store the values for the fields of the hash stored in Redis for
+    the key.
+
+    The hash expires after the time-to-live unless fields are set again.
+    """
+    if not values:
+        return
+
+    hash_key = _build_hash_key(key)
+
+    pipeline = _get_redis_client().pipeline(transaction=False)
+    pipeline.hset(hash_key, mapping=values)
+    pipeline.expire(hash_key, ttl)
+    pipeline.execute()
+
+
+# -------------------------------------------------------------------- #
+# shared buffers
+
+
+def _build_buffer_key(key: str) -> str:
+    return f'{KEY_PREFIX}buffer:{key}'
+
+
+def _build_buffer_flush_scheduled_key(key: str) -> str:
+    return f'{KEY_PREFIX}buffer-flush-scheduled:{key}'
+
+
+def add_to_buffer(
+    key: str, field: str, value: str, flush_delay: timedelta
+) -> bool:
+    """Store the value for the field of the buffer stored in Redis for
+    the key.
+
+    Return `True` if a flush has to be scheduled, i.e. if none has been
+    scheduled since the buffer was last taken. Should a scheduled flush
+    not happen, another one is requested after twice the delay.
+    """
+    pipeline = _get_redis_client().pipeline(transaction=False)
+    pipeline.hset(_build_buffer_key(key), field, value)
+    pipeline.set(
+        _build_buffer_flush_scheduled_key(key), 1, nx=True, ex=flush_delay * 2
+    )
+    _, flush_to_be_scheduled = pipeline.execute()
+
+    return bool(flush_to_be_scheduled)
+
+
+def get_buffered_fields(key: str, fields: Sequence[str]) -> list[str | None]:
+    """Return the values of the fields of the buffer stored in Redis for
+    the key, in the order of the fields.
+
+    The value is `None` for each field that is not buffered.
+    """
+    if not fields:
+        return []
+
+    values = _get_redis_client().hmget(_build_buffer_key(key), fields)
+    return [
+        value.decode('utf-8') if (value is not None) else None
+        for value in values
+    ]
+
+
+def take_buffer(key: str) -> dict[str, str]:
+    """Remove all fields from the buffer stored in Redis for the key and
+    return their values.
+    """
+    redis_client = _get_redis_client()
+
+    # Values added from now on require another flush.
+    redis_client.delete(_build_buffer_flush_scheduled_key(key))
+
+    buffer_key = _build_buffer_key(key)
+
+    pipeline = redis_client.pipeline(transaction=True)
+    pipeline.hgetall(buffer_key)
+    pipeline.delete(buffer_key)
+    values_by_field, _ = pipeline.execute()
+
+    return {
+        field.decode('utf-8'): value.decode('utf-8')
+        for field, value in values_by_field.items()
+    }
+
+
+def restore_to_buffer(key: str, values: dict[str, str]) -> None:
+    """Put values back into the buffer stored in Redis for the key,
+    unless newer values have been buffered for the same fields in the
+    meantime.
+    """
+    if not values:
+        return
+
+    buffer_key = _build_buffer_key(key)
+
+    pipeline = _get_redis_client().pipeline(transaction=False)
+    for field, value in values.items():
+        pipeline.hsetnx(buffer_key, field, value)
+    pipeline.execute()
+
+
+def _get_redis_client():
+    return current_app.redis_client
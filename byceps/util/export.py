@@ -4,44 +4,73 @@ byceps.util.export
 
 Data export as CSV.
 
+Rows are serialized one at a time, so neither the rows nor the
+resulting document have to be held in memory as a whole.
+
 :Copyright: 2014-2024 Jochen Kupperschmidt
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
 import csv
-import io
+from typing import Any
+
+
+class _Echo:
+    """A file-like object that returns what is written to it instead of
+    storing it.
+    """
+
+    def write(self, value: str) -> str:
+        return value
 
 
 def serialize_dicts_to_csv(
     field_names: Sequence[str],
-    rows: Sequence[dict[str, str]],
+    rows: Iterable[dict[str, Any]],
     *,
     delimiter=',',
 ) -> Iterator[str]:
     """Serialize the rows (must be dictionary objects) to CSV."""
-    with io.StringIO(newline='') as f:
-        writer = csv.DictWriter(
-            f, field_names, dialect=csv.excel, delimiter=delimiter
-        )
+    writer = csv.DictWriter(
+        _Echo(), field_names, dialect=csv.excel, delimiter=delimiter
+    )
 
-        writer.writeheader()
-        writer.writerows(rows)
+    yield writer.writeheader()
 
-        f.seek(0)
-        yield from f
+    for row in rows:
+        yield writer.writerow(row)
 
 
 def serialize_tuples_to_csv(
-    rows: Sequence[tuple[str, ...]],
+    rows: Iterable[tuple[Any, ...]],
     *,
     delimiter=',',
 ) -> Iterator[str]:
     """Serialize the rows (must be tuples) to CSV."""
-    with io.StringIO(newline='') as f:
-        writer = csv.writer(f, delimiter=delimiter)
+    writer = csv.writer(_Echo(), delimiter=delimiter)
+
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def join_in_chunks(
+    strings: Iterable[str], *, chunk_size: int = 64 * 1024
+) -> Iterator[str]:
+    """Join the strings to chunks of (about) the given size (in
+    characters), to be sent with as few writes as reasonable.
+    """
+    buffer: list[str] = []
+    buffered_size = 0
+
+    for string in strings:
+        buffer.append(string)
+        buffered_size += len(string)
 
-        writer.writerows(rows)
+        if buffered_size >= chunk_size:
+            yield ''.join(buffer)
+            buffer.clear()
+            buffered_size = 0
 
-        f.seek(0)
-        yield from f
+    if buffer:
+        yield ''.join(buffer)
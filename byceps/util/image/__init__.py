@@ -6,6 +6,7 @@ byceps.util.image
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
+from collections.abc import Iterable, Iterator
 from io import BytesIO
 from typing import BinaryIO
 
@@ -46,6 +47,37 @@ def create_thumbnail(
     return output_stream
 
 
+def create_thumbnails(
+    filename_or_stream: FilenameOrStream,
+    image_types: Iterable[str],
+    maximum_dimensions: Iterable[Dimensions],
+    *,
+    force_square: bool = False,
+) -> Iterator[tuple[Dimensions, str, BinaryIO]]:
+    """Create thumbnails of the given image in each of the sizes and
+    types, and yield them with the maximum dimensions and type they
+    were created for.
+
+    The image is decoded only once, and each thumbnail is scaled down
+    from the next larger one.
+    """
+    image = Image.open(filename_or_stream)
+
+    if force_square:
+        image = _crop_to_square(image)
+
+    for dimensions in sorted(maximum_dimensions, reverse=True):
+        image = image.copy()
+        image.thumbnail(dimensions, resample=Image.Resampling.LANCZOS)
+
+        for image_type in image_types:
+            output_stream = BytesIO()
+            image.save(output_stream, format=image_type)
+            output_stream.seek(0)
+
+            yield dimensions, image_type, output_stream
+
+
 def _crop_to_square(image: ImageFile) -> ImageFile:
     """Crop image to be square."""
     dimensions = Dimensions(*image.size)
@@ -7,7 +7,7 @@ byceps.util.iterables
 """
 
 from collections.abc import Callable, Iterable, Iterator
-from itertools import tee
+from itertools import islice, tee
 from typing import TypeVar
 
 
@@ -16,6 +16,20 @@ T = TypeVar('T')
 Predicate = Callable[[T], bool]
 
 
+def chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Return the elements in lists of (at most) the given size.
+
+    Example:
+        xs, 2 -> [x0, x1], [x2, x3], [x4]
+    """
+    if size < 1:
+        raise ValueError('Size must be at least 1.')
+
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
 def find(iterable: Iterable[T], predicate: Predicate) -> T | None:
     """Return the first element in the iterable that matches the
     predicate.
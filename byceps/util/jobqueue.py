@@ -11,7 +11,7 @@ An asynchronously processed job queue based on Redis_ and RQ_.
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from contextlib import contextmanager
 from datetime import datetime, UTC
 
@@ -37,6 +37,16 @@ def enqueue(func: Callable, *args, **kwargs):
         queue.enqueue(func, *args, **kwargs)
 
 
+def enqueue_many(func: Callable, args_list: Sequence[tuple]) -> None:
+    """Add a call of the function for each of the argument tuples to the
+    queue as a job, in a single Redis round trip.
+    """
+    with connection():
+        queue = get_queue(current_app)
+        job_datas = [Queue.prepare_data(func, args) for args in args_list]
+        queue.enqueue_many(job_datas)
+
+
 def enqueue_at(dt: datetime, func: Callable, *args, **kwargs):
     """Add the function call to the queue as a job to be executed at the
     specific time.
@@ -23,20 +23,55 @@ from jinja2 import (
 )
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 
+from .cache import LocalCache
+
 
 SITES_PATH = Path('sites')
 
 
+# Environments are shared by all templates using the same globals.
+# Templates compiled from source are cached per environment.
+_environments: LocalCache[frozenset[tuple[str, Any]], Environment] = LocalCache(
+    'sandboxed-template-environments', maxsize=32
+)
+_compiled_templates: LocalCache[
+    tuple[frozenset[tuple[str, Any]], str], Template
+] = LocalCache('compiled-templates', maxsize=1024)
+
+
 def load_template(
     source: str, *, template_globals: dict[str, Any] | None = None
 ) -> Template:
-    """Load a template from source, using the sandboxed environment."""
+    """Load a template from source, using the sandboxed environment.
+
+    Compiled templates are cached by their source and globals.
+    """
+    try:
+        globals_key = frozenset((template_globals or {}).items())
+    except TypeError:
+        # Some global value is not hashable.
+        env = _create_sandboxed_environment_with_globals(template_globals)
+        return env.from_string(source)
+
+    env = _environments.get_or_set(
+        globals_key,
+        lambda: _create_sandboxed_environment_with_globals(template_globals),
+    )
+
+    return _compiled_templates.get_or_set(
+        (globals_key, source), lambda: env.from_string(source)
+    )
+
+
+def _create_sandboxed_environment_with_globals(
+    template_globals: dict[str, Any] | None,
+) -> Environment:
     env = create_sandboxed_environment()
 
     if template_globals is not None:
         env.globals.update(template_globals)
 
-    return env.from_string(source)
+    return env
 
 
 def create_sandboxed_environment(
@@ -8,6 +8,7 @@ byceps.util.upload
 
 from pathlib import Path
 from shutil import copyfileobj
+from tempfile import NamedTemporaryFile
 from typing import Any, IO
 
 
@@ -28,6 +29,36 @@ def store(
         copyfileobj(source, f)
 
 
+def store_atomically(
+    source: IO[Any],
+    target_path: Path,
+    *,
+    create_parent_path_if_nonexistent: bool = False,
+) -> None:
+    """Copy source data to the target path, replacing an existing file.
+
+    The data is written to a temporary file first which is then renamed
+    to the target path, so the target file is never seen incomplete.
+    """
+    if create_parent_path_if_nonexistent:
+        _create_path_if_nonexistent(target_path.parent)
+
+    with NamedTemporaryFile(
+        dir=target_path.parent, prefix=f'.{target_path.name}.', delete=False
+    ) as f:
+        tmp_path = Path(f.name)
+        try:
+            copyfileobj(source, f)
+        except Exception:
+            tmp_path.unlink()
+            raise
+
+    # Temporary files are only readable by their owner.
+    tmp_path.chmod(0o644)
+
+    tmp_path.replace(target_path)
+
+
 def delete(path: Path) -> None:
     """Delete the path."""
     try:
@@ -11,7 +11,10 @@ from uuid import UUID
 from babel import parse_locale
 from flask import session
 
-from byceps.services.authn.session import authn_session_service
+from byceps.services.authn.session import (
+    authn_session_cache_service,
+    authn_session_service,
+)
 from byceps.services.authn.session.models import CurrentUser
 from byceps.services.user import user_service
 from byceps.services.user.models.user import User, UserID
@@ -45,11 +48,12 @@ def end() -> None:
 def get_current_user(required_permissions: set[str]) -> CurrentUser:
     session_locale = _get_session_locale()
 
-    user = _find_user()
-    if user is None:
+    user_and_permissions = _find_user_and_permissions()
+    if user_and_permissions is None:
         return authn_session_service.get_anonymous_current_user(session_locale)
 
-    permissions = get_permissions_for_user(user.id)
+    user, permissions = user_and_permissions
+
     if not required_permissions.issubset(permissions):
         return authn_session_service.get_anonymous_current_user(session_locale)
 
@@ -60,18 +64,16 @@ def get_current_user(required_permissions: set[str]) -> CurrentUser:
     )
 
 
-def _find_user() -> User | None:
-    """Return the current user if authenticated, `None` if not.
+def _find_user_and_permissions() -> tuple[User, frozenset[str]] | None:
+    """Return the current user and their permissions if authenticated,
+    `None` if not.
 
-    Return `None` if:
-    - the ID is unknown.
-    - the account is not enabled.
-    - the auth token is invalid.
+    Prefer the cache over the database.
     """
     user_id_str = session.get(KEY_USER_ID)
     auth_token = session.get(KEY_USER_AUTH_TOKEN)
 
-    if user_id_str is None:
+    if (user_id_str is None) or not auth_token:
         return None
 
     try:
@@ -79,15 +81,38 @@ def _find_user() -> User | None:
     except ValueError:
         return None
 
+    cache_key = authn_session_cache_service.get_cache_key(user_id, auth_token)
+
+    cached = authn_session_cache_service.find_current_user(cache_key)
+    if cached is not None:
+        return cached.user, cached.permissions
+
+    user = _find_user(user_id, auth_token)
+    if user is None:
+        return None
+
+    permissions = get_permissions_for_user(user.id)
+
+    authn_session_cache_service.store_current_user(cache_key, user, permissions)
+
+    return user, permissions
+
+
+def _find_user(user_id: UserID, auth_token: str) -> User | None:
+    """Return the user if authenticated, `None` if not.
+
+    Return `None` if:
+    - the ID is unknown.
+    - the account is not enabled.
+    - the auth token is invalid.
+    """
     user = user_service.find_active_user(user_id, include_avatar=True)
 
     if user is None:
         return None
 
     # Validate auth token.
-    if (auth_token is None) or not authn_session_service.is_session_valid(
-        user.id, auth_token
-    ):
+    if not authn_session_service.is_session_valid(user.id, auth_token):
         # Bad auth token, not logging in.
         return None
 
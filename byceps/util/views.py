@@ -23,6 +23,7 @@ from flask import (
 from flask_babel import gettext
 
 from .authz import has_current_user_permission
+from .export import join_in_chunks
 from .framework.flash import flash_notice
 
 
@@ -83,12 +84,20 @@ def jsonified(f):
 
 
 def textified(f):
-    """Send the data returned by the decorated function as plaintext."""
+    """Send the data returned by the decorated function as plaintext.
+
+    If the function returns an iterable of strings (instead of a single
+    string), it is streamed in chunks.
+    """
 
     @wraps(f)
     def wrapper(*args, **kwargs):
         data = f(*args, **kwargs)
-        return Response(stream_with_context(data), mimetype='text/plain')
+
+        if not isinstance(data, str):
+            data = stream_with_context(join_in_chunks(data))
+
+        return Response(data, mimetype='text/plain')
 
     return wrapper
 
@@ -0,0 +1,34 @@
+"""
+Benchmarks are skipped unless the environment variable
+``BYCEPS_RUN_BENCHMARKS`` is set, e.g.:
+
+    $ BYCEPS_RUN_BENCHMARKS=1 pytest -s tests/integration/benchmarks
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Callable
+import os
+from time import perf_counter
+
+import pytest
+
+
+if not os.environ.get('BYCEPS_RUN_BENCHMARKS'):
+    collect_ignore_glob = ['test_*.py']
+
+
+@pytest.fixture()
+def measure():
+    """Return the average duration, in seconds, of calling a function
+    repeatedly.
+    """
+
+    def _wrapper(func: Callable[[], object], *, repeat: int = 10) -> float:
+        start = perf_counter()
+        for _ in range(repeat):
+            func()
+        return (perf_counter() - start) / repeat
+
+    return _wrapper
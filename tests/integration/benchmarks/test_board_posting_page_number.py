@@ -0,0 +1,74 @@
+"""
+Benchmark the page number lookup for postings in topics of different
+sizes.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert
+
+from byceps.database import db
+from byceps.services.board import board_posting_query_service
+from byceps.services.board.dbmodels.posting import DbPosting
+
+from tests.helpers import generate_uuid
+from tests.integration.blueprints.site.board.helpers import (
+    create_category,
+    create_topic,
+)
+
+
+POSTINGS_PER_PAGE = 10
+
+
+@pytest.mark.parametrize('posting_count', [10, 1_000, 50_000])
+def test_calculate_posting_page_number(
+    site_app, board, make_user, measure, posting_count
+):
+    creator = make_user()
+    category = create_category(board.id, number=posting_count)
+    topic = create_topic(category.id, creator)
+
+    last_posting_id = _insert_postings(topic.id, creator.id, posting_count)
+    db_posting = board_posting_query_service.get_db_posting(last_posting_id)
+
+    duration = measure(
+        lambda: board_posting_query_service.calculate_posting_page_number(
+            db_posting, False, POSTINGS_PER_PAGE
+        )
+    )
+
+    page = board_posting_query_service.calculate_posting_page_number(
+        db_posting, False, POSTINGS_PER_PAGE
+    )
+    # The initial topic posting comes first.
+    assert page == (posting_count // POSTINGS_PER_PAGE) + 1
+
+    print(
+        f'\ncalculate_posting_page_number, {posting_count:>6d} postings: '
+        f'{duration * 1000:.3f} ms'
+    )
+
+
+def _insert_postings(topic_id, creator_id, count: int):
+    starts_at = datetime.utcnow() + timedelta(minutes=1)
+
+    rows = [
+        {
+            'id': generate_uuid(),
+            'topic_id': topic_id,
+            'created_at': starts_at + timedelta(seconds=i),
+            'creator_id': creator_id,
+            'body': f'Posting {i}',
+        }
+        for i in range(count)
+    ]
+
+    db.session.execute(insert(DbPosting), rows)
+    db.session.commit()
+
+    return rows[-1]['id']
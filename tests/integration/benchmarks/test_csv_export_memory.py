@@ -0,0 +1,97 @@
+"""
+Benchmark the memory needed to export many rows as CSV, with all rows
+loaded at once versus streamed.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Callable
+from datetime import datetime
+import tracemalloc
+
+import pytest
+from sqlalchemy import insert, select
+
+from byceps.database import db, stream
+from byceps.services.user.dbmodels.user import DbUser
+from byceps.util.export import join_in_chunks, serialize_tuples_to_csv
+
+from tests.helpers import generate_token, generate_uuid
+
+
+ROW_COUNT = 500_000
+BATCH_SIZE = 10_000
+
+
+@pytest.fixture(scope='module')
+def token(admin_app) -> str:
+    token = generate_token(4)
+    _insert_users(token, ROW_COUNT)
+    return token
+
+
+def test_export_memory(admin_app, token):
+    stmt = select(DbUser.screen_name, DbUser.email_address).filter(
+        DbUser.screen_name.startswith(f'{token}-')
+    )
+
+    def export_materialized() -> int:
+        rows = db.session.execute(stmt).tuples().all()
+        document = ''.join(serialize_tuples_to_csv(rows))
+        return len(document)
+
+    def export_streamed() -> int:
+        chunks = join_in_chunks(serialize_tuples_to_csv(stream(stmt)))
+        return sum(len(chunk) for chunk in chunks)
+
+    size_materialized, peak_materialized = _measure_peak_memory(
+        export_materialized
+    )
+    size_streamed, peak_streamed = _measure_peak_memory(export_streamed)
+
+    assert size_streamed == size_materialized
+    assert peak_streamed < peak_materialized / 10
+
+    print(
+        f'\nCSV export, {ROW_COUNT} rows, peak memory: '
+        f'materialized {peak_materialized / 1024 / 1024:.1f} MiB, '
+        f'streamed {peak_streamed / 1024 / 1024:.1f} MiB'
+    )
+
+
+def _measure_peak_memory(func: Callable[[], int]) -> tuple[int, int]:
+    """Return the function's result and the peak memory, in bytes,
+    allocated while calling it.
+    """
+    db.session.expunge_all()
+
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    db.session.rollback()
+
+    return result, peak
+
+
+def _insert_users(token: str, count: int) -> None:
+    created_at = datetime.utcnow()
+
+    for batch_start in range(0, count, BATCH_SIZE):
+        rows = [
+            {
+                'id': generate_uuid(),
+                'created_at': created_at,
+                'screen_name': f'{token}-{i}',
+                'email_address': f'{token}-{i}@users.test',
+            }
+            for i in range(batch_start, min(batch_start + BATCH_SIZE, count))
+        ]
+
+        db.session.execute(insert(DbUser), rows)
+
+    db.session.commit()
@@ -0,0 +1,96 @@
+"""
+Benchmark placing orders concurrently from a single storefront, with
+order numbers reserved one at a time vs. in blocks.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from time import perf_counter
+
+from moneyed import EUR
+import pytest
+
+from byceps.services.shop.cart.models import Cart
+from byceps.services.shop.order import (
+    order_checkout_service,
+    order_sequence_service,
+)
+
+
+THREAD_COUNT = 8
+ORDERS_PER_THREAD = 25
+
+
+@pytest.mark.parametrize('block_size', [1, 20])
+def test_place_orders_concurrently(
+    admin_app,
+    make_brand,
+    make_shop,
+    make_order_number_sequence,
+    make_storefront,
+    make_user,
+    make_orderer,
+    monkeypatch,
+    block_size,
+):
+    brand = make_brand()
+    shop = make_shop(brand.id)
+    sequence = make_order_number_sequence(shop.id)
+    storefront = make_storefront(shop.id, sequence.id)
+    orderer = make_orderer(make_user())
+
+    generate_order_number = order_sequence_service.generate_order_number
+    number_generation_durations: list[float] = []
+
+    def timed_generate_order_number(sequence_id):
+        start = perf_counter()
+        result = generate_order_number(sequence_id, block_size=block_size)
+        number_generation_durations.append(perf_counter() - start)
+        return result
+
+    monkeypatch.setattr(
+        order_sequence_service,
+        'generate_order_number',
+        timed_generate_order_number,
+    )
+
+    def place_orders(app) -> list[str]:
+        with app.app_context():
+            return [
+                order_checkout_service.place_order(
+                    storefront, orderer, Cart(EUR)
+                )
+                .unwrap()[0]
+                .order_number
+                for _ in range(ORDERS_PER_THREAD)
+            ]
+
+    start = perf_counter()
+    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+        futures = [
+            executor.submit(partial(place_orders, admin_app))
+            for _ in range(THREAD_COUNT)
+        ]
+        order_numbers = [
+            order_number
+            for future in futures
+            for order_number in future.result()
+        ]
+    duration = perf_counter() - start
+
+    order_count = THREAD_COUNT * ORDERS_PER_THREAD
+    assert len(set(order_numbers)) == order_count
+
+    throughput = order_count / duration
+    avg_number_generation_ms = (
+        sum(number_generation_durations) / order_count * 1000
+    )
+
+    print(
+        f'\nplace_order, {THREAD_COUNT} threads, block size {block_size:>2d}: '
+        f'{throughput:.1f} orders/s, '
+        f'{avg_number_generation_ms:.3f} ms avg. waiting for order number'
+    )
@@ -0,0 +1,126 @@
+"""
+Benchmark searching users by substrings of their names and email
+addresses, with and without the trigram indexes.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import insert, text
+
+from byceps.database import db
+from byceps.services.user import user_service
+from byceps.services.user.dbmodels.detail import DbUserDetail
+from byceps.services.user.dbmodels.user import DbUser
+
+from tests.helpers import generate_token, generate_uuid
+
+
+USER_COUNT = 200_000
+BATCH_SIZE = 10_000
+
+
+@pytest.fixture(scope='module')
+def search_term(admin_app) -> str:
+    token = generate_token(4)
+    _insert_users(token, USER_COUNT)
+    db.session.execute(text('ANALYZE users, user_details'))
+    db.session.commit()
+
+    # Matches a single user.
+    return f'{token}-{USER_COUNT // 2}'
+
+
+@pytest.mark.parametrize('use_indexes', [False, True])
+def test_get_users_paginated_with_search_term(
+    admin_app, measure, search_term, use_indexes
+):
+    with _indexes_enabled(use_indexes):
+        duration = measure(
+            lambda: user_service.get_users_paginated(
+                20, search_term=search_term
+            )
+        )
+
+        users = user_service.get_users_paginated(20, search_term=search_term)
+
+    assert len(users.items) == 1
+
+    _print_duration('get_users_paginated', use_indexes, duration)
+
+
+@pytest.mark.parametrize('use_indexes', [False, True])
+def test_search_users(admin_app, measure, search_term, use_indexes):
+    with _indexes_enabled(use_indexes):
+        duration = measure(lambda: user_service.search_users(search_term, 10))
+
+        users = user_service.search_users(search_term, 10)
+
+    assert len(users) == 1
+
+    _print_duration('search_users', use_indexes, duration)
+
+
+@contextmanager
+def _indexes_enabled(enabled: bool) -> Iterator[None]:
+    """Make the query planner avoid indexes (as far as possible) unless
+    enabled, to simulate their absence.
+    """
+    if not enabled:
+        db.session.execute(text('SET enable_bitmapscan = off'))
+        db.session.execute(text('SET enable_indexscan = off'))
+
+    try:
+        yield
+    finally:
+        db.session.execute(text('RESET enable_bitmapscan'))
+        db.session.execute(text('RESET enable_indexscan'))
+        db.session.commit()
+
+
+def _insert_users(token: str, count: int) -> None:
+    starts_at = datetime.utcnow() - timedelta(days=365)
+
+    for batch_start in range(0, count, BATCH_SIZE):
+        user_rows = []
+        detail_rows = []
+
+        for i in range(batch_start, min(batch_start + BATCH_SIZE, count)):
+            user_id = generate_uuid()
+
+            user_rows.append(
+                {
+                    'id': user_id,
+                    'created_at': starts_at + timedelta(seconds=i),
+                    'screen_name': f'{token}-{i}',
+                    'email_address': f'{token}-{i}@users.test',
+                    'initialized': True,
+                }
+            )
+
+            detail_rows.append(
+                {
+                    'user_id': user_id,
+                    'first_name': f'First{i}',
+                    'last_name': f'Last{i}',
+                }
+            )
+
+        db.session.execute(insert(DbUser), user_rows)
+        db.session.execute(insert(DbUserDetail), detail_rows)
+
+    db.session.commit()
+
+
+def _print_duration(name: str, use_indexes: bool, duration: float) -> None:
+    label = 'with indexes' if use_indexes else 'without indexes'
+
+    print(
+        f'\n{name}, {USER_COUNT} users, {label:>15}: '
+        f'{duration * 1000:.3f} ms'
+    )
@@ -43,6 +43,14 @@ def test_metrics(client):
     )
     assert regex.search(response.get_data(as_text=True)) is not None
 
+    assert (
+        re.search(
+            'metrics_collector_duration_seconds{collector="user"} [\\d.e-]+\n',
+            response.get_data(as_text=True),
+        )
+        is not None
+    )
+
 
 @pytest.mark.parametrize('config_overrides', [{'METRICS_ENABLED': False}])
 def test_disabled_metrics(client):
@@ -0,0 +1,101 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.database import db
+from byceps.services.board import (
+    board_aggregation_service,
+    board_posting_command_service,
+    board_topic_command_service,
+)
+from byceps.services.board.dbmodels.category import DbBoardCategory
+from byceps.services.board.models import BoardCategory
+
+from .helpers import create_category, create_posting, create_topic, find_topic
+
+
+def test_counters_are_maintained_incrementally(
+    site_app, board, board_poster, moderator
+):
+    category = create_category(board.id, number=3)
+    other_category = create_category(board.id, number=4)
+
+    topic1 = create_topic(category.id, board_poster, number=1)
+    topic2 = create_topic(category.id, board_poster, number=2)
+    posting1 = create_posting(topic1.id, board_poster, number=1)
+    posting2 = create_posting(topic1.id, board_poster, number=2)
+
+    assert_topic_counts(topic1.id, 3, posting2.created_at)
+    assert_category_counts(category, 2, 4, posting2.created_at)
+
+    board_posting_command_service.hide_posting(posting2.id, moderator)
+
+    assert_topic_counts(topic1.id, 2, posting1.created_at)
+    assert_category_counts(category, 2, 3, posting1.created_at)
+
+    board_posting_command_service.unhide_posting(posting2.id, moderator)
+
+    assert_topic_counts(topic1.id, 3, posting2.created_at)
+    assert_category_counts(category, 2, 4, posting2.created_at)
+
+    board_topic_command_service.hide_topic(topic1.id, moderator)
+
+    assert_category_counts(
+        category, 1, 1, find_topic(topic2.id).last_updated_at
+    )
+
+    board_topic_command_service.unhide_topic(topic1.id, moderator)
+
+    assert_category_counts(category, 2, 4, posting2.created_at)
+
+    board_topic_command_service.move_topic(
+        topic1.id, other_category.id, moderator
+    )
+
+    assert_category_counts(
+        category, 1, 1, find_topic(topic2.id).last_updated_at
+    )
+    assert_category_counts(other_category, 1, 3, posting2.created_at)
+
+
+def test_aggregate_board_matches_incremental_counters(
+    site_app, board, board_poster, moderator
+):
+    category = create_category(board.id, number=5)
+    topic = create_topic(category.id, board_poster)
+    create_posting(topic.id, board_poster, number=1)
+    posting2 = create_posting(topic.id, board_poster, number=2)
+    board_posting_command_service.hide_posting(posting2.id, moderator)
+
+    category_before = get_category(category)
+
+    board_aggregation_service.aggregate_board(board.id)
+
+    category_after = get_category(category)
+    assert category_after.topic_count == category_before.topic_count
+    assert category_after.posting_count == category_before.posting_count
+
+
+def assert_topic_counts(topic_id, expected_posting_count, expected_last_at):
+    db.session.expire_all()
+    topic = find_topic(topic_id)
+    assert topic.posting_count == expected_posting_count
+    assert topic.last_updated_at == expected_last_at
+
+
+def assert_category_counts(
+    category: BoardCategory,
+    expected_topic_count: int,
+    expected_posting_count: int,
+    expected_last_posting_at,
+):
+    actual = get_category(category)
+    assert actual.topic_count == expected_topic_count
+    assert actual.posting_count == expected_posting_count
+    assert actual.last_posting_updated_at == expected_last_posting_at
+
+
+def get_category(category: BoardCategory) -> DbBoardCategory:
+    db.session.expire_all()
+    return db.session.get(DbBoardCategory, category.id)
@@ -0,0 +1,113 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+
+from byceps.database import db
+from byceps.services.board import (
+    board_last_view_buffer_service,
+    board_last_view_service,
+    board_topic_query_service,
+)
+from byceps.services.board.dbmodels.last_topic_view import DbLastTopicView
+
+from .helpers import create_topic
+
+
+def test_topics_with_unseen_postings(
+    site_app, category, board_poster, make_user
+):
+    user = make_user()
+
+    topic1 = create_topic(category.id, board_poster, number=11)
+    topic2 = create_topic(category.id, board_poster, number=12)
+    db_topics = [
+        board_topic_query_service.get_db_topic(topic.id)
+        for topic in (topic1, topic2)
+    ]
+
+    assert board_last_view_service.get_topics_with_unseen_postings(
+        db_topics, user.id
+    ) == {topic1.id, topic2.id}
+
+    board_last_view_service.mark_topic_as_just_viewed(topic1.id, user.id)
+
+    # Served from the cache, which has been updated.
+    assert board_last_view_service.get_topics_with_unseen_postings(
+        db_topics, user.id
+    ) == {topic2.id}
+
+    last_viewed_ats = board_last_view_service.get_topics_last_viewed_at(
+        {topic1.id, topic2.id}, user.id
+    )
+    assert last_viewed_ats[topic1.id] is not None
+    assert last_viewed_ats[topic2.id] is None
+
+
+def test_categories_last_viewed_at(
+    site_app, category, another_category, make_user
+):
+    user = make_user()
+
+    board_last_view_service.mark_category_as_just_viewed(category.id, user.id)
+
+    last_viewed_ats = board_last_view_service.get_categories_last_viewed_at(
+        {category.id, another_category.id}, user.id
+    )
+
+    assert last_viewed_ats[category.id] is not None
+    assert last_viewed_ats[another_category.id] is None
+
+
+def test_topic_views_are_buffered_and_flushed(
+    site_app, category, board_poster, make_user
+):
+    user = make_user()
+    topic = create_topic(category.id, board_poster, number=13)
+
+    board_last_view_service.mark_topic_as_just_viewed(topic.id, user.id)
+
+    buffered = board_last_view_buffer_service.find_topic_views(
+        user.id, {topic.id}
+    )
+    assert topic.id in buffered
+    assert find_stored_last_viewed_at(topic.id, user.id) is None
+
+    board_last_view_service.flush_buffered_topic_views()
+
+    assert find_stored_last_viewed_at(topic.id, user.id) == buffered[topic.id]
+    assert (
+        board_last_view_buffer_service.find_topic_views(user.id, {topic.id})
+        == {}
+    )
+
+
+def test_flush_keeps_later_stored_view(
+    site_app, category, board_poster, make_user
+):
+    user = make_user()
+    topic = create_topic(category.id, board_poster, number=14)
+
+    board_last_view_buffer_service.add_topic_view(
+        user.id, topic.id, datetime(2024, 1, 1, 12, 0, 0), timedelta(seconds=30)
+    )
+    board_last_view_service.mark_all_topics_in_category_as_viewed(
+        category.id, user.id
+    )
+    stored_at_before = find_stored_last_viewed_at(topic.id, user.id)
+
+    board_last_view_service.flush_buffered_topic_views()
+
+    assert find_stored_last_viewed_at(topic.id, user.id) == stored_at_before
+
+
+def find_stored_last_viewed_at(topic_id, user_id) -> datetime | None:
+    return db.session.scalar(
+        select(DbLastTopicView.occurred_at).filter_by(
+            user_id=user_id, topic_id=topic_id
+        )
+    )
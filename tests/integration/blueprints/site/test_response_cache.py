@@ -0,0 +1,73 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.page import page_service
+
+from tests.helpers import create_site, generate_token, http_client
+
+
+SERVER_NAME = 'site-with-page-cache.acmecon.test'
+
+BASE_URL = f'http://{SERVER_NAME}'
+
+
+@pytest.fixture(scope='module')
+def cached_site(brand):
+    return create_site(f'cached-{generate_token(4)}', brand.id)
+
+
+@pytest.fixture(scope='module')
+def cached_site_app(make_site_app, cached_site):
+    return make_site_app(SERVER_NAME, cached_site.id, PAGE_CACHE_ENABLED=True)
+
+
+def test_page_is_cached_and_invalidated_on_update(
+    cached_site_app, cached_site, admin_user
+):
+    url_path = f'/page-{generate_token()}'
+    version, _ = page_service.create_page(
+        cached_site, 'cached', 'de', url_path, admin_user, 'Cached', 'Version 1'
+    )
+
+    with http_client(cached_site_app) as client:
+        response1 = client.get(f'{BASE_URL}{url_path}')
+        response2 = client.get(
+            f'{BASE_URL}{url_path}',
+            headers={'If-None-Match': response1.headers['ETag']},
+        )
+
+    assert response1.status_code == 200
+    assert 'Version 1' in response1.get_data(as_text=True)
+    assert response2.status_code == 304
+
+    page_service.update_page(
+        version.page_id, 'de', url_path, admin_user, 'Cached', None, 'Version 2'
+    )
+
+    with http_client(cached_site_app) as client:
+        response3 = client.get(
+            f'{BASE_URL}{url_path}',
+            headers={'If-None-Match': response1.headers['ETag']},
+        )
+
+    assert response3.status_code == 200
+    assert 'Version 2' in response3.get_data(as_text=True)
+
+
+def test_request_with_query_arguments_is_not_cached(
+    cached_site_app, cached_site, admin_user
+):
+    url_path = f'/page-{generate_token()}'
+    page_service.create_page(
+        cached_site, 'uncached', 'de', url_path, admin_user, 'Uncached', 'Body'
+    )
+
+    with http_client(cached_site_app) as client:
+        response = client.get(f'{BASE_URL}{url_path}?{generate_token()}=1')
+
+    assert response.status_code == 200
+    assert 'ETag' not in response.headers
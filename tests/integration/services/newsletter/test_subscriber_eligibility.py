@@ -0,0 +1,59 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+
+import pytest
+
+from byceps.services.newsletter import (
+    newsletter_command_service,
+    newsletter_service,
+)
+from byceps.services.user import user_command_service
+
+from tests.helpers import generate_token
+
+
+def test_eligibility_follows_account_suspension(
+    newsletter_list, make_user, admin_user
+):
+    email_address = f'{generate_token()}@users.test'
+    user = make_user(email_address=email_address, email_address_verified=True)
+
+    newsletter_command_service.subscribe(
+        user, newsletter_list, datetime.utcnow()
+    ).unwrap()
+    assert get_subscriber_email_addresses(newsletter_list.id) == {email_address}
+
+    user_command_service.suspend_account(user, admin_user, 'Spamming')
+    assert newsletter_service.count_subscribers(newsletter_list.id) == 0
+    assert get_subscriber_email_addresses(newsletter_list.id) == set()
+
+    user_command_service.unsuspend_account(user, admin_user, 'Repented')
+    assert newsletter_service.count_subscribers(newsletter_list.id) == 1
+
+
+def test_eligibility_is_determined_on_subscription(newsletter_list, make_user):
+    user = make_user(email_address_verified=False)
+
+    newsletter_command_service.subscribe(
+        user, newsletter_list, datetime.utcnow()
+    ).unwrap()
+
+    assert newsletter_service.count_subscribers(newsletter_list.id) == 0
+    assert get_subscriber_email_addresses(newsletter_list.id) == set()
+
+
+@pytest.fixture()
+def newsletter_list(admin_app):
+    list_id = generate_token()
+    return newsletter_command_service.create_list(list_id, list_id)
+
+
+def get_subscriber_email_addresses(list_id):
+    return {
+        subscriber.email_address
+        for subscriber in newsletter_service.get_subscribers(list_id)
+    }
@@ -0,0 +1,46 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from byceps.services.shop.article import article_service
+
+
+@pytest.fixture()
+def shop(make_brand, make_shop):
+    brand = make_brand()
+    return make_shop(brand.id)
+
+
+def test_cached_compilation_reflects_attachments(admin_app, shop, make_article):
+    article = make_article(shop.id)
+    # not orderable on its own (yet)
+    article_to_attach = make_article(
+        shop.id, available_from=datetime.utcnow() + timedelta(days=1)
+    )
+
+    compilation_before = get_compilation(shop.id)
+    assert [item.article.id for item in compilation_before] == [article.id]
+
+    article_service.attach_article(article_to_attach.id, 2, article.id)
+
+    compilation_after = get_compilation(shop.id)
+    assert [
+        (item.article.id, item.fixed_quantity) for item in compilation_after
+    ] == [(article.id, None), (article_to_attach.id, 2)]
+
+    # Repeated requests are served from the cache.
+    assert get_compilation(shop.id) is compilation_after
+
+
+def get_compilation(shop_id):
+    result = (
+        article_service.get_article_compilation_for_orderable_articles_cached(
+            shop_id
+        )
+    )
+    return result.unwrap()
@@ -0,0 +1,126 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from unittest.mock import patch
+
+from flask import Flask
+import pytest
+
+from byceps.services.shop.article.models import Article
+from byceps.services.shop.order import order_service
+from byceps.services.shop.order.models.order import (
+    Order,
+    OrderFulfillmentState,
+    Orderer,
+    PaymentState,
+)
+from byceps.services.shop.shop.models import Shop
+from byceps.services.shop.storefront.models import Storefront
+from byceps.services.ticketing.models.ticket import TicketCategory
+from byceps.services.user.models.user import User
+
+from tests.helpers.shop import create_ticket_article
+
+from .helpers import get_tickets_for_order, mark_order_as_paid, place_order
+
+
+@pytest.fixture()
+def article(shop: Shop, ticket_category: TicketCategory) -> Article:
+    return create_ticket_article(shop.id, ticket_category.id)
+
+
+@pytest.fixture(scope='module')
+def ticket_quantity() -> int:
+    return 4
+
+
+@pytest.fixture()
+def order(
+    article: Article, ticket_quantity, storefront: Storefront, orderer: Orderer
+) -> Order:
+    articles_with_quantity = [(article, ticket_quantity)]
+    return place_order(storefront, orderer, articles_with_quantity)
+
+
+@patch('byceps.services.shop.order.order_service.enqueue')
+def test_cancel_order_with_pending_fulfillment(
+    enqueue_mock,
+    admin_app: Flask,
+    admin_user: User,
+    order: Order,
+) -> None:
+    mark_order_as_paid(order.id, admin_user)
+
+    fulfillment_state, _ = order_service.get_fulfillment_state(order.id)
+    assert fulfillment_state == OrderFulfillmentState.pending
+
+    cancel_order(order, admin_user)
+
+    fulfillment_state, _ = order_service.get_fulfillment_state(order.id)
+    assert fulfillment_state is None
+
+    # The fulfillment job, executed late, has no effect.
+    order_service.fulfill_order(order.id, admin_user.id)
+    assert len(get_tickets_for_order(order)) == 0
+
+
+@patch('byceps.services.ticketing.ticket_code_service._generate_ticket_code')
+def test_cancel_order_with_failed_fulfillment(
+    generate_ticket_code_mock,
+    admin_app: Flask,
+    admin_user: User,
+    order: Order,
+) -> None:
+    generate_ticket_code_mock.side_effect = lambda: 'EQUAL'  # noqa: E731
+
+    mark_order_as_paid(order.id, admin_user)
+
+    fulfillment_state, _ = order_service.get_fulfillment_state(order.id)
+    assert fulfillment_state == OrderFulfillmentState.failed
+
+    cancel_order(order, admin_user)
+
+    fulfillment_state, _ = order_service.get_fulfillment_state(order.id)
+    assert fulfillment_state is None
+
+    result = order_service.retry_order_fulfillment(order.id, admin_user)
+    assert result.is_err()
+
+    assert len(get_tickets_for_order(order)) == 0
+
+
+@patch('byceps.services.shop.order.actions.ticket.send_tickets_sold_event')
+def test_cancel_order_with_fulfillment_in_progress(
+    send_tickets_sold_event_mock,
+    admin_app: Flask,
+    ticket_quantity: int,
+    admin_user: User,
+    order: Order,
+) -> None:
+    # Cancel the order right after the tickets have been created.
+    def cancel_order_meanwhile(_) -> None:
+        cancel_order(order, admin_user)
+
+    send_tickets_sold_event_mock.side_effect = cancel_order_meanwhile
+
+    mark_order_as_paid(order.id, admin_user)
+
+    canceled_order = order_service.get_order(order.id)
+    assert canceled_order.payment_state == PaymentState.canceled_after_paid
+
+    # The fulfillment job has revoked the tickets it had created.
+    tickets = get_tickets_for_order(order)
+    assert len(tickets) == ticket_quantity
+    assert all(ticket.revoked for ticket in tickets)
+
+    fulfillment_state, _ = order_service.get_fulfillment_state(order.id)
+    assert fulfillment_state is None
+
+
+# helpers
+
+
+def cancel_order(order: Order, initiator: User) -> None:
+    order_service.cancel_order(order.id, initiator, 'Changed my mind').unwrap()
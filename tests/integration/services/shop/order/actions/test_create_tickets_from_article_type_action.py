@@ -13,13 +13,14 @@ from byceps.events.ticketing import TicketsSoldEvent
 from byceps.services.party.models import Party
 from byceps.services.shop.article.models import Article
 from byceps.services.shop.order import order_log_service, order_service
-from byceps.services.shop.order.models.order import Order, Orderer
+from byceps.services.shop.order.models.order import (
+    Order,
+    OrderFulfillmentState,
+    Orderer,
+)
 from byceps.services.shop.shop.models import Shop
 from byceps.services.shop.storefront.models import Storefront
 from byceps.services.ticketing.models.ticket import TicketCategory
-from byceps.services.ticketing.ticket_creation_service import (
-    TicketCreationFailedError,
-)
 from byceps.services.user.models.user import User
 
 from tests.helpers.shop import create_ticket_article
@@ -110,8 +111,18 @@ def test_create_tickets_with_same_code_fails(
 ) -> None:
     generate_ticket_code_mock.side_effect = lambda: 'EQUAL'  # noqa: E731
 
-    with pytest.raises(TicketCreationFailedError):
-        mark_order_as_paid(order.id, admin_user)
+    mark_order_as_paid(order.id, admin_user)
+
+    # The order is paid nonetheless, but its fulfillment has failed.
+    assert order_service.get_order(order.id).is_paid
+
+    fulfillment_state, fulfillment_error = order_service.get_fulfillment_state(
+        order.id
+    )
+    assert fulfillment_state == OrderFulfillmentState.failed
+    assert fulfillment_error is not None
+
+    assert len(get_tickets_for_order(order)) == 0
 
 
 @patch('byceps.services.ticketing.ticket_code_service._generate_ticket_code')
@@ -139,3 +150,41 @@ def test_create_tickets_with_temporarily_equal_code_and_retry_succeeds(
 
     tickets_after_paid = get_tickets_for_order(order)
     assert len(tickets_after_paid) == ticket_quantity
+
+
+@patch('byceps.services.ticketing.ticket_code_service._generate_ticket_code')
+def test_retry_failed_fulfillment(
+    generate_ticket_code_mock,
+    admin_app: Flask,
+    article: Article,
+    ticket_category: TicketCategory,
+    ticket_quantity: int,
+    admin_user: User,
+    orderer: Orderer,
+    order: Order,
+) -> None:
+    generate_ticket_code_mock.side_effect = lambda: 'EQUAL'  # noqa: E731
+
+    mark_order_as_paid(order.id, admin_user)
+
+    fulfillment_state, _ = order_service.get_fulfillment_state(order.id)
+    assert fulfillment_state == OrderFulfillmentState.failed
+
+    codes_iter = iter(['TICK1', 'TICK2', 'TICK3', 'TICK4'])
+    generate_ticket_code_mock.side_effect = lambda: next(codes_iter)  # noqa: E731
+
+    order_service.retry_order_fulfillment(order.id, admin_user).unwrap()
+
+    fulfillment_state, fulfillment_error = order_service.get_fulfillment_state(
+        order.id
+    )
+    assert fulfillment_state == OrderFulfillmentState.succeeded
+    assert fulfillment_error is None
+    assert len(get_tickets_for_order(order)) == ticket_quantity
+
+    # Fulfilling again (e.g. by a duplicate job) has no effect.
+    order_service.fulfill_order(order.id, admin_user.id)
+    assert len(get_tickets_for_order(order)) == ticket_quantity
+
+    result = order_service.retry_order_fulfillment(order.id, admin_user)
+    assert result.is_err()
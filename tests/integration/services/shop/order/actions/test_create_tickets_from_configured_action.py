@@ -15,14 +15,16 @@ from byceps.services.shop.article.models import Article
 from byceps.services.shop.order import (
     order_action_registry_service,
     order_log_service,
+    order_service,
+)
+from byceps.services.shop.order.models.order import (
+    Order,
+    OrderFulfillmentState,
+    Orderer,
 )
-from byceps.services.shop.order.models.order import Order, Orderer
 from byceps.services.shop.shop.models import Shop
 from byceps.services.shop.storefront.models import Storefront
 from byceps.services.ticketing.models.ticket import TicketCategory
-from byceps.services.ticketing.ticket_creation_service import (
-    TicketCreationFailedError,
-)
 from byceps.services.user.models.user import User
 
 from .helpers import get_tickets_for_order, mark_order_as_paid, place_order
@@ -110,8 +112,18 @@ def test_create_tickets_with_same_code_fails(
 ) -> None:
     generate_ticket_code_mock.side_effect = lambda: 'EQUAL'  # noqa: E731
 
-    with pytest.raises(TicketCreationFailedError):
-        mark_order_as_paid(order.id, admin_user)
+    mark_order_as_paid(order.id, admin_user)
+
+    # The order is paid nonetheless, but its fulfillment has failed.
+    assert order_service.get_order(order.id).is_paid
+
+    fulfillment_state, fulfillment_error = order_service.get_fulfillment_state(
+        order.id
+    )
+    assert fulfillment_state == OrderFulfillmentState.failed
+    assert fulfillment_error is not None
+
+    assert len(get_tickets_for_order(order)) == 0
 
 
 @patch('byceps.services.ticketing.ticket_code_service._generate_ticket_code')
@@ -46,3 +46,26 @@ def test_generate_order_number_custom(admin_app, shop2):
     actual = order_sequence_service.generate_order_number(sequence.id).unwrap()
 
     assert actual == 'LOL-03-B00207'
+
+
+def test_generate_order_numbers_from_reserved_block(admin_app, shop1):
+    shop = shop1
+
+    sequence = order_sequence_service.create_order_number_sequence(
+        shop.id, 'ONE-02-B'
+    ).unwrap()
+
+    actual = [
+        order_sequence_service.generate_order_number(
+            sequence.id, block_size=10
+        ).unwrap()
+        for _ in range(3)
+    ]
+
+    assert actual == ['ONE-02-B00001', 'ONE-02-B00002', 'ONE-02-B00003']
+
+    # The whole block has been reserved at once.
+    sequence_after = order_sequence_service.get_order_number_sequence(
+        sequence.id
+    )
+    assert sequence_after.value == 10
@@ -0,0 +1,93 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from byceps.database import KeysetCountMode
+from byceps.services.shop.order import order_checkout_service, order_service
+
+
+@pytest.fixture()
+def orders(admin_app, storefront, make_user, make_orderer, empty_cart):
+    orderer = make_orderer(make_user())
+    base = datetime(2024, 3, 1, 12, 0, 0)
+
+    # Two orders share the same creation date to require the order ID
+    # as a tiebreaker.
+    created_ats = [
+        base,
+        base + timedelta(minutes=1),
+        base + timedelta(minutes=1),
+        base + timedelta(minutes=2),
+        base + timedelta(minutes=3),
+    ]
+
+    return [
+        order_checkout_service.place_order(
+            storefront, orderer, empty_cart, created_at=created_at
+        ).unwrap()[0]
+        for created_at in created_ats
+    ]
+
+
+def test_walk_pages_forward_and_backward(storefront, orders):
+    shop_id = orders[0].shop_id
+    expected_ids = [
+        order.id
+        for order in sorted(
+            orders, key=lambda o: (o.created_at, o.id), reverse=True
+        )
+    ]
+
+    page1 = order_service.get_orders_for_shop_paginated(
+        shop_id, 2, count_mode=KeysetCountMode.exact
+    )
+    assert page1.total == 5
+    assert not page1.total_is_estimate
+    assert not page1.has_prev
+    assert page1.has_next
+
+    page2 = order_service.get_orders_for_shop_paginated(
+        shop_id, 2, after=page1.next_cursor
+    )
+    assert page2.has_prev
+    assert page2.has_next
+
+    page3 = order_service.get_orders_for_shop_paginated(
+        shop_id, 2, after=page2.next_cursor
+    )
+    assert page3.has_prev
+    assert not page3.has_next
+
+    actual_ids = [
+        order.id for page in (page1, page2, page3) for order in page.items
+    ]
+    assert actual_ids == expected_ids
+
+    page2_again = order_service.get_orders_for_shop_paginated(
+        shop_id, 2, before=page3.prev_cursor
+    )
+    assert [order.id for order in page2_again.items] == [
+        order.id for order in page2.items
+    ]
+
+    page1_again = order_service.get_orders_for_shop_paginated(
+        shop_id, 2, before=page2_again.prev_cursor
+    )
+    assert [order.id for order in page1_again.items] == expected_ids[:2]
+    assert not page1_again.has_prev
+
+
+def test_estimated_total(storefront, orders):
+    shop_id = orders[0].shop_id
+
+    page = order_service.get_orders_for_shop_paginated(
+        shop_id, 2, count_mode=KeysetCountMode.estimate
+    )
+
+    assert page.total is not None
+    assert page.total_is_estimate
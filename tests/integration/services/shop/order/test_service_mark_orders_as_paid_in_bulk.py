@@ -0,0 +1,122 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import date
+
+from moneyed import Money
+import pytest
+
+from byceps.services.shop.order import (
+    order_bulk_payment_service,
+    order_checkout_service,
+    order_payment_service,
+    order_service,
+)
+from byceps.services.shop.order.models.bulk_payment import (
+    BulkPaymentStatus,
+    IncomingPayment,
+)
+from byceps.services.shop.order.models.number import OrderNumber
+from byceps.services.shop.order.models.order import PaymentState
+
+
+@pytest.fixture(scope='module')
+def orderer(make_user, make_orderer):
+    user = make_user()
+    return make_orderer(user)
+
+
+@pytest.fixture()
+def place_order(admin_app, storefront, orderer, empty_cart):
+    def _wrapper(storefront=storefront):
+        order, _ = order_checkout_service.place_order(
+            storefront, orderer, empty_cart
+        ).unwrap()
+        return order
+
+    return _wrapper
+
+
+@pytest.fixture()
+def other_storefront(
+    shop_brand, make_shop, make_order_number_sequence, make_storefront
+):
+    other_shop = make_shop(shop_brand.id)
+    order_number_sequence = make_order_number_sequence(other_shop.id)
+
+    return make_storefront(other_shop.id, order_number_sequence.id)
+
+
+def test_mark_orders_as_paid_in_bulk(shop, place_order, admin_user):
+    order1 = place_order()
+    order2 = place_order()
+    order3 = place_order()
+    paid_order = place_order()
+    order_service.mark_order_as_paid(paid_order.id, 'cash', admin_user)
+
+    paid_on = date(2024, 3, 1)
+    wrong_amount = order3.total_amount + Money('1.00', 'EUR')
+
+    payments = [
+        IncomingPayment(order1.order_number, order1.total_amount, paid_on),
+        IncomingPayment(OrderNumber('unknown'), order1.total_amount, paid_on),
+        IncomingPayment(order2.order_number, order2.total_amount, paid_on),
+        IncomingPayment(order1.order_number, order1.total_amount, paid_on),
+        IncomingPayment(order3.order_number, wrong_amount, paid_on),
+        IncomingPayment(
+            paid_order.order_number, paid_order.total_amount, paid_on
+        ),
+    ]
+
+    results = order_bulk_payment_service.mark_orders_as_paid(
+        shop.id, payments, 'bank_transfer', admin_user, batch_size=1
+    )
+
+    assert [result.payment for result in results] == payments
+    assert [result.status for result in results] == [
+        BulkPaymentStatus.paid,
+        BulkPaymentStatus.unknown_order,
+        BulkPaymentStatus.paid,
+        BulkPaymentStatus.duplicate,
+        BulkPaymentStatus.amount_mismatch,
+        BulkPaymentStatus.already_paid,
+    ]
+
+    for order in order1, order2:
+        order_after = order_service.get_order(order.id)
+        assert order_after.payment_state == PaymentState.paid
+        assert order_after.payment_method == 'bank_transfer'
+
+        order_payments = order_payment_service.get_payments_for_order(order.id)
+        assert len(order_payments) == 1
+        assert order_payments[0].additional_data == {'paid_on': '2024-03-01'}
+
+    assert order_service.get_order(order3.id).payment_state == PaymentState.open
+
+
+def test_mark_orders_of_other_shop_as_paid_in_bulk(
+    shop, other_storefront, place_order, admin_user
+):
+    other_shop_order = place_order(other_storefront)
+
+    payments = [
+        IncomingPayment(
+            other_shop_order.order_number,
+            other_shop_order.total_amount,
+            date(2024, 3, 1),
+        ),
+    ]
+
+    results = order_bulk_payment_service.mark_orders_as_paid(
+        shop.id, payments, 'bank_transfer', admin_user
+    )
+
+    assert [result.status for result in results] == [
+        BulkPaymentStatus.unknown_order
+    ]
+    assert [result.order_id for result in results] == [None]
+
+    order_after = order_service.get_order(other_shop_order.id)
+    assert order_after.payment_state == PaymentState.open
@@ -0,0 +1,84 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from moneyed import EUR
+import pytest
+
+from byceps.services.shop.article import article_service
+from byceps.services.shop.article.errors import ArticlesSoldOutError
+from byceps.services.shop.cart.models import Cart
+from byceps.services.shop.order import order_checkout_service, order_service
+
+
+THREAD_COUNT = 8
+ATTEMPTS_PER_THREAD = 5
+AVAILABLE_QUANTITY = 10
+
+
+@pytest.fixture()
+def article(shop, make_article):
+    return make_article(shop.id, total_quantity=AVAILABLE_QUANTITY)
+
+
+@pytest.fixture()
+def orderer(make_user, make_orderer):
+    return make_orderer(make_user())
+
+
+def test_place_orders_concurrently_does_not_oversell(
+    admin_app, storefront, article, orderer, admin_user
+):
+    def place_orders(app):
+        with app.app_context():
+            results = []
+            for _ in range(ATTEMPTS_PER_THREAD):
+                cart = Cart(EUR)
+                cart.add_item(article, 1)
+                results.append(
+                    order_checkout_service.place_order(
+                        storefront, orderer, cart
+                    )
+                )
+            return results
+
+    with ThreadPoolExecutor(max_workers=THREAD_COUNT) as executor:
+        futures = [
+            executor.submit(place_orders, admin_app)
+            for _ in range(THREAD_COUNT)
+        ]
+        results = [result for future in futures for result in future.result()]
+
+    placed_orders = [result.unwrap()[0] for result in results if result.is_ok()]
+    errors = [result.unwrap_err() for result in results if result.is_err()]
+
+    assert len(placed_orders) == AVAILABLE_QUANTITY
+    assert len(errors) == len(results) - AVAILABLE_QUANTITY
+    assert all(isinstance(error, ArticlesSoldOutError) for error in errors)
+
+    assert article_service.get_article(article.id).quantity == 0
+
+    # Canceling an order makes its quantity available again.
+    order_service.cancel_order(placed_orders[0].id, admin_user, 'Not paid')
+
+    assert article_service.get_article(article.id).quantity == 1
+
+
+def test_reserve_all_or_nothing(
+    admin_app, shop, storefront, orderer, make_article
+):
+    article1 = make_article(shop.id, total_quantity=5)
+    article2 = make_article(shop.id, total_quantity=1)
+
+    cart = Cart(EUR)
+    cart.add_item(article1, 2)
+    cart.add_item(article2, 2)
+
+    result = order_checkout_service.place_order(storefront, orderer, cart)
+
+    assert result.unwrap_err() == ArticlesSoldOutError(frozenset({article2.id}))
+    assert article_service.get_article(article1.id).quantity == 5
+    assert article_service.get_article(article2.id).quantity == 1
@@ -0,0 +1,74 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.site_navigation import site_navigation_service
+from byceps.services.site_navigation.models import NavItemTargetType
+
+from tests.helpers import generate_token
+
+
+def test_index_is_rebuilt_after_changes(admin_app, site):
+    menu_name = f'menu-{generate_token()}'
+    menu = site_navigation_service.create_menu(site.id, menu_name, 'en')
+
+    assert (
+        site_navigation_service.get_items_for_menu(site.id, menu_name, 'en')
+        == []
+    )
+
+    item = site_navigation_service.create_item(
+        menu.id, NavItemTargetType.page, 'info', 'Info', 'info'
+    ).unwrap()
+
+    assert site_navigation_service.get_items_for_menu(
+        site.id, menu_name, 'en'
+    ) == [item]
+    assert site_navigation_service.get_items_for_menu_id(site.id, menu.id) == [
+        item
+    ]
+
+    site_navigation_service.update_item(
+        item.id, NavItemTargetType.page, 'info', 'Info', 'info', True
+    ).unwrap()
+
+    assert (
+        site_navigation_service.get_items_for_menu(site.id, menu_name, 'en')
+        == []
+    )
+
+
+def test_find_submenu_id_for_page_and_view(admin_app, site):
+    menu = site_navigation_service.create_menu(
+        site.id, f'menu-{generate_token()}', 'en'
+    )
+    submenu = site_navigation_service.create_menu(
+        site.id, f'submenu-{generate_token()}', 'en', parent_menu_id=menu.id
+    )
+    page_name = f'page-{generate_token()}'
+    site_navigation_service.create_item(
+        submenu.id, NavItemTargetType.page, page_name, 'Page', page_name
+    ).unwrap()
+    site_navigation_service.create_item(
+        submenu.id, NavItemTargetType.view, 'gallery', 'Gallery', 'gallery'
+    ).unwrap()
+
+    assert (
+        site_navigation_service.find_submenu_id_for_page(
+            site.id, 'en', page_name
+        )
+        == submenu.id
+    )
+    assert (
+        site_navigation_service.find_submenu_id_for_view(
+            site.id, 'en', 'gallery'
+        )
+        == submenu.id
+    )
+    assert (
+        site_navigation_service.find_submenu_id_for_page(
+            site.id, 'de', page_name
+        )
+        is None
+    )
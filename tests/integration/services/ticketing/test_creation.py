@@ -8,6 +8,7 @@ from unittest.mock import patch
 import pytest
 
 from byceps.services.ticketing import (
+    ticket_code_service,
     ticket_creation_service,
     ticket_log_service,
 )
@@ -71,6 +72,57 @@ def test_create_tickets_with_clashing_generated_codes(
     )
 
 
+@patch('byceps.services.ticketing.ticket_code_service._generate_ticket_code')
+def test_create_tickets_regenerates_only_codes_used_for_party(
+    generate_ticket_code_mock, admin_app, category, ticket_owner
+):
+    generate_ticket_code_mock.return_value = 'USEDD'
+    ticket_creation_service.create_ticket(
+        category.party_id, category.id, ticket_owner
+    )
+
+    statistics_before = ticket_code_service.get_generation_statistics()
+
+    generate_ticket_code_mock.side_effect = ['USEDD', 'FRESH', 'USEDD', 'NEWER']
+
+    tickets = ticket_creation_service.create_tickets(
+        category.party_id, category.id, ticket_owner, 2
+    )
+
+    assert {ticket.code for ticket in tickets} == {'FRESH', 'NEWER'}
+
+    statistics_after = ticket_code_service.get_generation_statistics()
+    assert (
+        statistics_after.collisions_with_existing
+        == statistics_before.collisions_with_existing + 1
+    )
+    assert statistics_after.insert_conflicts == (
+        statistics_before.insert_conflicts
+    )
+
+
+@patch('byceps.services.ticketing.ticket_code_service._generate_ticket_code')
+def test_create_tickets_checks_codes_regenerated_in_last_round(
+    generate_ticket_code_mock, admin_app, category, ticket_owner
+):
+    used_codes = ['USED1', 'USED2', 'USED3', 'USED4']
+    generate_ticket_code_mock.side_effect = used_codes
+    for _ in used_codes:
+        ticket_creation_service.create_ticket(
+            category.party_id, category.id, ticket_owner
+        )
+
+    # Collide in the initial and the first three regeneration rounds,
+    # succeed in the fourth (and last) one.
+    generate_ticket_code_mock.side_effect = used_codes + ['FRESH']
+
+    tickets = ticket_creation_service.create_tickets(
+        category.party_id, category.id, ticket_owner, 1
+    )
+
+    assert [ticket.code for ticket in tickets] == ['FRESH']
+
+
 def assert_created_ticket(ticket, expected_category_id, expected_owner_id):
     assert ticket is not None
     assert ticket.created_at is not None
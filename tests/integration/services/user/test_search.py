@@ -0,0 +1,83 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.user import user_service
+
+from tests.helpers import generate_token
+
+
+@pytest.fixture(scope='module')
+def name() -> str:
+    return f'Sirius{generate_token(6)}'.lower()
+
+
+@pytest.fixture(scope='module')
+def user_with_similar_screen_name(make_user, name):
+    return make_user(f'{name}xyz', last_name='Black')
+
+
+@pytest.fixture(scope='module')
+def user_with_exact_screen_name(make_user, name):
+    return make_user(name, last_name='White')
+
+
+@pytest.fixture(scope='module')
+def user_with_matching_first_name(make_user, name):
+    return make_user(first_name=name, last_name='Black')
+
+
+def test_search_users_ranks_better_matches_first(
+    admin_app,
+    name,
+    user_with_similar_screen_name,
+    user_with_exact_screen_name,
+    user_with_matching_first_name,
+):
+    actual = user_service.search_users(name, 10)
+
+    assert len(actual) == 3
+    assert {user.id for user in actual[:2]} == {
+        user_with_exact_screen_name.id,
+        user_with_matching_first_name.id,
+    }
+    assert actual[2].id == user_with_similar_screen_name.id
+
+
+@pytest.mark.parametrize(
+    ('search_term_template', 'expected_fixture_names'),
+    [
+        (
+            '{name} black',
+            {'user_with_similar_screen_name', 'user_with_matching_first_name'},
+        ),
+        ('{name} white', {'user_with_exact_screen_name'}),
+        ('{name} gray', set()),
+    ],
+)
+def test_search_users_matches_all_terms(
+    admin_app,
+    request,
+    name,
+    user_with_similar_screen_name,
+    user_with_exact_screen_name,
+    user_with_matching_first_name,
+    search_term_template,
+    expected_fixture_names,
+):
+    search_term = search_term_template.format(name=name)
+
+    actual = user_service.search_users(search_term, 10)
+
+    expected_user_ids = {
+        request.getfixturevalue(fixture_name).id
+        for fixture_name in expected_fixture_names
+    }
+    assert {user.id for user in actual} == expected_user_ids
+
+
+def test_search_users_with_blank_search_term(admin_app):
+    assert user_service.search_users('  ', 10) == []
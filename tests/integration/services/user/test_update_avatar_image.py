@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pytest
 
-from byceps.services.user import user_avatar_service
+from byceps.services.user import user_avatar_service, user_service
 from byceps.util.image.models import ImageType
 
 
@@ -25,7 +25,22 @@ def test_path(data_path, database, user, image_extension, image_type):
         ).unwrap()
 
     avatar = user_avatar_service.get_db_avatar(avatar_id)
-    expected_filename = f'{avatar.id}.{image_extension}'
-    expected = data_path / 'global' / 'users' / 'avatars' / expected_filename
+    avatar_path = data_path / 'global' / 'users' / 'avatars' / str(avatar.id)
+    expected = avatar_path / f'512.{image_extension}'
 
     assert avatar.path == expected
+
+    # Variants have been created (synchronously, in tests), and the
+    # uploaded image has been removed.
+    assert sorted(path.name for path in avatar_path.iterdir()) == sorted(
+        [
+            f'64.{image_extension}',
+            f'128.{image_extension}',
+            f'512.{image_extension}',
+            '64.webp',
+            '128.webp',
+            '512.webp',
+        ]
+    )
+
+    assert user_service.get_db_user(user.id).avatar_id == avatar_id
@@ -0,0 +1,42 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.user import (
+    user_cache_service,
+    user_command_service,
+    user_service,
+)
+
+
+def test_only_missing_users_are_loaded(admin_app, make_user):
+    user1 = make_user()
+    user2 = make_user()
+
+    loaded_user_id_sets = []
+
+    def load_users(user_ids):
+        loaded_user_id_sets.append(user_ids)
+        return user_service.get_users(user_ids)
+
+    actual1 = user_cache_service.get_users({user1.id}, load_users)
+    actual2 = user_cache_service.get_users({user1.id, user2.id}, load_users)
+
+    assert actual1.keys() == {user1.id}
+    assert actual2.keys() == {user1.id, user2.id}
+    assert loaded_user_id_sets == [{user1.id}, {user2.id}]
+
+
+def test_screen_name_change_invalidates_cached_user(
+    admin_app, make_user, admin_user
+):
+    user = make_user('Cachey')
+
+    users_before = user_service.get_users({user.id}, include_avatars=True)
+    assert {u.screen_name for u in users_before} == {'Cachey'}
+
+    user_command_service.change_screen_name(user, 'Cachey2', admin_user)
+
+    users_after = user_service.get_users({user.id}, include_avatars=True)
+    assert {u.screen_name for u in users_after} == {'Cachey2'}
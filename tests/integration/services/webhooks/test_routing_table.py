@@ -0,0 +1,41 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.webhooks import webhook_service
+
+
+def test_routing_table_follows_webhook_changes(admin_app):
+    webhook = webhook_service.create_outgoing_webhook(
+        {'routing-test-a', 'routing-test-b'},
+        {},
+        'discord',
+        'https://webhooks.test/routing',
+        True,
+    )
+
+    assert get_webhook_ids('routing-test-a') == {webhook.id}
+    assert get_webhook_ids('routing-test-b') == {webhook.id}
+    assert get_webhook_ids('routing-test-c') == set()
+
+    webhook_service.update_outgoing_webhook(
+        webhook.id,
+        {'routing-test-a'},
+        {},
+        webhook.format,
+        webhook.text_prefix,
+        webhook.extra_fields,
+        webhook.url,
+        webhook.description,
+        False,
+    ).unwrap()
+
+    assert get_webhook_ids('routing-test-a') == set()
+
+    webhook_service.delete_outgoing_webhook(webhook.id)
+
+
+def get_webhook_ids(event_type: str):
+    webhooks = webhook_service.get_enabled_outgoing_webhooks_cached(event_type)
+    return {webhook.id for webhook in webhooks}
@@ -0,0 +1,62 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import date
+
+from moneyed import EUR, Money
+import pytest
+
+from byceps.blueprints.admin.shop.order.service import (
+    parse_incoming_payments,
+)
+from byceps.services.shop.order.models.bulk_payment import IncomingPayment
+from byceps.services.shop.order.models.number import OrderNumber
+
+
+@pytest.mark.parametrize(
+    'text',
+    [
+        'AC-14-B00017,12.50,2024-03-01\nAC-14-B00018,7,2024-03-02\n',
+        'AC-14-B00017;12,50;01.03.2024\nAC-14-B00018;7;02.03.2024\n',
+        'AC-14-B00017\t12.50\t2024-03-01\n\nAC-14-B00018\t7.00\t2024-03-02',
+    ],
+)
+def test_parse_incoming_payments(text):
+    expected = [
+        IncomingPayment(
+            order_number=OrderNumber('AC-14-B00017'),
+            amount=Money('12.50', EUR),
+            paid_on=date(2024, 3, 1),
+        ),
+        IncomingPayment(
+            order_number=OrderNumber('AC-14-B00018'),
+            amount=Money('7.00', EUR),
+            paid_on=date(2024, 3, 2),
+        ),
+    ]
+
+    assert parse_incoming_payments(text, EUR).unwrap() == expected
+
+
+@pytest.mark.parametrize(
+    ('text', 'expected_error'),
+    [
+        ('', 'No payments given.'),
+        (
+            'AC-14-B00017;12.50',
+            'Line 1: Expected order number, amount, and date.',
+        ),
+        (
+            'AC-14-B00017;12.50;2024-03-01\nAC-14-B00018;lots;2024-03-02',
+            'Line 2: Invalid amount "lots".',
+        ),
+        (
+            'AC-14-B00017;12.50;yesterday',
+            'Line 1: Invalid date "yesterday".',
+        ),
+    ],
+)
+def test_parse_invalid_incoming_payments(text, expected_error):
+    assert parse_incoming_payments(text, EUR).unwrap_err() == expected_error
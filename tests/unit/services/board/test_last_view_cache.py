@@ -0,0 +1,42 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from byceps.services.board import board_last_view_cache_service
+from byceps.services.user.models.user import UserID
+
+from tests.helpers import generate_uuid
+
+
+USER_ID = UserID(generate_uuid())
+
+
+@patch('byceps.util.cache.set_hash_fields')
+@patch('byceps.util.cache.get_hash_fields')
+def test_roundtrip(get_hash_fields, set_hash_fields):
+    viewed_id = generate_uuid()
+    not_viewed_id = generate_uuid()
+    missing_id = generate_uuid()
+    viewed_at = datetime(2024, 3, 17, 20, 15, 31, 123456)
+
+    board_last_view_cache_service.store_last_views(
+        'topic', USER_ID, {viewed_id: viewed_at, not_viewed_id: None}
+    )
+
+    (key, values, _), _ = set_hash_fields.call_args
+    assert key == f'board:last-topic-views:{USER_ID}'
+
+    get_hash_fields.side_effect = lambda key, fields: [
+        values.get(field) for field in fields
+    ]
+
+    actual, missing_ids = board_last_view_cache_service.get_last_views(
+        'topic', USER_ID, [viewed_id, not_viewed_id, missing_id]
+    )
+
+    assert actual == {viewed_id: viewed_at, not_viewed_id: None}
+    assert missing_ids == {missing_id}
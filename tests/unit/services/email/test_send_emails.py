@@ -0,0 +1,50 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import socket
+from unittest.mock import patch
+
+import pytest
+
+from byceps.services.email import email_service
+
+
+@pytest.fixture()
+def app_with_unreachable_smtp_server(make_app):
+    # Get a port that nothing listens on.
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        _, unused_port = sock.getsockname()
+
+    app = make_app(
+        additional_config={'MAIL_HOST': '127.0.0.1', 'MAIL_PORT': unused_port}
+    )
+
+    with app.app_context():
+        yield app
+
+
+@patch('byceps.services.email.email_service.enqueue_many')
+def test_emails_are_enqueued_again_if_server_is_unreachable(
+    enqueue_many_mock, app_with_unreachable_smtp_server
+):
+    emails = [
+        ('noreply@acmecon.test', [f'user{i}@users.test'], 'Hi', 'Hello!')
+        for i in range(3)
+    ]
+
+    # Does not raise, so that the job is not retried as a whole.
+    email_service.send_emails(emails)
+
+    enqueue_many_mock.assert_called_once_with(email_service.send_email, emails)
+
+
+def test_single_email_fails_if_server_is_unreachable(
+    app_with_unreachable_smtp_server,
+):
+    with pytest.raises(ConnectionRefusedError):
+        email_service.send(
+            'noreply@acmecon.test', ['user@users.test'], 'Hi', 'Hello!'
+        )
@@ -0,0 +1,231 @@
+"""
+Send messages to a local SMTP stand-in that delays its greeting like a
+remote server with a TLS handshake would.
+
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from collections.abc import Iterator
+import dataclasses
+from datetime import timedelta
+from email.message import EmailMessage
+from smtplib import SMTPRecipientsRefused
+import socket
+from socketserver import StreamRequestHandler, ThreadingTCPServer
+from threading import Thread
+import time
+
+import pytest
+
+from byceps.services.email.smtp import SmtpConfig, SmtpConnectionManager
+
+
+CONNECT_DELAY = 0.02  # seconds
+MESSAGE_COUNT = 20
+
+
+class SmtpStandInServer(ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self) -> None:
+        super().__init__(('127.0.0.1', 0), SmtpStandInHandler)
+        self.connection_count = 0
+        self.message_count = 0
+        self.down = False
+
+
+class SmtpStandInHandler(StreamRequestHandler):
+    """Understand just enough SMTP to accept messages."""
+
+    server: SmtpStandInServer
+
+    def handle(self) -> None:
+        if self.server.down:
+            return
+
+        self.server.connection_count += 1
+
+        time.sleep(CONNECT_DELAY)
+        self._reply('220 localhost')
+
+        while line := self.rfile.readline():
+            command = line.decode('ascii').strip().upper()
+
+            if command.startswith(('EHLO', 'HELO')):
+                self._reply('250 localhost')
+            elif command.startswith('RCPT') and 'INVALID' in command:
+                self._reply('550 no such user')
+            elif command.startswith('RCPT') and 'GOES-DOWN' in command:
+                self.server.down = True
+                return
+            elif command == 'DATA':
+                self._reply('354 go ahead')
+                while self.rfile.readline() not in (b'.\r\n', b''):
+                    pass
+                self.server.message_count += 1
+                self._reply('250 OK')
+            elif command == 'QUIT':
+                self._reply('221 bye')
+                return
+            else:
+                self._reply('250 OK')
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(line.encode('ascii') + b'\r\n')
+
+
+@pytest.fixture()
+def smtp_server() -> Iterator[SmtpStandInServer]:
+    server = SmtpStandInServer()
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture()
+def smtp_config(smtp_server) -> SmtpConfig:
+    host, port = smtp_server.server_address
+
+    return SmtpConfig(
+        host=host,
+        port=port,
+        starttls=False,
+        use_ssl=False,
+        username=None,
+        password=None,
+        suppress_send=False,
+    )
+
+
+def test_reused_connection_is_faster(smtp_server, smtp_config):
+    messages = [build_message(i) for i in range(MESSAGE_COUNT)]
+
+    start = time.perf_counter()
+    for message in messages:
+        # A new connection per message, as done without reuse
+        manager = SmtpConnectionManager()
+        manager.send_messages(smtp_config, [message])
+        manager.close()
+    duration_without_reuse = time.perf_counter() - start
+
+    assert smtp_server.connection_count == MESSAGE_COUNT
+
+    smtp_server.connection_count = 0
+
+    start = time.perf_counter()
+    manager = SmtpConnectionManager()
+    manager.send_messages(smtp_config, messages)
+    manager.close()
+    duration_with_reuse = time.perf_counter() - start
+
+    assert smtp_server.connection_count == 1
+    assert smtp_server.message_count == 2 * MESSAGE_COUNT
+    assert duration_with_reuse < duration_without_reuse / 2
+
+
+def test_connection_is_reopened_after_idle_timeout(smtp_server, smtp_config):
+    now = 0.0
+    manager = SmtpConnectionManager(
+        idle_timeout=timedelta(seconds=30), clock=lambda: now
+    )
+
+    manager.send_messages(smtp_config, [build_message(1)])
+    now = 29.0
+    manager.send_messages(smtp_config, [build_message(2)])
+    assert smtp_server.connection_count == 1
+
+    now = 60.0
+    manager.send_messages(smtp_config, [build_message(3)])
+    assert smtp_server.connection_count == 2
+
+    manager.close()
+
+
+def test_connection_is_reopened_after_server_disconnect(
+    smtp_server, smtp_config
+):
+    manager = SmtpConnectionManager()
+
+    manager.send_messages(smtp_config, [build_message(1)])
+
+    # Simulate the connection having been closed.
+    manager._smtp.sock.shutdown(socket.SHUT_RDWR)
+
+    manager.send_messages(smtp_config, [build_message(2)])
+
+    assert smtp_server.connection_count == 2
+    assert smtp_server.message_count == 2
+
+    manager.close()
+
+
+def test_rejected_message_does_not_keep_others_from_being_sent(
+    smtp_server, smtp_config
+):
+    messages = [
+        build_message(1),
+        build_message(2, recipient='invalid@users.test'),
+        build_message(3),
+    ]
+
+    manager = SmtpConnectionManager()
+    failures = manager.send_messages(smtp_config, messages)
+    manager.close()
+
+    assert len(failures.rejected) == 1
+    rejected_message, exc = failures.rejected[0]
+    assert rejected_message is messages[1]
+    assert isinstance(exc, SMTPRecipientsRefused)
+    assert failures.unsent == []
+
+    assert smtp_server.connection_count == 1
+    assert smtp_server.message_count == 2
+
+
+def test_messages_fail_if_server_is_unreachable(smtp_config):
+    # Get a port that nothing listens on.
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        _, unused_port = sock.getsockname()
+
+    config = dataclasses.replace(smtp_config, port=unused_port)
+    messages = [build_message(i) for i in range(3)]
+
+    manager = SmtpConnectionManager()
+    failures = manager.send_messages(config, messages)
+
+    assert failures.rejected == []
+    assert failures.unsent == messages
+    assert isinstance(failures.connection_error, ConnectionRefusedError)
+
+
+def test_remaining_messages_are_unsent_if_server_goes_down(
+    smtp_server, smtp_config
+):
+    messages = [
+        build_message(1),
+        build_message(2, recipient='goes-down@users.test'),
+        build_message(3),
+    ]
+
+    manager = SmtpConnectionManager()
+    failures = manager.send_messages(smtp_config, messages)
+
+    assert smtp_server.message_count == 1
+    assert failures.rejected == []
+    assert failures.unsent == messages[1:]
+    assert failures.connection_error is not None
+
+
+def build_message(
+    number: int, *, recipient: str = 'user@users.test'
+) -> EmailMessage:
+    message = EmailMessage()
+    message['From'] = 'noreply@acmecon.test'
+    message['To'] = recipient
+    message['Subject'] = f'Message {number}'
+    message.set_content('Hello!')
+    return message
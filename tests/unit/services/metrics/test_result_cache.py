@@ -0,0 +1,36 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from byceps.services.metrics import metrics_service
+from byceps.services.metrics.models import Metric
+
+
+@patch('byceps.services.metrics.metrics_service.collect_metrics')
+def test_metrics_are_collected_once_within_ttl(collect_metrics_mock):
+    collect_metrics_mock.side_effect = lambda: iter([Metric('answer', 42)])
+
+    cache = metrics_service._ResultCache()
+    ttl = timedelta(minutes=1)
+
+    assert cache.get(ttl) == [Metric('answer', 42)]
+    assert cache.get(ttl) == [Metric('answer', 42)]
+
+    assert collect_metrics_mock.call_count == 1
+
+
+@patch('byceps.services.metrics.metrics_service.collect_metrics')
+def test_metrics_are_collected_every_time_without_ttl(collect_metrics_mock):
+    collect_metrics_mock.side_effect = lambda: iter([Metric('answer', 42)])
+
+    cache = metrics_service._ResultCache()
+    ttl = timedelta(0)
+
+    cache.get(ttl)
+    cache.get(ttl)
+
+    assert collect_metrics_mock.call_count == 2
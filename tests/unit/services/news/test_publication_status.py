@@ -14,6 +14,7 @@ from byceps.services.news.models import (
     NewsChannelID,
     NewsItem,
     NewsItemID,
+    NewsItemVersionID,
     PublicationStatus,
     PublicationStatusDraft,
     PublicationStatusPublished,
@@ -87,6 +88,7 @@ def make_item(channel: NewsChannel):
             published_at=published_at,
             published=(published_at is not None)
             and (published_at >= datetime.utcnow()),
+            version_id=NewsItemVersionID(generate_uuid()),
             title=token,
             body=token,
             body_format=BodyFormat.markdown,
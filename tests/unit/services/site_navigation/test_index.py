@@ -0,0 +1,105 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from byceps.services.site.models import SiteID
+from byceps.services.site_navigation.models import (
+    NavItem,
+    NavItemID,
+    NavItemTargetType,
+    NavMenu,
+    NavMenuID,
+)
+from byceps.services.site_navigation.site_navigation_service import (
+    _index_menus_and_items,
+)
+
+from tests.helpers import generate_uuid
+
+
+SITE_ID = SiteID('acmecon-2014-website')
+
+
+def test_items_are_indexed_by_menu_in_order():
+    main_menu = create_menu('main', 'en')
+    empty_menu = create_menu('empty', 'en')
+    item2 = create_item(main_menu.id, 2, NavItemTargetType.url, 'https://x')
+    item1 = create_item(main_menu.id, 1, NavItemTargetType.page, 'info')
+
+    index = _index_menus_and_items(
+        SITE_ID, [main_menu, empty_menu], [item2, item1]
+    )
+
+    assert index.menu_ids_by_name_and_language_code == {
+        ('main', 'en'): main_menu.id,
+        ('empty', 'en'): empty_menu.id,
+    }
+    assert index.items_by_menu_id == {
+        main_menu.id: [item1, item2],
+        empty_menu.id: [],
+    }
+
+
+def test_submenus_are_indexed_by_page_and_view():
+    main_menu = create_menu('main', 'en')
+    submenu_b = create_menu('b', 'en', parent_menu_id=main_menu.id)
+    submenu_a = create_menu('a', 'en', parent_menu_id=main_menu.id)
+    submenu_de = create_menu('a', 'de', parent_menu_id=main_menu.id)
+
+    items = [
+        # Pages and views referenced from the main menu do not count.
+        create_item(main_menu.id, 1, NavItemTargetType.page, 'rules'),
+        create_item(submenu_b.id, 1, NavItemTargetType.page, 'info'),
+        create_item(submenu_b.id, 2, NavItemTargetType.view, 'news'),
+        create_item(submenu_a.id, 1, NavItemTargetType.page, 'info'),
+        create_item(submenu_de.id, 1, NavItemTargetType.page, 'info'),
+        create_item(submenu_a.id, 2, NavItemTargetType.url, 'news'),
+    ]
+
+    index = _index_menus_and_items(
+        SITE_ID, [main_menu, submenu_b, submenu_a, submenu_de], items
+    )
+
+    # The submenu whose name comes first wins.
+    assert index.submenu_ids_by_language_code_and_page_name == {
+        ('en', 'info'): submenu_a.id,
+        ('de', 'info'): submenu_de.id,
+    }
+    assert index.submenu_ids_by_language_code_and_view_name == {
+        ('en', 'news'): submenu_b.id,
+    }
+
+
+# helpers
+
+
+def create_menu(
+    name: str, language_code: str, *, parent_menu_id: NavMenuID | None = None
+) -> NavMenu:
+    return NavMenu(
+        id=NavMenuID(generate_uuid()),
+        site_id=SITE_ID,
+        name=name,
+        language_code=language_code,
+        hidden=False,
+        parent_menu_id=parent_menu_id,
+    )
+
+
+def create_item(
+    menu_id: NavMenuID,
+    position: int,
+    target_type: NavItemTargetType,
+    target: str,
+) -> NavItem:
+    return NavItem(
+        id=NavItemID(generate_uuid()),
+        menu_id=menu_id,
+        position=position,
+        target_type=target_type,
+        target=target,
+        label=target,
+        current_page_id=target,
+        hidden=False,
+    )
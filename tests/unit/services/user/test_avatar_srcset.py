@@ -0,0 +1,32 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.services.user.user_avatar_service import get_avatar_srcset
+
+
+AVATAR_ID = '01916a4b-2e5f-7a3c-9a4e-2f1d6c8b0e7a'
+
+
+@pytest.mark.parametrize(
+    ('avatar_url', 'expected'),
+    [
+        (None, None),
+        # without variants
+        (f'/data/global/users/avatars/{AVATAR_ID}.png', None),
+        # with variants
+        (
+            f'/data/global/users/avatars/{AVATAR_ID}/512.png',
+            (
+                f'/data/global/users/avatars/{AVATAR_ID}/64.webp 64w, '
+                f'/data/global/users/avatars/{AVATAR_ID}/128.webp 128w, '
+                f'/data/global/users/avatars/{AVATAR_ID}/512.webp 512w'
+            ),
+        ),
+    ],
+)
+def test_get_avatar_srcset(avatar_url, expected):
+    assert get_avatar_srcset(avatar_url) == expected
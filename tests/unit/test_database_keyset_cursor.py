@@ -0,0 +1,39 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+
+from byceps.database import _decode_cursor, _encode_cursor
+
+
+def test_cursor_roundtrip():
+    values = [
+        datetime(2024, 3, 1, 12, 34, 56, 789000),
+        UUID('0b2b1a43-3b6a-4d04-9a5c-2b0e1c8b7f1e'),
+        'AC-14-B00017',
+        23,
+    ]
+
+    cursor = _encode_cursor(values)
+
+    assert _decode_cursor(cursor, 4) == values
+
+
+@pytest.mark.parametrize(
+    'cursor',
+    [
+        'not base64!',
+        'bm90IGpzb24',  # "not json"
+        'eyJhIjogMX0=',  # an object instead of a list
+        'W3siZm9vIjogMX1d',  # an unknown value type
+        'WyJ4Il0=',  # too few values
+        'WyJ4IiwgInkiLCAieiJd',  # too many values
+    ],
+)
+def test_decode_invalid_cursor(cursor):
+    assert _decode_cursor(cursor, 2) is None
@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pytest
 
-from byceps.util.image import read_dimensions
+from byceps.util.image import create_thumbnails, read_dimensions
 from byceps.util.image.models import Dimensions, ImageType
 from byceps.util.image.typeguess import guess_type
 
@@ -53,6 +53,29 @@ def test_read_dimensions(filename_suffix, expected_width, expected_height):
     assert actual == expected
 
 
+def test_create_thumbnails():
+    with open_image_with_suffix('png') as f:
+        thumbnails = list(
+            create_thumbnails(
+                f,
+                ['png', 'webp'],
+                [Dimensions(4, 4), Dimensions(16, 16)],
+                force_square=True,
+            )
+        )
+
+    assert [
+        (dimensions, image_type_name, read_dimensions(stream))
+        for dimensions, image_type_name, stream in thumbnails
+    ] == [
+        # Not scaled up
+        (Dimensions(16, 16), 'png', Dimensions(8, 8)),
+        (Dimensions(16, 16), 'webp', Dimensions(8, 8)),
+        (Dimensions(4, 4), 'png', Dimensions(4, 4)),
+        (Dimensions(4, 4), 'webp', Dimensions(4, 4)),
+    ]
+
+
 def open_image_with_suffix(suffix):
     filename = Path('image').with_suffix('.' + suffix)
     return open_image(filename)
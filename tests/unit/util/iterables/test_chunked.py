@@ -0,0 +1,27 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+import pytest
+
+from byceps.util.iterables import chunked
+
+
+@pytest.mark.parametrize(
+    ('iterable', 'size', 'expected'),
+    [
+        ([], 3, []),
+        ([1, 2, 3], 3, [[1, 2, 3]]),
+        ([1, 2, 3, 4, 5], 2, [[1, 2], [3, 4], [5]]),
+        (iter(range(4)), 3, [[0, 1, 2], [3]]),
+    ],
+)
+def test_chunked(iterable, size, expected):
+    actual = list(chunked(iterable, size))
+    assert actual == expected
+
+
+def test_chunked_with_invalid_size():
+    with pytest.raises(ValueError):
+        list(chunked([1, 2], 0))
@@ -0,0 +1,118 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from byceps.util.cache import LocalCache, VersionedLocalCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_and_set():
+    cache = LocalCache('test-get-and-set')
+
+    assert cache.get('key') is None
+
+    cache.set('key', 'value')
+
+    assert cache.get('key') == 'value'
+
+    stats = cache.get_stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.size == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LocalCache('test-eviction', maxsize=2)
+
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')  # Mark as recently used.
+    cache.set('c', 3)
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+
+def test_entries_expire():
+    clock = FakeClock()
+    cache = LocalCache('test-expiry', ttl=timedelta(seconds=10), clock=clock)
+
+    cache.set('key', 'value')
+
+    clock.now = 9.0
+    assert cache.get('key') == 'value'
+
+    clock.now = 10.0
+    assert cache.get('key') is None
+    assert len(cache) == 0
+
+
+def test_get_or_set():
+    cache = LocalCache('test-get-or-set')
+    calls = []
+
+    def create_value():
+        calls.append(1)
+        return 'value'
+
+    assert cache.get_or_set('key', create_value) == 'value'
+    assert cache.get_or_set('key', create_value) == 'value'
+    assert len(calls) == 1
+
+
+@patch('byceps.util.cache.fetch_version_and_add_to_shared_stats')
+def test_versioned_cache_is_cleared_on_version_change(fetch_version):
+    clock = FakeClock()
+    cache = VersionedLocalCache(
+        'test-versioned',
+        'test',
+        version_check_interval=timedelta(seconds=1),
+        clock=clock,
+    )
+
+    fetch_version.return_value = 1
+    cache.set('key', 'value')
+    assert cache.get('key') == 'value'
+
+    # Version is not checked again within the interval.
+    fetch_version.return_value = 2
+    clock.now = 0.5
+    assert cache.get('key') == 'value'
+
+    clock.now = 1.0
+    assert cache.get('key') is None
+
+    assert fetch_version.call_count == 2
+
+
+@patch('byceps.util.cache.fetch_version_and_add_to_shared_stats')
+def test_versioned_cache_publishes_stats_deltas(fetch_version):
+    clock = FakeClock()
+    cache = VersionedLocalCache(
+        'test-versioned-stats',
+        'test',
+        version_check_interval=timedelta(seconds=1),
+        clock=clock,
+    )
+
+    fetch_version.return_value = 1
+    cache.get('key')  # miss, counted with the next check
+    cache.set('key', 'value')
+    cache.get('key')  # hit
+
+    clock.now = 1.0
+    cache.get('key')  # hit, counted with the next check
+
+    fetch_version.assert_called_with('test', 'test-versioned-stats', 1, 1)
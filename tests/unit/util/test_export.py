@@ -3,7 +3,11 @@
 :License: Revised BSD (see `LICENSE` file for details)
 """
 
-from byceps.util.export import serialize_dicts_to_csv, serialize_tuples_to_csv
+from byceps.util.export import (
+    join_in_chunks,
+    serialize_dicts_to_csv,
+    serialize_tuples_to_csv,
+)
 
 
 def test_serialize_dicts_to_csv():
@@ -40,3 +44,30 @@ def test_serialize_tuples_to_csv():
         'Pac-Man,yellow\r\n',
         'Ultraman,white/red\r\n',
     ]
+
+
+def test_serialize_tuples_to_csv_consumes_rows_lazily():
+    consumed = []
+
+    def generate_rows():
+        for number in range(3):
+            consumed.append(number)
+            yield (str(number), 'quoted "value"')
+
+    actual = serialize_tuples_to_csv(generate_rows())
+
+    assert next(actual) == '0,"quoted ""value"""\r\n'
+    assert consumed == [0]
+
+    assert list(actual) == [
+        '1,"quoted ""value"""\r\n',
+        '2,"quoted ""value"""\r\n',
+    ]
+
+
+def test_join_in_chunks():
+    strings = ['abc', 'de', 'fghi', 'j', 'kl']
+
+    actual = join_in_chunks(strings, chunk_size=5)
+
+    assert list(actual) == ['abcde', 'fghij', 'kl']
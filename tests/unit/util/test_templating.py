@@ -0,0 +1,65 @@
+"""
+:Copyright: 2014-2024 Jochen Kupperschmidt
+:License: Revised BSD (see `LICENSE` file for details)
+"""
+
+from jinja2.exceptions import SecurityError
+import pytest
+
+from byceps.util.templating import load_template
+
+
+def greet(name: str) -> str:
+    return f'Hello, {name}!'
+
+
+def shout(name: str) -> str:
+    return f'HELLO, {name.upper()}!'
+
+
+def test_compiled_template_is_reused():
+    source = '{{ 6 * 7 }} (reused)'
+
+    template1 = load_template(source)
+    template2 = load_template(source)
+
+    assert template1 is template2
+    assert template1.render() == '42 (reused)'
+
+
+def test_templates_are_cached_per_globals():
+    source = "{{ greet('Alice') }}"
+
+    template_greet = load_template(source, template_globals={'greet': greet})
+    template_shout = load_template(source, template_globals={'greet': shout})
+
+    assert template_greet.render() == 'Hello, Alice!'
+    assert template_shout.render() == 'HELLO, ALICE!'
+
+
+def test_environment_is_shared_for_same_globals():
+    template_globals = {'greet': greet}
+
+    template1 = load_template('{{ 1 }}', template_globals=template_globals)
+    template2 = load_template('{{ 2 }}', template_globals=template_globals)
+
+    assert template1.environment is template2.environment
+
+
+def test_unhashable_globals_are_supported():
+    template_globals = {'names': ['Alice', 'Bob']}
+
+    template = load_template(
+        "{{ names|join(', ') }}", template_globals=template_globals
+    )
+
+    assert template.render() == 'Alice, Bob'
+
+
+def test_cached_template_stays_sandboxed():
+    source = '{% set items = [] %}{{ items.append(1) }}'
+
+    load_template(source)  # Warm up the cache.
+
+    with pytest.raises(SecurityError):
+        load_template(source).render()
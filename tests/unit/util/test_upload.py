@@ -7,7 +7,7 @@ from io import BytesIO
 
 import pytest
 
-from byceps.util.upload import delete, store
+from byceps.util.upload import delete, store, store_atomically
 
 
 SOURCE_BYTES = BytesIO(b'\x04\x08\x15\x16\x23\x42')
@@ -47,6 +47,29 @@ def test_store_with_nonexistent_parent_path2(tmp_path):
 # -------------------------------------------------------------------- #
 
 
+def test_store_atomically_replaces_existent_file(tmp_path):
+    target_path = tmp_path / 'famous-words.txt'
+    target_path.write_bytes(b'old')
+
+    store_atomically(BytesIO(b'new'), target_path)
+
+    assert target_path.read_bytes() == b'new'
+    assert list(tmp_path.iterdir()) == [target_path]
+
+
+def test_store_atomically_with_nonexistent_parent_path(tmp_path):
+    target_path = tmp_path / 'nonexistent' / 'famous-words.txt'
+
+    store_atomically(
+        BytesIO(b'new'), target_path, create_parent_path_if_nonexistent=True
+    )
+
+    assert target_path.read_bytes() == b'new'
+
+
+# -------------------------------------------------------------------- #
+
+
 def test_delete_with_existent_path(tmp_path):
     path = tmp_path / 'to-be-removed.png'
     path.touch(exist_ok=False)